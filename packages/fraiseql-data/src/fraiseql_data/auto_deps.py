@@ -10,8 +10,10 @@ Example:
 """
 
 import logging
+from graphlib import CycleError, TopologicalSorter
 from typing import Any
 
+from fraiseql_data.exceptions import CircularDependencyError
 from fraiseql_data.models import SeedPlan
 
 logger = logging.getLogger(__name__)
@@ -37,14 +39,17 @@ class AutoDependencyResolver:
         """Initialize resolver with introspector and seed common."""
         self.introspector = introspector
         self.seed_common = seed_common
+        # Dependency trees by table, valid for one introspector cache_version
+        self._tree_cache: dict[str, tuple[str, ...]] = {}
+        self._tree_cache_version: int | None = None
 
     def build_dependency_tree(self, table: str) -> list[str]:
         """
         Build dependency tree for a table (recursive FK traversal).
 
-        Uses depth-first search with DAG-based deduplication to build a
-        topologically-sorted list of dependencies. When multiple FK paths
-        lead to the same table, it appears only once in the result.
+        Walks the FKs reachable from ``table`` once and sorts them with
+        ``graphlib.TopologicalSorter``. When multiple FK paths lead to the
+        same table, it appears only once in the result.
 
         Args:
             table: Table name to build dependency tree for
@@ -53,6 +58,9 @@ class AutoDependencyResolver:
             List of table names in topological order (root → leaf),
             excluding the target table itself. Deduplicated.
 
+        Raises:
+            CircularDependencyError: If the FKs reachable from ``table`` form a cycle
+
         Example:
             >>> # Schema: allocation → machine → location → organization
             >>> resolver.build_dependency_tree("tb_allocation")
@@ -63,30 +71,42 @@ class AutoDependencyResolver:
             >>> resolver.build_dependency_tree("tb_allocation")
             >>> # Returns: ["tb_organization", "tb_machine", "tb_contract"]
             >>> # (organization appears once despite multiple paths)
-        """
-        visited = set()
-        dependency_list = []
-
-        def visit(current_table: str):
-            if current_table in visited:
-                return
-            visited.add(current_table)
 
-            # Get table info and foreign keys
-            table_info = self.introspector.get_table_info(current_table)
-            fks = table_info.foreign_keys
-
-            # Visit dependencies first (depth-first)
-            for fk in fks:
-                # Skip self-referencing FKs
-                if fk.referenced_table != current_table:
-                    visit(fk.referenced_table)
-
-            # Add current table after dependencies (post-order)
-            if current_table != table:  # Don't include target table
-                dependency_list.append(current_table)
-
-        visit(table)
+        Trees are memoized per table until the introspector's ``cache_version``
+        changes (its metadata was cleared or replaced).
+        """
+        version = self.introspector.cache_version
+        if version != self._tree_cache_version:
+            self._tree_cache.clear()
+            self._tree_cache_version = version
+        cached = self._tree_cache.get(table)
+        if cached is not None:
+            return list(cached)
+
+        # Collect the tables reachable through FKs, fetching each table's
+        # metadata once, then order them with Kahn's algorithm (graphlib)
+        sorter: TopologicalSorter[str] = TopologicalSorter()
+        seen = {table}
+        pending = [table]
+        while pending:
+            current_table = pending.pop()
+            # Skip self-referencing FKs; dict keeps FK order so output is stable
+            parents = dict.fromkeys(
+                fk.referenced_table
+                for fk in self.introspector.get_table_info(current_table).foreign_keys
+                if fk.referenced_table != current_table
+            )
+            sorter.add(current_table, *parents)
+            pending.extend(parent for parent in parents if parent not in seen)
+            seen.update(parents)
+
+        try:
+            # Dependencies come before dependents; each table appears once
+            dependency_list = [t for t in sorter.static_order() if t != table]
+        except CycleError as e:
+            raise CircularDependencyError(set(e.args[1])) from e
+
+        self._tree_cache[table] = tuple(dependency_list)
         return dependency_list
 
     def resolve_dependencies(
@@ -4,7 +4,7 @@ import json
 from dataclasses import dataclass
 from typing import Any
 
-from psycopg import Connection, sql
+from psycopg import Connection, Copy, sql
 from psycopg.types.json import Json, Jsonb
 
 from fraiseql_data.models import TableInfo
@@ -14,6 +14,9 @@ from fraiseql_data.models import TableInfo
 # than INSERT ... RETURNING for small batches.
 COPY_THRESHOLD = 50
 
+# Column types whose values _adapt_value_copy may change; others pass through
+_COPY_ADAPTED_TYPES = frozenset({"json", "jsonb", "integer", "bigint", "smallint"})
+
 
 @dataclass(frozen=True, slots=True)
 class _InsertContext:
@@ -72,6 +75,26 @@ class DirectBackend:
             return int(value)
         return value
 
+    @classmethod
+    def _write_copy_rows(cls, copy: Copy, ctx: _InsertContext, rows: list[dict[str, Any]]) -> None:
+        """Write rows to a COPY stream, adapting only columns that need it.
+
+        Most columns (text, uuid ids, timestamps) go to COPY as-is; only
+        JSON and integer columns need per-value adaptation, so the type
+        lookup happens once per column rather than once per value.
+        """
+        columns = ctx.insert_columns
+        adapted = [
+            (idx, ctx.col_types.get(col, ""))
+            for idx, col in enumerate(columns)
+            if ctx.col_types.get(col, "") in _COPY_ADAPTED_TYPES
+        ]
+        for row in rows:
+            values = [row.get(col) for col in columns]
+            for idx, pg_type in adapted:
+                values[idx] = cls._adapt_value_copy(values[idx], pg_type)
+            copy.write_row(values)
+
     # ------------------------------------------------------------------
     # Shared helpers
     # ------------------------------------------------------------------
@@ -110,10 +133,36 @@ class DirectBackend:
         result_rows: list[tuple[Any, ...]], table_info: TableInfo
     ) -> list[dict[str, Any]]:
         """Convert raw cursor tuples to column-keyed dicts."""
-        return [
-            {col.name: result[idx] for idx, col in enumerate(table_info.columns)}
-            for result in result_rows
-        ]
+        names = [col.name for col in table_info.columns]
+        return [dict(zip(names, result, strict=True)) for result in result_rows]
+
+    @staticmethod
+    def _copy_key_column(
+        table_info: TableInfo, ctx: _InsertContext, rows: list[dict[str, Any]]
+    ) -> str | None:
+        """Find a column that alone identifies each copied row, if any.
+
+        The column must be unique on its own (a single-column PK or UNIQUE,
+        not part of a multi-column constraint), have a catalog type that can
+        be cast to an array, and be set in every row.
+        """
+        multi_unique = {
+            col for constraint in table_info.multi_unique_constraints for col in constraint.columns
+        }
+        pk_columns = [col.name for col in table_info.columns if col.is_primary_key]
+        for col in table_info.columns:
+            single_unique = (col.is_unique and col.name not in multi_unique) or (
+                pk_columns == [col.name]
+            )
+            if (
+                single_unique
+                and col.name in ctx.insert_columns
+                and col.pg_type not in ("USER-DEFINED", "json", "jsonb")
+                and not col.pg_type.endswith("]")
+                and all(row.get(col.name) is not None for row in rows)
+            ):
+                return col.name
+        return None
 
     # ------------------------------------------------------------------
     # Public API
@@ -155,6 +204,7 @@ class DirectBackend:
             (col.name for col in table_info.columns if col.is_identity),
             None,
         )
+        key_col = self._copy_key_column(table_info, ctx, rows)
 
         with self.conn.cursor() as cur:
             # For OVERRIDING SYSTEM VALUE we need to use a writable CTE
@@ -167,7 +217,7 @@ class DirectBackend:
                 temp_col_defs = sql.SQL(", ").join(
                     sql.SQL("{} {}").format(
                         sql.Identifier(col),
-                        sql.SQL(next(c.pg_type for c in table_info.columns if c.name == col)),
+                        sql.SQL(ctx.col_types[col]),
                     )
                     for col in ctx.insert_columns
                 )
@@ -182,13 +232,7 @@ class DirectBackend:
                     sql.Identifier("_seed_copy_buf"), ctx.columns_sql
                 )
                 with cur.copy(copy_stmt) as copy:
-                    for row in rows:
-                        copy.write_row(
-                            [
-                                self._adapt_value_copy(row.get(col), ctx.col_types.get(col, ""))
-                                for col in ctx.insert_columns
-                            ]
-                        )
+                    self._write_copy_rows(copy, ctx, rows)
 
                 # INSERT from temp into real table with OVERRIDING SYSTEM VALUE
                 cur.execute(
@@ -203,6 +247,32 @@ class DirectBackend:
                     )
                 )
                 result_rows = cur.fetchall()
+            elif key_col is not None:
+                # COPY directly into target table
+                copy_stmt = sql.SQL("COPY {} ({}) FROM STDIN").format(
+                    ctx.qualified_table, ctx.columns_sql
+                )
+                with cur.copy(copy_stmt) as copy:
+                    self._write_copy_rows(copy, ctx, rows)
+
+                # SELECT back exactly the copied rows by their unique key (index
+                # lookup, unaffected by rows other sessions insert meanwhile)
+                order_sql = (
+                    sql.SQL(" ORDER BY {}").format(sql.Identifier(identity_col))
+                    if identity_col
+                    else sql.SQL("")
+                )
+                cur.execute(
+                    sql.SQL("SELECT {} FROM {} WHERE {} = ANY(%s::{}[]){}").format(
+                        ctx.all_columns_sql,
+                        ctx.qualified_table,
+                        sql.Identifier(key_col),
+                        sql.SQL(ctx.col_types[key_col]),
+                        order_sql,
+                    ),
+                    ([row[key_col] for row in rows],),
+                )
+                result_rows = cur.fetchall()
             else:
                 # Record the max identity value before insert (for SELECT back)
                 pre_max = None
@@ -222,13 +292,7 @@ class DirectBackend:
                     ctx.qualified_table, ctx.columns_sql
                 )
                 with cur.copy(copy_stmt) as copy:
-                    for row in rows:
-                        copy.write_row(
-                            [
-                                self._adapt_value_copy(row.get(col), ctx.col_types.get(col, ""))
-                                for col in ctx.insert_columns
-                            ]
-                        )
+                    self._write_copy_rows(copy, ctx, rows)
 
                 # SELECT back inserted rows (using identity column range)
                 if identity_col and pre_max is not None:
@@ -300,7 +364,7 @@ class DirectBackend:
     def _insert_rows_single(
         self, table_info: TableInfo, rows: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Insert rows one-by-one with INSERT ... RETURNING."""
+        """Insert rows with a single-row INSERT ... RETURNING per row."""
         if not rows:
             return []
 
@@ -315,18 +379,26 @@ class DirectBackend:
             ctx.all_columns_sql,
         )
 
-        inserted_rows = []
+        params_seq = [
+            [
+                self._adapt_value(row.get(col), ctx.col_types.get(col, ""))
+                for col in ctx.insert_columns
+            ]
+            for row in rows
+        ]
+
+        # executemany pipelines the statements (one round-trip for the batch)
+        # while still returning one RETURNING result set per row.
+        result_rows: list[tuple[Any, ...]] = []
         with self.conn.cursor() as cur:
-            for row in rows:
-                values = [
-                    self._adapt_value(row.get(col), ctx.col_types.get(col, ""))
-                    for col in ctx.insert_columns
-                ]
-                cur.execute(insert_stmt, values)
+            cur.executemany(insert_stmt, params_seq, returning=True)
+            while True:
                 result = cur.fetchone()
                 assert result is not None
-                complete_row = {col.name: result[i] for i, col in enumerate(table_info.columns)}
-                inserted_rows.append(complete_row)
+                result_rows.append(result)
+                if not cur.nextset():
+                    break
 
+        inserted_rows = self._rows_to_dicts(result_rows, table_info)
         self.conn.commit()
         return inserted_rows
@@ -2,14 +2,16 @@
 
 import inspect
 import logging
+import random
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fraiseql_uuid import Pattern
 from psycopg import Connection
 
 # Note: Backend and introspector imports moved to __init__ for lazy loading
 from fraiseql_data.auto_deps import AutoDependencyResolver
+from fraiseql_data.constraint_parser import CheckConstraintParser
 from fraiseql_data.exceptions import (
     ColumnGenerationError,
     ForeignKeyResolutionError,
@@ -19,7 +21,11 @@ from fraiseql_data.exceptions import (
 )
 from fraiseql_data.generators import FakerGenerator, TrinityGenerator
 from fraiseql_data.generators.groups import GroupRegistry
-from fraiseql_data.models import SeedPlan, Seeds, TableInfo
+from fraiseql_data.generators.registry import get_generator
+from fraiseql_data.models import ForeignKeyInfo, SeedPlan, Seeds, TableInfo
+
+if TYPE_CHECKING:
+    from fraiseql_data.introspection import SchemaIntrospector
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +36,11 @@ MAX_UNIQUE_RETRIES = 10  # Maximum attempts to generate unique value
 
 
 class BatchContext:
-    """Context manager for batch seed operations with fluent API."""
+    """Context manager for batch seed operations with fluent API.
+
+    After execution (explicit or on context exit) the generated data is
+    available as ``seeds``.
+    """
 
     def __init__(self, builder: "SeedBuilder"):
         """
@@ -41,6 +51,8 @@ class BatchContext:
         """
         self.builder = builder
         self._operations: list[SeedPlan] = []
+        # Result of execute(); None until the batch has run
+        self.seeds: Seeds | None = None
 
     def add(
         self,
@@ -117,7 +129,8 @@ class BatchContext:
             self.builder._plan.append(operation)
 
         # Execute builder
-        return self.builder.execute()
+        self.seeds = self.builder.execute()
+        return self.seeds
 
     def __enter__(self) -> "BatchContext":
         """Enter context manager."""
@@ -204,6 +217,7 @@ class SeedBuilder:
         validate_seed_common: bool = True,
         trinity_enabled: bool = False,
         trinity_tenant_id: Any = None,
+        introspector: "SchemaIntrospector | None" = None,
     ):
         """
         Initialize SeedBuilder.
@@ -222,9 +236,14 @@ class SeedBuilder:
                 PK allocation (default: False)
             trinity_tenant_id: Tenant ID for multi-tenant Trinity
                 allocation (optional)
+            introspector: Existing SchemaIntrospector for ``schema`` to reuse
+                (direct backend only). Builders sharing one skip the schema
+                check and catalog queries; call its ``invalidate(table)`` (or
+                ``clear_cache()``) after DDL.
 
         Raises:
             SchemaNotFoundError: If schema doesn't exist (direct backend only)
+            ValueError: If ``introspector`` belongs to a different schema
 
         Example:
             >>> # With seed common (recommended)
@@ -267,7 +286,15 @@ class SeedBuilder:
             from fraiseql_data.introspection import SchemaIntrospector
 
             self.backend = DirectBackend(conn, schema)
-            self.introspector = SchemaIntrospector(conn, schema)
+            if introspector is None:
+                self.introspector = SchemaIntrospector(conn, schema)
+            elif introspector.schema != schema:
+                raise ValueError(
+                    f"Introspector is for schema '{introspector.schema}', "
+                    f"builder is for schema '{schema}'"
+                )
+            else:
+                self.introspector = introspector
 
         # Load seed common baseline
         from fraiseql_data.seed_common import SeedCommon, SeedCommonValidationError
@@ -438,26 +465,25 @@ class SeedBuilder:
                 # For self-referencing tables, insert one-by-one and track
                 # Start instance counter after seed common range
                 instance_start = self._seed_common.get_instance_start(plan.table)
+                # Generate all rows in one pass; self-referencing FKs come out
+                # NULL since no rows exist yet, and parents are picked below
+                # from the rows inserted so far
+                rows = self._generate_rows(
+                    table_info, plan, generated_data, [], instance_start=instance_start
+                )
+                self_ref_fks = [
+                    fk
+                    for fk in table_info.get_self_referencing_fks()
+                    if fk.column not in plan.overrides
+                ]
                 inserted_rows = []
-                for i in range(plan.count):
-                    instance = instance_start + i
-                    # Create single-row plan with correct instance number
-                    single_plan = SeedPlan(
-                        table=plan.table,
-                        count=1,
-                        strategy=plan.strategy,
-                        overrides=plan.overrides,
-                    )
-                    # Generate single row, passing instance number
-                    rows = self._generate_rows(
-                        table_info,
-                        single_plan,
-                        generated_data,
-                        inserted_rows,
-                        instance_start=instance,
-                    )
+                for row in rows:
+                    if inserted_rows:
+                        for fk in self_ref_fks:
+                            parent_row = random.choice(inserted_rows)
+                            row[fk.column] = parent_row[fk.referenced_column]
                     # Insert the single row (use bulk=False for single row)
-                    new_rows = self.backend.insert_rows(table_info, rows, bulk=False)
+                    new_rows = self.backend.insert_rows(table_info, [row], bulk=False)
                     inserted_rows.extend(new_rows)
             else:
                 # Regular table: generate all rows at once
@@ -525,10 +551,12 @@ class SeedBuilder:
             BatchContext for chaining operations
 
         Example:
-            >>> # Auto-execute on context exit
+            >>> # Auto-execute on context exit; results on batch.seeds
             >>> with builder.batch() as batch:
             >>>     batch.add("tb_manufacturer", count=10)
             >>>     batch.add("tb_product", count=100)
+            >>> len(batch.seeds.tb_product)
+            100
             >>>
             >>> # Conditional operations
             >>> with builder.batch() as batch:
@@ -605,8 +633,6 @@ class SeedBuilder:
             SelfReferenceError: If self-referencing FK is non-nullable
             UniqueConstraintError: If cannot generate unique value
         """
-        import random
-
         faker_gen = FakerGenerator()
 
         # Build Trinity context if enabled
@@ -624,11 +650,6 @@ class SeedBuilder:
         # Parse CHECK constraints and build rules
         check_rules: dict[str, Any] = {}
         if table_info.check_constraints:
-            import logging
-
-            from fraiseql_data.constraint_parser import CheckConstraintParser
-
-            logger = logging.getLogger("fraiseql_data.builder")
             parser = CheckConstraintParser()
 
             for constraint in table_info.check_constraints:
@@ -649,6 +670,11 @@ class SeedBuilder:
                         f"Consider providing overrides for affected columns."
                     )
 
+        # Resolve custom strategy once per table, not per column and row
+        generator_class = None
+        if plan.strategy != "faker":
+            generator_class = get_generator(plan.strategy)
+
         # Detect active groups
         column_names = {col.name for col in table_info.columns}
         if plan.groups is not None:
@@ -672,6 +698,14 @@ class SeedBuilder:
         if current_table_rows is None:
             current_table_rows = []
 
+        # FK per column (first wins, as before), and for regular FKs the
+        # referenced parent column extracted once so each row draws a value
+        # from a flat list instead of a row dict
+        fk_by_column: dict[str, ForeignKeyInfo] = {}
+        for fk in table_info.foreign_keys:
+            fk_by_column.setdefault(fk.column, fk)
+        parent_values: dict[str, list[Any]] = {}
+
         rows = []
         for counter, instance in enumerate(
             range(instance_start, instance_start + plan.count), start=1
@@ -772,9 +806,8 @@ class SeedBuilder:
                     continue
 
                 # Handle foreign keys
-                if any(fk.column == col.name for fk in table_info.foreign_keys):
-                    fk = next(fk for fk in table_info.foreign_keys if fk.column == col.name)
-
+                fk = fk_by_column.get(col.name)
+                if fk is not None:
                     # Handle self-referencing FK
                     if fk.is_self_referencing:
                         if not col.is_nullable:
@@ -791,12 +824,17 @@ class SeedBuilder:
                             row[col.name] = parent_row[fk.referenced_column]
                         continue
 
-                    # Regular FK: validate parent data exists
-                    if fk.referenced_table not in generated_data:
-                        raise ForeignKeyResolutionError(fk.column, fk.referenced_table)
+                    values = parent_values.get(col.name)
+                    if values is None:
+                        # Regular FK: validate parent data exists
+                        if fk.referenced_table not in generated_data:
+                            raise ForeignKeyResolutionError(fk.column, fk.referenced_table)
+                        values = parent_values[col.name] = [
+                            parent_row[fk.referenced_column]
+                            for parent_row in generated_data[fk.referenced_table]
+                        ]
                     # Pick random from generated parent data
-                    parent_row = random.choice(generated_data[fk.referenced_table])
-                    row[col.name] = parent_row[fk.referenced_column]
+                    row[col.name] = random.choice(values)
                     continue
 
                 # Check if column has auto-satisfiable CHECK constraint
@@ -809,10 +847,6 @@ class SeedBuilder:
                 if plan.strategy == "faker":
                     value = faker_gen.generate(col.name, col.pg_type)
                 else:
-                    # Try custom generator from registry
-                    from fraiseql_data.generators.registry import get_generator
-
-                    generator_class = get_generator(plan.strategy)
                     if generator_class is None:
                         raise ValueError(
                             f"Unknown strategy '{plan.strategy}'. "
@@ -854,12 +888,18 @@ class SeedBuilder:
                     raise ColumnGenerationError(col.name, col.pg_type, table_info.name)
                 row[col.name] = value
 
-            # Add Trinity columns if table follows pattern
-            if table_info.is_trinity:
-                trinity_data = trinity_gen.generate(instance, **row)
+            rows.append(row)
+
+        # Add Trinity columns if table follows pattern, one batch per table
+        if table_info.is_trinity:
+            names = [row.get("name") for row in rows] if "name" in column_names else None
+            for row, trinity_data in zip(
+                rows, trinity_gen.generate_batch(instance_start, plan.count, names), strict=True
+            ):
                 row.update(trinity_data)
 
-            # Validate multi-column UNIQUE constraints
+        # Validate multi-column UNIQUE constraints
+        for row in rows:
             for constraint in table_info.multi_unique_constraints:
                 # Extract tuple of values for this constraint
                 tuple_values = tuple(row.get(col) for col in constraint.columns)
@@ -878,6 +918,4 @@ class SeedBuilder:
                 # Track this tuple
                 multi_unique_tuples[constraint.constraint_name].add(tuple_values)
 
-            rows.append(row)
-
         return rows
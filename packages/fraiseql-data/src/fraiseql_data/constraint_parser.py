@@ -3,8 +3,24 @@
 import random
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+# Patterns are compiled once at import; clauses come from pg_get_constraintdef
+_NUMBER = r"-?\d+\.?\d*"
+_NUMERIC_TYPE = r"(?:integer|bigint|smallint|numeric|real|double precision)"
+# PostgreSQL deparses typed literals as (50)::numeric or '-5'::integer
+_NUMBER_CAST_RE = re.compile(
+    rf"\(\s*({_NUMBER})\s*\)::{_NUMERIC_TYPE}|'({_NUMBER})'::{_NUMERIC_TYPE}"
+)
+_ANY_ARRAY_RE = re.compile(r"\(?(\w+)\s*=\s*ANY\s*\(\s*ARRAY\[(.+?)\]\s*\)", re.IGNORECASE)
+_IN_RE = re.compile(r"(\w+)\s+IN\s+\((.+?)\)", re.IGNORECASE)
+_SINGLE_QUOTED_RE = re.compile(r"'([^']+)'")
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]+)"')
+_BETWEEN_RE = re.compile(rf"(\w+)\s+BETWEEN\s+({_NUMBER})\s+AND\s+({_NUMBER})", re.IGNORECASE)
+_RANGE_RE = re.compile(rf"(\w+)\s*(>|>=|<|<=)\s*({_NUMBER})")
+_AND_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+
 
 @dataclass
 class CheckConstraintRule:
@@ -48,14 +64,14 @@ class RangeConstraintRule(CheckConstraintRule):
             # Ensure positive values for common use cases
             if self.value > 1000:  # noqa: PLR2004
                 return random.uniform(1, self.value - 1)
-            else:
-                return max(0, self.value - random.uniform(1, 100))
+            value = self.value - random.uniform(1, 100)
+            return max(0, value) if self.value > 0 else value
         elif self.operator == "<=":
             # Generate value less than or equal to threshold
             if self.value > 1000:  # noqa: PLR2004
                 return random.uniform(1, self.value)
-            else:
-                return max(0, self.value - random.uniform(0, 100))
+            value = self.value - random.uniform(0, 100)
+            return max(0, value) if self.value > 0 else value
         else:
             raise ValueError(f"Unsupported operator: {self.operator}")
 
@@ -96,7 +112,8 @@ class CombinedRangeRule(CheckConstraintRule):
         elif self.max_value is not None:
             # Only upper bound
             max_val = self.max_value if self.max_inclusive else self.max_value - 1
-            return max(0, max_val - random.uniform(0, 100))
+            value = max_val - random.uniform(0, 100)
+            return max(0, value) if self.max_value > 0 else value
         else:
             # No bounds (shouldn't happen)
             return random.uniform(0, 100)
@@ -122,61 +139,64 @@ class CheckConstraintParser:
         """
         Parse CHECK clause into rule, or None if too complex.
 
+        Results are cached per normalized clause, so a table seeded again
+        (or sharing a constraint with another) is not re-parsed. The
+        returned rules are shared: treat them as read-only.
+
         Args:
             check_clause: CHECK constraint condition (e.g., "price > 0")
 
         Returns:
             CheckConstraintRule if parseable, None otherwise
         """
-        # Normalize: remove extra spaces, lowercase operators
+        # Normalize: collapse whitespace, drop casts on numeric literals
         check_clause = " ".join(check_clause.split())
+        check_clause = _NUMBER_CAST_RE.sub(lambda m: m.group(1) or m.group(2), check_clause)
+        return self._parse_normalized(check_clause)
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _parse_normalized(cls, check_clause: str) -> CheckConstraintRule | None:
+        """Try each supported form in turn (cached; see ``parse``)."""
         # Try to parse as enum (IN constraint)
-        enum_rule = self._parse_enum(check_clause)
+        enum_rule = cls._parse_enum(check_clause)
         if enum_rule:
             return enum_rule
 
         # Try to parse as BETWEEN
-        between_rule = self._parse_between(check_clause)
+        between_rule = cls._parse_between(check_clause)
         if between_rule:
             return between_rule
 
         # Try to parse as combined range (e.g., price > 0 AND price < 10000)
-        combined_rule = self._parse_combined_range(check_clause)
+        combined_rule = cls._parse_combined_range(check_clause)
         if combined_rule:
             return combined_rule
 
         # Try to parse as single range constraint
-        range_rule = self._parse_range(check_clause)
+        range_rule = cls._parse_range(check_clause)
         if range_rule:
             return range_rule
 
         # Too complex to parse
         return None
 
-    def _parse_enum(self, check_clause: str) -> EnumConstraintRule | None:
+    @staticmethod
+    def _parse_enum(check_clause: str) -> EnumConstraintRule | None:
         """Parse IN ('val1', 'val2', ...) constraint or PostgreSQL's ANY(ARRAY[...]) format."""
         # Try PostgreSQL's internal format: column = ANY (ARRAY['val1'::text, ...])
-        match = re.search(
-            r"\(?(\w+)\s*=\s*ANY\s*\(\s*ARRAY\[(.+?)\]\s*\)",
-            check_clause,
-            re.IGNORECASE,
-        )
+        match = _ANY_ARRAY_RE.search(check_clause)
         if match:
             column = match.group(1)
             values_str = match.group(2)
 
             # Extract quoted values (handle ::text casting)
-            values = re.findall(r"'([^']+)'", values_str)
+            values = _SINGLE_QUOTED_RE.findall(values_str)
             if values:
                 return EnumConstraintRule(column=column, values=values)
 
         # Try standard IN format: column IN ('val1', 'val2', ...)
-        match = re.search(
-            r"(\w+)\s+IN\s+\((.+?)\)",
-            check_clause,
-            re.IGNORECASE,
-        )
+        match = _IN_RE.search(check_clause)
         if not match:
             return None
 
@@ -184,24 +204,21 @@ class CheckConstraintParser:
         values_str = match.group(2)
 
         # Extract quoted values
-        values = re.findall(r"'([^']+)'", values_str)
+        values = _SINGLE_QUOTED_RE.findall(values_str)
         if not values:
             # Try double quotes
-            values = re.findall(r'"([^"]+)"', values_str)
+            values = _DOUBLE_QUOTED_RE.findall(values_str)
 
         if values:
             return EnumConstraintRule(column=column, values=values)
 
         return None
 
-    def _parse_between(self, check_clause: str) -> BetweenConstraintRule | None:
+    @staticmethod
+    def _parse_between(check_clause: str) -> BetweenConstraintRule | None:
         """Parse BETWEEN min AND max constraint."""
         # Pattern: column BETWEEN min AND max
-        match = re.search(
-            r"(\w+)\s+BETWEEN\s+(\d+\.?\d*)\s+AND\s+(\d+\.?\d*)",
-            check_clause,
-            re.IGNORECASE,
-        )
+        match = _BETWEEN_RE.search(check_clause)
         if not match:
             return None
 
@@ -211,13 +228,11 @@ class CheckConstraintParser:
 
         return BetweenConstraintRule(column=column, min_value=min_val, max_value=max_val)
 
-    def _parse_range(self, check_clause: str) -> RangeConstraintRule | None:
+    @staticmethod
+    def _parse_range(check_clause: str) -> RangeConstraintRule | None:
         """Parse single range constraint (>, >=, <, <=)."""
         # Match range comparisons like "col > 5" or "col >= 10"
-        match = re.search(
-            r"(\w+)\s*(>|>=|<|<=)\s*(\d+\.?\d*)",
-            check_clause,
-        )
+        match = _RANGE_RE.search(check_clause)
         if not match:
             return None
 
@@ -227,7 +242,8 @@ class CheckConstraintParser:
 
         return RangeConstraintRule(column=column, operator=operator, value=value)
 
-    def _parse_combined_range(self, check_clause: str) -> CombinedRangeRule | None:
+    @classmethod
+    def _parse_combined_range(cls, check_clause: str) -> CombinedRangeRule | None:
         """
         Parse combined range constraints (e.g., price > 0 AND price < 10000).
 
@@ -241,13 +257,13 @@ class CheckConstraintParser:
             return None
 
         # Split by AND (case-insensitive)
-        parts = re.split(r"\s+AND\s+", check_clause, flags=re.IGNORECASE)
+        parts = _AND_RE.split(check_clause)
         if len(parts) != 2:  # noqa: PLR2004
             return None
 
         # Parse each part as a range constraint
-        rule1 = self._parse_range(parts[0].strip("()"))
-        rule2 = self._parse_range(parts[1].strip("()"))
+        rule1 = cls._parse_range(parts[0].strip("()"))
+        rule2 = cls._parse_range(parts[1].strip("()"))
 
         if not rule1 or not rule2:
             return None
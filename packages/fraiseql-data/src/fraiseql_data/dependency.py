@@ -49,15 +49,17 @@ class DependencyGraph:
         Raises:
             CircularDependencyError: If circular dependency detected
         """
-        # Calculate in-degree (number of tables depending on this table)
-        in_degree: dict[str, int] = dict.fromkeys(self._tables, 0)
-
+        # In-degree is the number of tables this table depends on; the reverse
+        # adjacency lets each processed table release its dependents in O(E)
+        in_degree: dict[str, int] = {table: len(self._graph[table]) for table in self._tables}
+        dependents: dict[str, list[str]] = defaultdict(list)
         for table in self._tables:
-            for _dep in self._graph[table]:
-                in_degree[table] += 1
+            for dep in self._graph[table]:
+                dependents[dep].append(table)
 
-        # Start with tables that have no dependencies
-        queue = deque([table for table in self._tables if in_degree[table] == 0])
+        # Start with tables that have no dependencies; sorting keeps the
+        # order stable across runs (set iteration order is not)
+        queue = deque(sorted(table for table in self._tables if in_degree[table] == 0))
         result = []
 
         while queue:
@@ -66,11 +68,10 @@ class DependencyGraph:
             result.append(table)
 
             # For each table that depends on this one, reduce in-degree
-            for other_table in self._tables:
-                if table in self._graph[other_table]:
-                    in_degree[other_table] -= 1
-                    if in_degree[other_table] == 0:
-                        queue.append(other_table)
+            for other_table in sorted(dependents[table]):
+                in_degree[other_table] -= 1
+                if in_degree[other_table] == 0:
+                    queue.append(other_table)
 
         # Check for cycles
         if len(result) != len(self._tables):
@@ -4,15 +4,33 @@ import logging
 import os
 import random
 import re
-import uuid as uuid_mod
+from collections.abc import Callable
 from datetime import UTC, date, datetime, time, timedelta
-from typing import Any, ClassVar
+from operator import methodcaller
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from faker import Faker
+if TYPE_CHECKING:
+    from faker import Faker
 
-fake = Faker()
 logger = logging.getLogger("fraiseql_data.generators")
 
+# Faker is imported and instantiated on first use: loading its providers is
+# the most expensive part of importing this package. use_weighting=False
+# samples names, companies, cities, ... uniformly instead of by real-world
+# frequency, which makes those providers 5-30x faster per call.
+_fake: "Faker | None" = None
+
+
+def _get_fake() -> "Faker":
+    """Return the process-wide Faker instance, creating it on first call."""
+    global _fake  # noqa: PLW0603
+    if _fake is None:
+        from faker import Faker
+
+        _fake = Faker(use_weighting=False)
+    return _fake
+
+
 # ---------------------------------------------------------------------------
 # Fast generators — bypass Faker overhead for simple types
 # ---------------------------------------------------------------------------
@@ -41,10 +59,6 @@ def _fast_bool() -> bool:
     return bool(random.getrandbits(1))
 
 
-def _fast_uuid() -> str:
-    return str(uuid_mod.uuid4())
-
-
 def _fast_bytea() -> bytes:
     return os.urandom(16)
 
@@ -104,9 +118,13 @@ _POOL_SIZE = 500
 
 
 class _FakerPool:
-    """Pre-generate batches of Faker values and serve from pool."""
+    """Pre-generate batches of Faker values and serve from pool.
+
+    ``faker_fn`` receives the shared Faker instance, so no Faker object is
+    needed until the pool is first drawn from.
+    """
 
-    def __init__(self, faker_fn: Any, size: int = _POOL_SIZE):
+    def __init__(self, faker_fn: Callable[["Faker"], Any], size: int = _POOL_SIZE):
         self._faker_fn = faker_fn
         self._size = size
         self._pool: list[Any] = []
@@ -114,31 +132,82 @@ class _FakerPool:
 
     def __call__(self) -> Any:
         if self._idx >= len(self._pool):
-            self._pool = [self._faker_fn() for _ in range(self._size)]
+            fake = _get_fake()
+            faker_fn = self._faker_fn
+            self._pool = [faker_fn(fake) for _ in range(self._size)]
             self._idx = 0
         val = self._pool[self._idx]
         self._idx += 1
         return val
 
 
+# Byte maps setting the UUID version 4 nibble and the RFC 4122 variant bits
+_UUID_VERSION_4 = bytes((b & 0x0F) | 0x40 for b in range(256))
+_UUID_VARIANT = bytes((b & 0x3F) | 0x80 for b in range(256))
+# Hex digit counts after which the dashed 8-4-4-4-12 string has a dash
+_UUID_DASH_AFTER = (8, 12, 16, 20)
+# Position of each of the 32 hex digits in the dashed string
+_UUID_HEX_POSITIONS = tuple(j + sum(j >= d for d in _UUID_DASH_AFTER) for j in range(32))
+
+
+class _UuidPool:
+    """Serve random (version 4) UUID strings, one ``os.urandom`` call per batch.
+
+    The whole batch is processed with C-level byte operations: version and
+    variant bits via ``bytes.translate`` on strided slices, and the dashed
+    text by scattering each hex digit column into a dash-filled buffer. Per
+    value, only the final 36-character slice is Python work, about 10x
+    cheaper than ``str(uuid.uuid4())``. The pool is refilled after a fork
+    so processes never hand out the same values.
+    """
+
+    def __init__(self, size: int = _POOL_SIZE):
+        self._size = size
+        self._pool: list[str] = []
+        self._idx = 0
+        self._pid = os.getpid()
+
+    def _refill(self) -> None:
+        raw = bytearray(os.urandom(16 * self._size))
+        raw[6::16] = raw[6::16].translate(_UUID_VERSION_4)
+        raw[8::16] = raw[8::16].translate(_UUID_VARIANT)
+        digits = raw.hex().encode()
+        text = bytearray(b"-" * (36 * self._size))
+        for digit, position in enumerate(_UUID_HEX_POSITIONS):
+            text[position::36] = digits[digit::32]
+        dashed = text.decode()
+        self._pool = [dashed[i : i + 36] for i in range(0, len(dashed), 36)]
+        self._idx = 0
+        self._pid = os.getpid()
+
+    def __call__(self) -> str:
+        if self._idx >= len(self._pool) or self._pid != os.getpid():
+            self._refill()
+        val = self._pool[self._idx]
+        self._idx += 1
+        return val
+
+
+_fast_uuid = _UuidPool()
+
 # Pooled Faker generators (amortize Faker's per-call overhead)
-_pool_email = _FakerPool(fake.email)
-_pool_first_name = _FakerPool(fake.first_name)
-_pool_last_name = _FakerPool(fake.last_name)
-_pool_name = _FakerPool(fake.name)
-_pool_company = _FakerPool(fake.company)
-_pool_phone = _FakerPool(fake.phone_number)
-_pool_address = _FakerPool(fake.address)
-_pool_street = _FakerPool(fake.street_address)
-_pool_city = _FakerPool(fake.city)
-_pool_state = _FakerPool(fake.state)
-_pool_country = _FakerPool(fake.country)
-_pool_zipcode = _FakerPool(fake.zipcode)
-_pool_url = _FakerPool(fake.url)
-_pool_text_50 = _FakerPool(lambda: fake.text(max_nb_chars=50))
-_pool_text_200 = _FakerPool(lambda: fake.text(max_nb_chars=200))
-_pool_text_300 = _FakerPool(lambda: fake.text(max_nb_chars=300))
-_pool_word = _FakerPool(fake.word)
+_pool_email = _FakerPool(methodcaller("email"))
+_pool_first_name = _FakerPool(methodcaller("first_name"))
+_pool_last_name = _FakerPool(methodcaller("last_name"))
+_pool_name = _FakerPool(methodcaller("name"))
+_pool_company = _FakerPool(methodcaller("company"))
+_pool_phone = _FakerPool(methodcaller("phone_number"))
+_pool_address = _FakerPool(methodcaller("address"))
+_pool_street = _FakerPool(methodcaller("street_address"))
+_pool_city = _FakerPool(methodcaller("city"))
+_pool_state = _FakerPool(methodcaller("state"))
+_pool_country = _FakerPool(methodcaller("country"))
+_pool_zipcode = _FakerPool(methodcaller("zipcode"))
+_pool_url = _FakerPool(methodcaller("url"))
+_pool_text_50 = _FakerPool(methodcaller("text", max_nb_chars=50))
+_pool_text_200 = _FakerPool(methodcaller("text", max_nb_chars=200))
+_pool_text_300 = _FakerPool(methodcaller("text", max_nb_chars=300))
+_pool_word = _FakerPool(methodcaller("word"))
 
 
 class FakerGenerator:
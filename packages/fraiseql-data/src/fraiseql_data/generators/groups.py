@@ -3,9 +3,10 @@
 import random
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from faker import Faker
+if TYPE_CHECKING:
+    from faker import Faker
 
 # ---------------------------------------------------------------------------
 # Locale infrastructure
@@ -33,12 +34,14 @@ LOCALE_TO_COUNTRY: dict[str, str] = {v: k for k, v in COUNTRY_TO_LOCALE.items()}
 
 _SUPPORTED_LOCALES: list[str] = list(COUNTRY_TO_LOCALE.values())
 
-_faker_instances: dict[str, Faker] = {}
+_faker_instances: dict[str, "Faker"] = {}
 
 
-def _get_faker(locale: str) -> Faker:
+def _get_faker(locale: str) -> "Faker":
     """Get or create a Faker instance for the given locale."""
     if locale not in _faker_instances:
+        from faker import Faker
+
         _faker_instances[locale] = Faker(locale)
     return _faker_instances[locale]
 
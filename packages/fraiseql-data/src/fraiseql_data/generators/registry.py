@@ -1,11 +1,17 @@
 """Generator registry for custom generator plugins."""
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
 
 class GeneratorRegistry:
     """Registry for custom generator plugins."""
 
     def __init__(self):
         self._generators: dict[str, type] = {}
+        # Read-only snapshot used for lookups once registration is done
+        self._lookup: Mapping[str, type] | None = None
 
     def register(self, name: str, generator_class: type) -> None:
         """
@@ -23,7 +29,21 @@ class GeneratorRegistry:
                 f"Generator class must have 'generate' method. "
                 f"Class {generator_class.__name__} is missing it."
             )
-        self._generators[name] = generator_class
+        self._generators[sys.intern(name)] = generator_class
+        self._lookup = None
+
+    def freeze(self) -> Mapping[str, type]:
+        """
+        Snapshot registered generators into a read-only lookup table.
+
+        Called automatically on the first lookup after registration; any
+        later ``register()`` or ``clear()`` discards the snapshot.
+
+        Returns:
+            Read-only mapping of generator name to class
+        """
+        self._lookup = MappingProxyType(dict(self._generators))
+        return self._lookup
 
     def get(self, name: str) -> type | None:
         """
@@ -35,7 +55,10 @@ class GeneratorRegistry:
         Returns:
             Generator class or None if not found
         """
-        return self._generators.get(name)
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self.freeze()
+        return lookup.get(name)
 
     def list_generators(self) -> list[str]:
         """
@@ -49,6 +72,7 @@ class GeneratorRegistry:
     def clear(self) -> None:
         """Clear all registered generators (for testing)."""
         self._generators.clear()
+        self._lookup = None
 
 
 # Global registry instance
@@ -1,9 +1,27 @@
 """Trinity pattern column generator."""
 
+import hashlib
+from functools import cache
 from typing import Any
 
 from fraiseql_uuid import Pattern
 
+# Lowercase ASCII letters and map word separators to "-" in a single pass
+_SLUG_TRANS = str.maketrans(
+    {" ": "-", "_": "-", **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)}}
+)
+
+
+def _slugify(name: str) -> str:
+    """Simple slugify (non-ASCII case folding needs the full str.lower)."""
+    return (name if name.isascii() else name.lower()).translate(_SLUG_TRANS)
+
+
+@cache
+def _table_code(table_name: str) -> str:
+    """Derive the 6-hex-digit UUID table code from a table name (memoized)."""
+    return hashlib.md5(table_name.encode()).hexdigest()[:6]
+
 
 class TrinityGenerator:
     """
@@ -19,6 +37,8 @@ class TrinityGenerator:
     allocates deterministic primary keys via the Trinity PostgreSQL extension.
     """
 
+    __slots__ = ("pattern", "seed_dir", "table_code", "table_name", "trinity_context")
+
     def __init__(
         self,
         pattern: Pattern,
@@ -43,9 +63,7 @@ class TrinityGenerator:
         self.trinity_context = trinity_context
 
         # Auto-generate table code from table name
-        import hashlib
-
-        self.table_code = hashlib.md5(table_name.encode()).hexdigest()[:6]
+        self.table_code = _table_code(table_name)
 
     def generate(self, instance: int, **row_data: Any) -> dict[str, Any]:
         """
@@ -69,9 +87,34 @@ class TrinityGenerator:
             >>> gen.generate(1, name='Acme Corp')
             {'id': UUID('...'), 'identifier': 'acme-corp-1', 'pk_tb_manufacturer': 42}
         """
-        trinity_data = {}
+        generated_id, identifier = self.generate_tuple(instance, row_data.get("name"))
+        trinity_data: dict[str, Any] = {"id": generated_id, "identifier": identifier}
+
+        # Allocate deterministic pk_* via Trinity extension if context provided
+        if self.trinity_context:
+            trinity_data[f"pk_{self.table_name}"] = self._allocate_pk(generated_id)
+
+        return trinity_data
 
-        # Generate UUID id
+    def generate_tuple(self, instance: int, name: str | None = None) -> tuple[str, str]:
+        """
+        Generate the Trinity ``(id, identifier)`` pair for a row.
+
+        Fast path for callers that unpack the result immediately: no kwargs
+        packing and no dict allocation. Does not allocate ``pk_*`` values.
+
+        Args:
+            instance: Row instance number (1-based)
+            name: Optional 'name' value to derive the identifier from
+
+        Returns:
+            Tuple of (id, identifier)
+
+        Example:
+            >>> gen = TrinityGenerator(pattern, 'tb_manufacturer')
+            >>> gen.generate_tuple(1, 'Acme Corp')
+            ('...', 'acme-corp-1')
+        """
         generated_id = self.pattern.generate(
             table_code=self.table_code,
             seed_dir=self.seed_dir,
@@ -80,39 +123,91 @@ class TrinityGenerator:
             test_case=0,
             instance=instance,
         )
-        trinity_data["id"] = generated_id
-
-        # Generate identifier
-        # Try to derive from 'name' column if it exists
-        if row_data.get("name"):
-            base = row_data["name"]
-            # Simple slugify
-            identifier = base.lower().replace(" ", "-").replace("_", "-")
-            # Make unique by appending instance
-            trinity_data["identifier"] = f"{identifier}-{instance}"
-        else:
-            # Fallback: table name + instance
-            trinity_data["identifier"] = f"{self.table_name}_{instance:04d}"
+        if name:
+            return generated_id, f"{_slugify(name)}-{instance}"
+        return generated_id, f"{self.table_name}_{instance:04d}"
 
-        # Allocate deterministic pk_* via Trinity extension if context provided
-        if self.trinity_context:
-            pk_column = f"pk_{self.table_name}"
-            try:
-                conn = self.trinity_context["conn"]
-                tenant_id = self.trinity_context.get("tenant_id")
-
-                # Call Trinity extension to allocate deterministic PK
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT trinity.allocate_uuid_pk(%s, %s, %s)",
-                        (self.table_name, str(generated_id), tenant_id),
-                    )
-                    allocated_pk = cur.fetchone()[0]
-                    trinity_data[pk_column] = allocated_pk
-                    conn.commit()
-            except Exception as e:
-                raise RuntimeError(
-                    f"Trinity extension allocation failed for {self.table_name}: {e}"
-                ) from e
+    def generate_batch(
+        self, start: int, count: int, names: list[str | None] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Generate Trinity columns for ``count`` consecutive rows.
 
-        return trinity_data
+        Equivalent to calling ``generate`` for instances ``start`` through
+        ``start + count - 1``, without per-row kwargs packing and attribute
+        lookups.
+
+        Args:
+            start: Instance number of the first row (1-based)
+            count: Number of rows to generate
+            names: Optional per-row 'name' values to derive identifiers from;
+                falsy entries fall back to the table-name identifier
+
+        Returns:
+            List of dicts shaped like ``generate`` results, one per row
+
+        Example:
+            >>> gen = TrinityGenerator(pattern, 'tb_manufacturer')
+            >>> [r['identifier'] for r in gen.generate_batch(1, 2, ['Acme', None])]
+            ['acme-1', 'tb_manufacturer_0002']
+        """
+        pk_column = f"pk_{self.table_name}" if self.trinity_context else None
+
+        # Generate UUID ids; the pattern formats the fixed segments once
+        ids = self.pattern.generate_batch(
+            count,
+            start,
+            table_code=self.table_code,
+            seed_dir=self.seed_dir,
+            function=0,
+            scenario=0,
+            test_case=0,
+        )
+        identifiers = self._identifiers(start, count, names)
+
+        batch: list[dict[str, Any]] = [
+            {"id": generated_id, "identifier": identifier}
+            for generated_id, identifier in zip(ids, identifiers, strict=True)
+        ]
+
+        # Allocate deterministic pk_* via Trinity extension if context provided
+        if pk_column is not None:
+            for trinity_data in batch:
+                trinity_data[pk_column] = self._allocate_pk(trinity_data["id"])
+
+        return batch
+
+    def _identifiers(self, start: int, count: int, names: list[str | None] | None) -> list[str]:
+        """Build identifiers: slugified 'name' plus instance, or table name + instance."""
+        instances = range(start, start + count)
+        # Fallback: table name + instance, with the prefix formatted once
+        prefix = f"{self.table_name}_"
+        if names is None:
+            # Nameless tables skip the per-row name check entirely
+            return [f"{prefix}{instance:04d}" for instance in instances]
+        return [
+            # Make unique by appending instance
+            f"{_slugify(name)}-{instance}" if name else f"{prefix}{instance:04d}"
+            for instance, name in zip(instances, names, strict=True)
+        ]
+
+    def _allocate_pk(self, generated_id: str) -> Any:
+        """Allocate a deterministic primary key via the Trinity extension."""
+        assert self.trinity_context is not None
+        try:
+            conn = self.trinity_context["conn"]
+            tenant_id = self.trinity_context.get("tenant_id")
+
+            # Call Trinity extension to allocate deterministic PK
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT trinity.allocate_uuid_pk(%s, %s, %s)",
+                    (self.table_name, str(generated_id), tenant_id),
+                )
+                allocated_pk = cur.fetchone()[0]
+                conn.commit()
+                return allocated_pk
+        except Exception as e:
+            raise RuntimeError(
+                f"Trinity extension allocation failed for {self.table_name}: {e}"
+            ) from e
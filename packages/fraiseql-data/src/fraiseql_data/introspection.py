@@ -1,8 +1,14 @@
 """Schema introspection with caching and optimized queries."""
 
-from typing import ClassVar
+import logging
+import tempfile
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, ClassVar
 
-from psycopg import Connection
+from psycopg import Connection, Cursor, Pipeline, sql
 
 from fraiseql_data.dependency import DependencyGraph
 from fraiseql_data.exceptions import SchemaNotFoundError, TableNotFoundError
@@ -14,137 +20,256 @@ from fraiseql_data.models import (
     TableInfo,
 )
 
+# A composed query and its parameters
+logger = logging.getLogger(__name__)
+
+_Query = tuple[str | sql.Composable, tuple[str, ...]]
+
 
 class SchemaIntrospector:
-    """Introspect PostgreSQL schema with caching."""
+    """
+    Introspect PostgreSQL schema with caching.
+
+    Metadata is loaded for the whole schema at once: one query per kind
+    (tables, columns, foreign keys, UNIQUE and CHECK constraints) rather
+    than one set of queries per table. Queries read pg_catalog directly;
+    the information_schema views add joins and privilege checks that
+    dominate introspection time on large schemas. The per-table ``get_*`` methods
+    run the same queries filtered to a single table and are not cached.
+
+    If ``order_cache_dir`` is given, the topological order is also persisted
+    there as a ``.tdag`` file (one table per line) keyed by a fingerprint of
+    the schema's tables and foreign keys, so later runs against an unchanged
+    schema can sort without introspecting it.
+    """
 
-    def __init__(self, conn: Connection, schema: str):
+    def __init__(self, conn: Connection, schema: str, *, order_cache_dir: str | Path | None = None):
         self.conn = conn
         self.schema = schema
+        self.order_cache_dir = Path(order_cache_dir) if order_cache_dir is not None else None
         self._table_cache: dict[str, TableInfo] = {}
+        # Base table names in name order, set once the schema has been loaded
+        self._table_names: list[str] | None = None
         self._dependency_graph_cache: DependencyGraph | None = None
+        self._topological_sort_cache: list[str] | None = None
+        # Bumped by clear_cache() so holders of derived data know to drop it
+        self.cache_version = 0
 
         # Validate schema exists
         self._validate_schema()
 
     def _validate_schema(self) -> None:
         """Validate that schema exists in database."""
-        with self.conn.cursor() as cur:
-            cur.execute(
-                "SELECT EXISTS(SELECT 1 FROM information_schema.schemata WHERE schema_name = %s)",
+        # Same visibility rule as information_schema.schemata, without the view.
+        # Prepared like the other introspection queries: every builder and CLI
+        # command constructs an introspector on the same connection.
+        with self._execute_all(
+            (
+                """
+                SELECT EXISTS(
+                    SELECT 1 FROM pg_namespace n
+                    WHERE n.nspname = %s
+                      AND (pg_has_role(n.nspowner, 'USAGE')
+                           OR has_schema_privilege(n.oid, 'CREATE, USAGE'))
+                )
+                """,
                 (self.schema,),
             )
+        ) as (cur,):
             result = cur.fetchone()
-            if result is None or not result[0]:
-                raise SchemaNotFoundError(self.schema)
-
-    def get_tables(self) -> list[TableInfo]:
-        """Get all tables in schema (cached)."""
-        # If cache is populated, use it
-        if self._table_cache:
-            return list(self._table_cache.values())
+        if result is None or not result[0]:
+            raise SchemaNotFoundError(self.schema)
+
+    @staticmethod
+    def _table_filter(column: str, table_name: str | None) -> sql.Composable:
+        """Return an ``AND <column> = %s`` clause, or nothing for schema-wide loads."""
+        if table_name is None:
+            return sql.SQL("")
+        return sql.SQL("AND {} = %s").format(sql.SQL(column))
+
+    def _params(self, table_name: str | None, *leading: str) -> tuple[str, ...]:
+        """Build query parameters: ``leading`` values, schema, then optional table."""
+        if table_name is None:
+            return (*leading, self.schema)
+        return (*leading, self.schema, table_name)
+
+    @contextmanager
+    def _execute_all(self, *queries: _Query) -> Iterator[list[Cursor[Any]]]:
+        """
+        Run independent queries and yield one executed cursor per query.
+
+        The queries are sent in pipeline mode when libpq supports it, so
+        they cost one network round-trip instead of one per query. They are
+        also prepared server-side: the same SQL is reissued for every table
+        looked up and on every schema reload, so parsing and planning happen
+        once per connection. Callers iterate the cursors directly rather
+        than materializing fetchall() lists.
+        """
+        with ExitStack() as stack:
+            cursors = [stack.enter_context(self.conn.cursor()) for _ in queries]
+            if Pipeline.is_supported():
+                with self.conn.pipeline():
+                    for cur, (query, params) in zip(cursors, queries, strict=True):
+                        cur.execute(query, params, prepare=True)
+            else:
+                for cur, (query, params) in zip(cursors, queries, strict=True):
+                    cur.execute(query, params, prepare=True)
+            yield cursors
+
+    def _load_schema(self) -> None:
+        """
+        Load metadata for every table in the schema into the cache.
 
-        with self.conn.cursor() as cur:
-            cur.execute(
+        Issues one query per metadata kind regardless of table count, all
+        pipelined into a single round-trip. Tables already cached keep their
+        existing TableInfo. The dependency graph is rebuilt in the same pass.
+        """
+        with self._execute_all(
+            (
                 """
-                SELECT table_name
-                FROM information_schema.tables
-                WHERE table_schema = %s
-                  AND table_type = 'BASE TABLE'
-                ORDER BY table_name
+                SELECT c.relname, c.relkind IN ('r', 'p')
+                FROM pg_class c
+                JOIN pg_namespace n ON c.relnamespace = n.oid
+                WHERE n.nspname = %s
+                  AND c.relkind IN ('r', 'p', 'v', 'f')
+                ORDER BY c.relname
                 """,
                 (self.schema,),
-            )
-            rows = cur.fetchall()
+            ),
+            self._columns_query(),
+            self._foreign_keys_query(),
+            self._multi_column_unique_constraints_query(),
+            self._check_constraints_query(),
+        ) as (relations_cur, columns_cur, fk_cur, multi_unique_cur, check_cur):
+            relations = relations_cur.fetchall()
+            columns = self._parse_columns(columns_cur)
+            foreign_keys = self._parse_foreign_keys(fk_cur)
+            multi_unique_constraints = self._parse_multi_column_unique_constraints(multi_unique_cur)
+            check_constraints = self._parse_check_constraints(check_cur)
+
+        # The dependency graph over base tables is built in the same pass
+        graph = DependencyGraph()
+        table_names = []
+        for table_name, is_base in relations:
+            if table_name not in self._table_cache:
+                self._table_cache[table_name] = TableInfo(
+                    name=table_name,
+                    columns=columns.get(table_name, []),
+                    foreign_keys=foreign_keys.get(table_name, []),
+                    multi_unique_constraints=multi_unique_constraints.get(table_name, []),
+                    check_constraints=check_constraints.get(table_name, []),
+                )
+            if not is_base:
+                continue
+            table_names.append(table_name)
+            graph.add_table(table_name)
+            for fk in self._table_cache[table_name].foreign_keys:
+                # Skip self-references (don't add to dependency graph)
+                if not fk.is_self_referencing:
+                    graph.add_dependency(table_name, fk.referenced_table, fk_column=fk.column)
 
-        # Populate cache
-        return [self.get_table_info(row[0]) for row in rows]
+        self._table_names = table_names
+        self._dependency_graph_cache = graph
+        self._topological_sort_cache = None
+
+    def get_tables(self) -> list[TableInfo]:
+        """Get all tables in schema (cached)."""
+        if self._table_names is None:
+            self._load_schema()
+        assert self._table_names is not None
+        return [self._table_cache[name] for name in self._table_names]
 
     def get_table_info(self, table_name: str) -> TableInfo:
         """Get complete table information (cached)."""
-        if table_name in self._table_cache:
-            return self._table_cache[table_name]
-
-        # Validate table exists
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT EXISTS(
-                    SELECT 1 FROM information_schema.tables
-                    WHERE table_schema = %s AND table_name = %s
-                )
-                """,
-                (self.schema, table_name),
-            )
-            result = cur.fetchone()
-            if result is None or not result[0]:
+        if table_name not in self._table_cache:
+            # Cache miss: (re)load the schema, which picks up tables created
+            # since the last load.
+            self._load_schema()
+            if table_name not in self._table_cache:
                 raise TableNotFoundError(table_name, self.schema)
-
-        columns = self.get_columns(table_name)
-        foreign_keys = self.get_foreign_keys(table_name)
-        multi_unique_constraints = self.get_multi_column_unique_constraints(table_name)
-        check_constraints = self.get_check_constraints(table_name)
-
-        table_info = TableInfo(
-            name=table_name,
-            columns=columns,
-            foreign_keys=foreign_keys,
-            multi_unique_constraints=multi_unique_constraints,
-            check_constraints=check_constraints,
-        )
-        self._table_cache[table_name] = table_info
-        return table_info
+        return self._table_cache[table_name]
 
     def get_columns(self, table_name: str) -> list[ColumnInfo]:
         """Get all columns for a table (optimized single query)."""
-        # Get UNIQUE constraints for this table
-        unique_columns = self.get_unique_constraints(table_name)
-
-        with self.conn.cursor() as cur:
-            # Single query to get columns + PK info + identity detection
-            cur.execute(
+        with self._execute_all(self._columns_query(table_name)) as (cur,):
+            return self._parse_columns(cur).get(table_name, [])
+
+    def _columns_query(self, table_name: str | None = None) -> _Query:
+        """Build the columns query with PK/UNIQUE/identity info."""
+        # Single query to get columns + PK/UNIQUE info + identity detection.
+        # data_type/udt_name follow information_schema.columns: domains report
+        # their base type, arrays report 'ARRAY' and non-catalog types
+        # 'USER-DEFINED'.
+        return (
+            sql.SQL(
                 """
-                SELECT
-                    c.column_name,
-                    c.data_type,
-                    c.is_nullable,
-                    c.column_default,
-                    CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as is_pk,
-                    COALESCE(c.is_identity, 'NO') as is_identity,
-                    c.udt_name,
-                    c.numeric_precision,
-                    c.numeric_scale
-                FROM information_schema.columns c
-                LEFT JOIN (
-                    SELECT kcu.column_name
-                    FROM information_schema.table_constraints tc
-                    JOIN information_schema.key_column_usage kcu
-                      ON tc.constraint_name = kcu.constraint_name
-                      AND tc.table_schema = kcu.table_schema
-                    WHERE tc.constraint_type = 'PRIMARY KEY'
-                      AND tc.table_schema = %s
-                      AND tc.table_name = %s
-                ) pk ON c.column_name = pk.column_name
-                WHERE c.table_schema = %s
-                  AND c.table_name = %s
-                ORDER BY c.ordinal_position
-                """,
-                (self.schema, table_name, self.schema, table_name),
-            )
-            rows = cur.fetchall()
-
-        return [
-            ColumnInfo(
-                name=row[0],
-                pg_type=self._resolve_pg_type(row[1], row[6], row[7], row[8]),
-                is_nullable=row[2] == "YES",
-                default_value=row[3],
-                is_primary_key=row[4],
-                is_unique=row[0] in unique_columns,
-                is_identity=row[5] == "YES",
+            SELECT
+                c.relname,
+                a.attname,
+                CASE
+                    WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                    WHEN bt.typnamespace = 'pg_catalog'::regnamespace
+                        THEN format_type(bt.oid, NULL)
+                    ELSE 'USER-DEFINED'
+                END AS data_type,
+                NOT (a.attnotnull OR (t.typtype = 'd' AND t.typnotnull)) AS is_nullable,
+                CASE WHEN a.attgenerated = '' THEN pg_get_expr(ad.adbin, ad.adrelid) END
+                    AS column_default,
+                COALESCE(a.attnum = ANY (pk.conkey), false) AS is_pk,
+                a.attidentity <> '' AS is_identity,
+                bt.typname AS udt_name,
+                CASE WHEN bt.oid = 'numeric'::regtype AND typmod.value <> -1
+                    THEN ((typmod.value - 4) >> 16) & 65535
+                END AS numeric_precision,
+                CASE WHEN bt.oid = 'numeric'::regtype AND typmod.value <> -1
+                    THEN (typmod.value - 4) & 65535
+                END AS numeric_scale,
+                EXISTS (
+                    SELECT 1
+                    FROM pg_constraint uq
+                    WHERE uq.conrelid = c.oid
+                      AND uq.contype = 'u'
+                      AND a.attnum = ANY (uq.conkey)
+                ) AS is_unique
+            FROM pg_attribute a
+            JOIN pg_class c ON a.attrelid = c.oid
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            JOIN pg_type t ON a.atttypid = t.oid
+            JOIN pg_type bt
+              ON bt.oid = CASE WHEN t.typtype = 'd' THEN t.typbasetype ELSE t.oid END
+            CROSS JOIN LATERAL (
+                SELECT CASE WHEN t.typtype = 'd' THEN t.typtypmod ELSE a.atttypmod END AS value
+            ) typmod
+            LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
+            LEFT JOIN pg_constraint pk ON pk.conrelid = c.oid AND pk.contype = 'p'
+            WHERE n.nspname = %s
+              AND c.relkind IN ('r', 'p', 'v', 'f')
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+              {table_filter}
+            ORDER BY c.relname, a.attnum
+            """
+            ).format(table_filter=self._table_filter("c.relname", table_name)),
+            self._params(table_name),
+        )
+
+    @classmethod
+    def _parse_columns(cls, rows: Iterable[tuple[Any, ...]]) -> dict[str, list[ColumnInfo]]:
+        """Group column rows by table name."""
+        columns: dict[str, list[ColumnInfo]] = defaultdict(list)
+        for row in rows:
+            columns[row[0]].append(
+                ColumnInfo(
+                    name=row[1],
+                    pg_type=cls._resolve_pg_type(row[2], row[7], row[8], row[9]),
+                    is_nullable=row[3],
+                    default_value=row[4],
+                    is_primary_key=row[5],
+                    is_unique=row[10],
+                    is_identity=row[6],
+                )
             )
-            for row in rows
-        ]
+        return columns
 
     _UDT_ELEMENT_TYPES: ClassVar[dict[str, str]] = {
         "_int4": "integer",
@@ -187,7 +312,7 @@ class SchemaIntrospector:
         """
         Get column names with UNIQUE constraints.
 
-        Queries PostgreSQL's information_schema to find columns with UNIQUE
+        Queries PostgreSQL's pg_catalog to find columns with UNIQUE
         constraints. This information is used during seed generation to:
         - Detect collisions and retry value generation
         - Prevent duplicate key violations
@@ -208,21 +333,34 @@ class SchemaIntrospector:
             This does NOT include PRIMARY KEY columns (they're already
             tracked via is_primary_key).
         """
-        with self.conn.cursor() as cur:
-            cur.execute(
+        with self._execute_all(self._unique_constraints_query(table_name)) as (cur,):
+            return self._parse_unique_constraints(cur).get(table_name, set())
+
+    def _unique_constraints_query(self, table_name: str | None = None) -> _Query:
+        """Build the UNIQUE-constrained columns query."""
+        return (
+            sql.SQL(
                 """
-                SELECT kcu.column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                  ON tc.constraint_name = kcu.constraint_name
-                  AND tc.table_schema = kcu.table_schema
-                WHERE tc.constraint_type = 'UNIQUE'
-                  AND tc.table_schema = %s
-                  AND tc.table_name = %s
-                """,
-                (self.schema, table_name),
-            )
-            return {row[0] for row in cur.fetchall()}
+            SELECT cls.relname, att.attname
+            FROM pg_constraint con
+            JOIN pg_class cls ON con.conrelid = cls.oid
+            JOIN pg_namespace nsp ON cls.relnamespace = nsp.oid
+            JOIN pg_attribute att ON att.attrelid = cls.oid AND att.attnum = ANY (con.conkey)
+            WHERE con.contype = 'u'
+              AND nsp.nspname = %s
+              {table_filter}
+            """
+            ).format(table_filter=self._table_filter("cls.relname", table_name)),
+            self._params(table_name),
+        )
+
+    @staticmethod
+    def _parse_unique_constraints(rows: Iterable[tuple[Any, ...]]) -> dict[str, set[str]]:
+        """Group UNIQUE-constrained column names by table name."""
+        unique_columns: dict[str, set[str]] = defaultdict(set)
+        for row in rows:
+            unique_columns[row[0]].add(row[1])
+        return unique_columns
 
     def get_multi_column_unique_constraints(
         self, table_name: str
@@ -230,7 +368,7 @@ class SchemaIntrospector:
         """
         Get multi-column UNIQUE constraints.
 
-        Queries PostgreSQL's information_schema to find UNIQUE constraints
+        Queries PostgreSQL's pg_catalog to find UNIQUE constraints
         that span multiple columns (e.g., UNIQUE(year, month, code)).
 
         Args:
@@ -253,43 +391,53 @@ class SchemaIntrospector:
             Only returns constraints with 2+ columns. Single-column UNIQUE
             constraints are handled by get_unique_constraints().
         """
-        with self.conn.cursor() as cur:
-            # Get all UNIQUE constraints with their columns
-            # Use string_agg for simplicity to avoid array parsing issues
-            cur.execute(
+        with self._execute_all(self._multi_column_unique_constraints_query(table_name)) as (cur,):
+            return self._parse_multi_column_unique_constraints(cur).get(table_name, [])
+
+    def _multi_column_unique_constraints_query(self, table_name: str | None = None) -> _Query:
+        """Build the multi-column UNIQUE constraints query."""
+        # Get all UNIQUE constraints with their columns, in constraint order
+        return (
+            sql.SQL(
                 """
-                SELECT
-                    tc.constraint_name,
-                    string_agg(kcu.column_name, ',' ORDER BY kcu.ordinal_position) as columns
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                  ON tc.constraint_name = kcu.constraint_name
-                  AND tc.table_schema = kcu.table_schema
-                WHERE tc.constraint_type = 'UNIQUE'
-                  AND tc.table_schema = %s
-                  AND tc.table_name = %s
-                GROUP BY tc.constraint_name
-                HAVING COUNT(*) > 1
-                """,
-                (self.schema, table_name),
-            )
-
-            constraints = []
-            for row in cur.fetchall():
-                constraint_name = row[0]
-                # Split comma-separated column names into tuple
-                columns = tuple(row[1].split(","))
-                constraints.append(
-                    MultiColumnUniqueConstraint(columns=columns, constraint_name=constraint_name)
-                )
+            SELECT
+                cls.relname,
+                con.conname,
+                array_agg(att.attname::text ORDER BY key.position) as columns
+            FROM pg_constraint con
+            JOIN pg_class cls ON con.conrelid = cls.oid
+            JOIN pg_namespace nsp ON cls.relnamespace = nsp.oid
+            CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS key(attnum, position)
+            JOIN pg_attribute att ON att.attrelid = cls.oid AND att.attnum = key.attnum
+            WHERE con.contype = 'u'
+              AND nsp.nspname = %s
+              AND cardinality(con.conkey) > 1
+              {table_filter}
+            GROUP BY cls.relname, con.conname
+            """
+            ).format(table_filter=self._table_filter("cls.relname", table_name)),
+            self._params(table_name),
+        )
 
-            return constraints
+    @staticmethod
+    def _parse_multi_column_unique_constraints(
+        rows: Iterable[tuple[Any, ...]],
+    ) -> dict[str, list[MultiColumnUniqueConstraint]]:
+        """Group multi-column UNIQUE constraint rows by table name."""
+        constraints: dict[str, list[MultiColumnUniqueConstraint]] = defaultdict(list)
+        for row in rows:
+            # psycopg decodes text[] to a list
+            columns = tuple(row[2])
+            constraints[row[0]].append(
+                MultiColumnUniqueConstraint(columns=columns, constraint_name=row[1])
+            )
+        return constraints
 
     def get_check_constraints(self, table_name: str) -> list["CheckConstraint"]:
         """
         Get CHECK constraints for a table.
 
-        Queries PostgreSQL's information_schema to find CHECK constraints
+        Queries PostgreSQL's pg_catalog to find CHECK constraints
         (e.g., CHECK (price > 0), CHECK (status IN ('active', 'inactive'))).
 
         Args:
@@ -312,96 +460,195 @@ class SchemaIntrospector:
             the builder will emit warnings when they are detected without
             user-provided overrides.
         """
-        with self.conn.cursor() as cur:
-            # Get CHECK constraints
-            cur.execute(
-                """
-                SELECT
-                    con.conname AS constraint_name,
-                    pg_get_constraintdef(con.oid) AS check_clause
-                FROM pg_constraint con
-                JOIN pg_namespace nsp ON con.connamespace = nsp.oid
-                JOIN pg_class cls ON con.conrelid = cls.oid
-                WHERE con.contype = 'c'
-                  AND nsp.nspname = %s
-                  AND cls.relname = %s
-                """,
-                (self.schema, table_name),
-            )
+        with self._execute_all(self._check_constraints_query(table_name)) as (cur,):
+            return self._parse_check_constraints(cur).get(table_name, [])
 
-            constraints = []
-            for row in cur.fetchall():
-                constraint_name = row[0]
-                check_clause = row[1]
-                # Remove "CHECK " prefix from clause if present
-                check_clause = check_clause.removeprefix("CHECK ")
-                constraints.append(
-                    CheckConstraint(constraint_name=constraint_name, check_clause=check_clause)
-                )
+    def _check_constraints_query(self, table_name: str | None = None) -> _Query:
+        """Build the CHECK constraints query."""
+        return (
+            sql.SQL(
+                """
+            SELECT
+                cls.relname AS table_name,
+                con.conname AS constraint_name,
+                pg_get_constraintdef(con.oid) AS check_clause
+            FROM pg_constraint con
+            JOIN pg_namespace nsp ON con.connamespace = nsp.oid
+            JOIN pg_class cls ON con.conrelid = cls.oid
+            WHERE con.contype = 'c'
+              AND nsp.nspname = %s
+              {table_filter}
+            """
+            ).format(table_filter=self._table_filter("cls.relname", table_name)),
+            self._params(table_name),
+        )
 
-            return constraints
+    @staticmethod
+    def _parse_check_constraints(
+        rows: Iterable[tuple[Any, ...]],
+    ) -> dict[str, list[CheckConstraint]]:
+        """Group CHECK constraint rows by table name."""
+        constraints: dict[str, list[CheckConstraint]] = defaultdict(list)
+        for row in rows:
+            # Remove "CHECK " prefix from clause if present
+            check_clause = row[2].removeprefix("CHECK ")
+            constraints[row[0]].append(
+                CheckConstraint(constraint_name=row[1], check_clause=check_clause)
+            )
+        return constraints
 
     def get_foreign_keys(self, table_name: str) -> list[ForeignKeyInfo]:
         """Get all foreign keys for a table."""
-        with self.conn.cursor() as cur:
-            cur.execute(
+        with self._execute_all(self._foreign_keys_query(table_name)) as (cur,):
+            return self._parse_foreign_keys(cur).get(table_name, [])
+
+    def _foreign_keys_query(self, table_name: str | None = None) -> _Query:
+        """Build the foreign keys query."""
+        return (
+            sql.SQL(
                 """
-                SELECT
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table_name,
-                    ccu.column_name AS foreign_column_name
-                FROM information_schema.table_constraints AS tc
-                JOIN information_schema.key_column_usage AS kcu
-                  ON tc.constraint_name = kcu.constraint_name
-                  AND tc.table_schema = kcu.table_schema
-                JOIN information_schema.constraint_column_usage AS ccu
-                  ON ccu.constraint_name = tc.constraint_name
-                  AND ccu.table_schema = tc.table_schema
-                WHERE tc.constraint_type = 'FOREIGN KEY'
-                  AND tc.table_schema = %s
-                  AND tc.table_name = %s
-                """,
-                (self.schema, table_name),
-            )
-            rows = cur.fetchall()
-
-        return [
-            ForeignKeyInfo(
-                column=row[0],
-                referenced_table=row[1],
-                referenced_column=row[2],
-                is_self_referencing=row[1] == table_name,
+            SELECT
+                cls.relname AS table_name,
+                att.attname AS column_name,
+                ref_cls.relname AS foreign_table_name,
+                ref_att.attname AS foreign_column_name
+            FROM pg_constraint con
+            JOIN pg_class cls ON con.conrelid = cls.oid
+            JOIN pg_namespace nsp ON cls.relnamespace = nsp.oid
+            JOIN pg_class ref_cls ON con.confrelid = ref_cls.oid
+            CROSS JOIN LATERAL unnest(con.conkey, con.confkey) AS key(attnum, ref_attnum)
+            JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = key.attnum
+            JOIN pg_attribute ref_att
+              ON ref_att.attrelid = con.confrelid AND ref_att.attnum = key.ref_attnum
+            WHERE con.contype = 'f'
+              AND nsp.nspname = %s
+              -- Only same-schema references take part in the dependency graph
+              AND ref_cls.relnamespace = nsp.oid
+              {table_filter}
+            """
+            ).format(table_filter=self._table_filter("cls.relname", table_name)),
+            self._params(table_name),
+        )
+
+    @staticmethod
+    def _parse_foreign_keys(rows: Iterable[tuple[Any, ...]]) -> dict[str, list[ForeignKeyInfo]]:
+        """Group foreign key rows by table name."""
+        foreign_keys: dict[str, list[ForeignKeyInfo]] = defaultdict(list)
+        for row in rows:
+            foreign_keys[row[0]].append(
+                ForeignKeyInfo(
+                    column=row[1],
+                    referenced_table=row[2],
+                    referenced_column=row[3],
+                    is_self_referencing=row[2] == row[0],
+                )
             )
-            for row in rows
-        ]
+        return foreign_keys
 
     def get_dependency_graph(self) -> DependencyGraph:
-        """Build dependency graph (cached)."""
-        if self._dependency_graph_cache is not None:
-            return self._dependency_graph_cache
-
-        tables = self.get_tables()
-        graph = DependencyGraph()
-
-        for table in tables:
-            graph.add_table(table.name)
-            for fk in table.foreign_keys:
-                # Skip self-references (don't add to dependency graph)
-                if not fk.is_self_referencing:
-                    graph.add_dependency(table.name, fk.referenced_table, fk_column=fk.column)
-
-        self._dependency_graph_cache = graph
-        return graph
+        """Get the dependency graph, built while loading the schema (cached)."""
+        if self._dependency_graph_cache is None:
+            self._load_schema()
+        assert self._dependency_graph_cache is not None
+        return self._dependency_graph_cache
+
+    def _order_cache_path(self) -> Path | None:
+        """Return the ``.tdag`` file for the current schema shape, if caching is on."""
+        if self.order_cache_dir is None:
+            return None
+        # Only base tables and same-schema FK edges affect the order
+        with self._execute_all(
+            (
+                """
+                SELECT md5(coalesce(string_agg(entry, ',' ORDER BY entry), ''))
+                FROM (
+                    SELECT c.relname::text AS entry
+                    FROM pg_class c
+                    JOIN pg_namespace n ON c.relnamespace = n.oid
+                    WHERE n.nspname = %s AND c.relkind IN ('r', 'p')
+                    UNION ALL
+                    SELECT c.relname || '>' || ref.relname
+                    FROM pg_constraint con
+                    JOIN pg_class c ON con.conrelid = c.oid
+                    JOIN pg_class ref ON con.confrelid = ref.oid
+                    JOIN pg_namespace n ON c.relnamespace = n.oid
+                    WHERE n.nspname = %s
+                      AND con.contype = 'f'
+                      AND con.conrelid <> con.confrelid
+                      AND ref.relnamespace = c.relnamespace
+                ) entries
+                """,
+                (self.schema, self.schema),
+            )
+        ) as (cur,):
+            row = cur.fetchone()
+        assert row is not None
+        return self.order_cache_dir / f"{self.schema}.{row[0]}.tdag"
 
     def topological_sort(self) -> list[str]:
-        """Sort tables in dependency order."""
-        graph = self.get_dependency_graph()
-        return graph.topological_sort()
+        """Sort tables in dependency order (cached, and persisted with order_cache_dir)."""
+        if self._topological_sort_cache is None:
+            # Once the graph is in memory sorting it is cheaper than a fingerprint query
+            path = self._order_cache_path() if self._dependency_graph_cache is None else None
+            order = self._read_order_file(path) if path is not None else None
+            if order is None:
+                order = self.get_dependency_graph().topological_sort()
+                if path is not None:
+                    self._write_order_file(path, order)
+            self._topological_sort_cache = order
+        return list(self._topological_sort_cache)
+
+    @staticmethod
+    def _read_order_file(path: Path) -> list[str] | None:
+        """Read a persisted order, or None if it is missing, empty or truncated."""
+        try:
+            text = path.read_text()
+        except OSError:
+            return None
+        # Every table is written with a trailing newline
+        if not text.endswith("\n"):
+            return None
+        return text.splitlines()
+
+    @staticmethod
+    def _write_order_file(path: Path, order: list[str]) -> None:
+        """Persist an order atomically; failures only cost the cache."""
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = Path(tmp.name)
+                tmp.write("".join(f"{table}\n" for table in order))
+            tmp_path.replace(path)
+        except OSError:
+            logger.debug("Could not persist table order %s", path, exc_info=True)
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
 
     def clear_cache(self) -> None:
         """Clear cached introspection data."""
         self._table_cache.clear()
+        self._table_names = None
         self._dependency_graph_cache = None
+        self._topological_sort_cache = None
+        self.cache_version += 1
+
+    def invalidate(self, table_name: str) -> None:
+        """
+        Drop cached metadata for one table after DDL on it.
+
+        The table list, dependency graph and topological order are dropped
+        too, since the table's foreign keys may have changed. Other tables
+        keep their cached TableInfo: the next lookup reloads the schema in
+        one round-trip and fills in only what is missing.
+        """
+        self._table_cache.pop(table_name, None)
+        self._table_names = None
+        self._dependency_graph_cache = None
+        self._topological_sort_cache = None
+        self.cache_version += 1
 
 
 class MockIntrospector:
@@ -415,6 +662,10 @@ class MockIntrospector:
     def __init__(self):
         """Initialize with empty schema registry."""
         self._schemas: dict[str, TableInfo] = {}
+        self._dependency_graph_cache: DependencyGraph | None = None
+        self._topological_sort_cache: list[str] | None = None
+        # Bumped by set_table_schema() so holders of derived data know to drop it
+        self.cache_version = 0
 
     def set_table_schema(self, table_name: str, table_info: TableInfo) -> None:
         """
@@ -430,6 +681,9 @@ class MockIntrospector:
             >>> introspector.set_table_schema("users", table_info)
         """
         self._schemas[table_name] = table_info
+        self._dependency_graph_cache = None
+        self._topological_sort_cache = None
+        self.cache_version += 1
 
     def get_table_info(self, table_name: str) -> TableInfo:
         """
@@ -453,11 +707,14 @@ class MockIntrospector:
 
     def get_dependency_graph(self) -> DependencyGraph:
         """
-        Get dependency graph for set tables.
+        Get dependency graph for set tables (cached until the next set_table_schema).
 
         Returns:
             DependencyGraph with FK relationships
         """
+        if self._dependency_graph_cache is not None:
+            return self._dependency_graph_cache
+
         # Build graph from manually-set schemas
         graph = DependencyGraph()
 
@@ -470,14 +727,16 @@ class MockIntrospector:
                 if not fk.is_self_referencing:
                     graph.add_dependency(table_name, fk.referenced_table, fk_column=fk.column)
 
+        self._dependency_graph_cache = graph
         return graph
 
     def topological_sort(self) -> list[str]:
         """
-        Sort tables in dependency order.
+        Sort tables in dependency order (cached until the next set_table_schema).
 
         Returns:
             List of table names in dependency order
         """
-        graph = self.get_dependency_graph()
-        return graph.topological_sort()
+        if self._topological_sort_cache is None:
+            self._topological_sort_cache = self.get_dependency_graph().topological_sort()
+        return list(self._topological_sort_cache)
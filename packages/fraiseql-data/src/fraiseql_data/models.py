@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from fraiseql_data.generators.groups import ColumnGroup
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnInfo:
     """
     Column metadata from database introspection.
@@ -32,7 +41,7 @@ class ColumnInfo:
     is_identity: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForeignKeyInfo:
     """
     Foreign key relationship metadata.
@@ -50,7 +59,7 @@ class ForeignKeyInfo:
     is_self_referencing: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MultiColumnUniqueConstraint:
     """
     Multi-column UNIQUE constraint metadata.
@@ -64,7 +73,7 @@ class MultiColumnUniqueConstraint:
     constraint_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckConstraint:
     """
     CHECK constraint metadata.
@@ -97,7 +106,15 @@ class TableInfo:
     multi_unique_constraints: list[MultiColumnUniqueConstraint] = field(default_factory=list)
     check_constraints: list[CheckConstraint] = field(default_factory=list)
 
-    @property
+    # TableInfo is not mutated once introspected, so the column lookups below
+    # are computed on first access and then served from the instance dict.
+
+    @cached_property
+    def _column_names(self) -> frozenset[str]:
+        """Names of all columns, for O(1) membership checks."""
+        return frozenset(c.name for c in self.columns)
+
+    @cached_property
     def is_trinity(self) -> bool:
         """
         Check if table follows Trinity pattern.
@@ -105,13 +122,10 @@ class TableInfo:
         Returns:
             True if table has pk_* (INTEGER IDENTITY), id (UUID), identifier (TEXT)
         """
-        col_names = {c.name for c in self.columns}
         has_pk = any(c.name.startswith("pk_") and c.is_primary_key for c in self.columns)
-        has_id = "id" in col_names
-        has_identifier = "identifier" in col_names
-        return has_pk and has_id and has_identifier
+        return has_pk and "id" in self._column_names and "identifier" in self._column_names
 
-    @property
+    @cached_property
     def pk_column(self) -> str | None:
         """
         Get primary key column name.
@@ -119,12 +133,9 @@ class TableInfo:
         Returns:
             Primary key column name or None if no PK found
         """
-        for col in self.columns:
-            if col.is_primary_key:
-                return col.name
-        return None
+        return next((col.name for col in self.columns if col.is_primary_key), None)
 
-    @property
+    @cached_property
     def id_column(self) -> str | None:
         """
         Get UUID id column name (Trinity pattern).
@@ -132,11 +143,9 @@ class TableInfo:
         Returns:
             'id' if exists, None otherwise
         """
-        if "id" in {c.name for c in self.columns}:
-            return "id"
-        return None
+        return "id" if "id" in self._column_names else None
 
-    @property
+    @cached_property
     def identifier_column(self) -> str | None:
         """
         Get identifier column name (Trinity pattern).
@@ -144,9 +153,7 @@ class TableInfo:
         Returns:
             'identifier' if exists, None otherwise
         """
-        if "identifier" in {c.name for c in self.columns}:
-            return "identifier"
-        return None
+        return "identifier" if "identifier" in self._column_names else None
 
     def get_self_referencing_fks(self) -> list[ForeignKeyInfo]:
         """
@@ -173,7 +180,7 @@ class TableInfo:
         return [fk for fk in self.foreign_keys if fk.is_self_referencing]
 
 
-@dataclass
+@dataclass(slots=True)
 class SeedRow:
     """
     A single row of seed data with attribute access.
@@ -183,6 +190,9 @@ class SeedRow:
         row.id              # Access UUID
         row.name            # Access name column
 
+    Rows are slotted so that large seed sets do not pay for a per-row
+    ``__dict__`` on top of the column dict.
+
     Attributes:
         _data: Raw column data dict
     """
@@ -202,11 +212,14 @@ class SeedRow:
         Raises:
             AttributeError: If column doesn't exist
         """
-        if name.startswith("_"):
+        # Only reached for _data itself while it is unset (copy/pickle); guard
+        # it so the lookup below cannot recurse
+        if name == "_data":
             raise AttributeError(f"No attribute '{name}'")
-        if name in self._data:
+        try:
             return self._data[name]
-        raise AttributeError(f"No column '{name}' in seed data")
+        except KeyError:
+            raise AttributeError(f"No column '{name}' in seed data") from None
 
 
 class Seeds:
@@ -229,7 +242,8 @@ class Seeds:
             table_name: Table name
             rows: List of row dicts with column data
         """
-        self._tables[table_name] = [SeedRow(_data=row) for row in rows]
+        # Positional construction via map() skips keyword-argument handling per row
+        self._tables[table_name] = list(map(SeedRow, rows))
 
     def __getattr__(self, name: str) -> list[SeedRow]:
         """
@@ -244,11 +258,31 @@ class Seeds:
         Raises:
             AttributeError: If table doesn't exist in seeds
         """
-        if name.startswith("_"):
+        # Only reached for _tables itself while it is unset (copy/pickle)
+        if name == "_tables":
             raise AttributeError(f"No attribute '{name}'")
-        if name in self._tables:
+        try:
             return self._tables[name]
-        raise AttributeError(f"No table '{name}' in seeds")
+        except KeyError:
+            raise AttributeError(f"No table '{name}' in seeds") from None
+
+    def __getitem__(self, table_name: str) -> list[SeedRow]:
+        """
+        Look up a table by name.
+
+        Prefer this over attribute access when the table name is computed
+        at runtime or in loops over many tables.
+
+        Args:
+            table_name: Table name
+
+        Returns:
+            List of SeedRow objects for the table
+
+        Raises:
+            KeyError: If table doesn't exist in seeds
+        """
+        return self._tables[table_name]
 
     @classmethod
     def from_json(cls, file_path: Any | None = None, json_str: str | None = None) -> Seeds:
@@ -280,11 +314,19 @@ class Seeds:
         from pathlib import Path
         from uuid import UUID
 
+        def loads(raw: str | bytes) -> Any:
+            # orjson rejects NaN/Infinity and ints beyond 64 bits, which
+            # to_json can write; the stdlib parser accepts them
+            if ORJSON_AVAILABLE:
+                with suppress(orjson.JSONDecodeError):
+                    return orjson.loads(raw)
+            return json.loads(raw)
+
         if file_path is not None:
             path = Path(file_path)
-            data = json.loads(path.read_text())
+            data = loads(path.read_bytes())
         elif json_str is not None:
-            data = json.loads(json_str)
+            data = loads(json_str)
         else:
             raise ValueError("Must provide either file_path or json_str")
 
@@ -331,8 +373,7 @@ class Seeds:
 
         seeds = cls()
         for table_name, rows_data in data.items():
-            rows = [SeedRow(_data=convert_types(row_dict)) for row_dict in rows_data]
-            seeds._tables[table_name] = rows
+            seeds.add_table(table_name, [convert_types(row_dict) for row_dict in rows_data])
 
         return seeds
 
@@ -356,16 +397,65 @@ class Seeds:
         from pathlib import Path
 
         seeds = cls()
-        rows = []
 
         path = Path(file_path)
         with path.open("r", newline="") as f:
-            reader = csv.DictReader(f)
-            rows.extend(SeedRow(_data=row_dict) for row_dict in reader)
+            # csv.reader + zip avoids DictReader's per-row Python overhead;
+            # ragged rows are filled the way DictReader would
+            reader = csv.reader(f)
+            header = next(reader, [])
+            width = len(header)
+            rows = [
+                dict(zip(header, values, strict=True))
+                if len(values) == width
+                else _ragged_csv_row(header, values)
+                for values in reader
+                if values
+            ]
+        seeds.add_table(table_name, rows)
 
-        seeds._tables[table_name] = rows
         return seeds
 
+    @classmethod
+    def from_dict(cls, data: dict[str, list[dict[str, Any]]]) -> Seeds:
+        """
+        Build seed data from plain row dicts, without any serialization.
+
+        Values are used as given (no type conversion) and the row dicts are
+        not copied.
+
+        Args:
+            data: Table name → list of row dicts (e.g. from to_dict())
+
+        Returns:
+            Seeds object wrapping the rows
+
+        Example:
+            >>> copy = Seeds.from_dict(seeds.to_dict())
+        """
+        seeds = cls()
+        for table_name, rows in data.items():
+            seeds.add_table(table_name, rows)
+        return seeds
+
+    def to_dict(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Export seed data as plain row dicts, keeping Python types.
+
+        Each row is a shallow copy, so the result can be changed without
+        affecting these seeds.
+
+        Returns:
+            Table name → list of row dicts
+
+        Example:
+            >>> seeds.to_dict()["tb_manufacturer"][0]["name"]
+        """
+        return {
+            table_name: [row._data.copy() for row in rows]
+            for table_name, rows in self._tables.items()
+        }
+
     def to_json(self, file_path: Any | None = None, indent: int = 2) -> str | None:
         """
         Export seed data to JSON format.
@@ -397,7 +487,7 @@ class Seeds:
 
         if file_path:
             path = Path(file_path)
-            path.write_text(json_str)
+            path.write_text(json_str, encoding="utf-8")
             return None
 
         return json_str
@@ -432,16 +522,23 @@ class Seeds:
         path = Path(file_path)
         with path.open("w", newline="") as f:
             fieldnames = list(rows[0]._data.keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            # csv.writer stringifies values itself and writes None as ""
+            writer.writerows([row._data.get(k) for k in fieldnames] for row in rows)
 
-            for row in rows:
-                # Convert all values to strings for CSV
-                csv_row = {k: str(v) if v is not None else "" for k, v in row._data.items()}
-                writer.writerow(csv_row)
 
+def _ragged_csv_row(header: list[str], values: list[str]) -> dict[Any, Any]:
+    """Map a CSV row whose length differs from the header, like csv.DictReader."""
+    row: dict[Any, Any] = dict(zip(header, values, strict=False))
+    if len(values) > len(header):
+        row[None] = values[len(header) :]
+    else:
+        row.update(dict.fromkeys(header[len(values) :]))
+    return row
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SeedPlan:
     """
     Plan for generating seed data for a single table.
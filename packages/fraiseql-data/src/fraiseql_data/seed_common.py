@@ -9,13 +9,118 @@ Seed common eliminates UUID collisions and provides clear separation between:
 - Generated data (instances 1,000,000+): Runtime generation
 """
 
+import copy
+import datetime
+import hashlib
+import io
+import json
 import logging
 import os
+import pickle
+import tempfile
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import yaml
+
+from fraiseql_data.sql_parser import parse_seed_sql
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# safe_load always uses the pure-Python SafeLoader; prefer the libyaml one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# The only classes SafeLoader builds besides plain containers and scalars
+_PICKLE_ALLOWED = {
+    ("datetime", name): getattr(datetime, name)
+    for name in ("date", "datetime", "time", "timedelta", "timezone")
+}
+
+
+class _ParseCacheUnpickler(pickle.Unpickler):
+    """Unpickler restricted to the data types a safe YAML parse can produce."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        try:
+            return _PICKLE_ALLOWED[module, name]
+        except KeyError:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed") from None
+
+
+@lru_cache(maxsize=128)
+def _parse_config_file(path: str, fmt: str, mtime_ns: int, size: int) -> Any:  # noqa: ARG001
+    """Parse a YAML or JSON seed common file.
+
+    Cached per file version: mtime and size are part of the key, so an
+    edited file is parsed again. If FRAISEQL_PARSE_CACHE_DIR is set, parsed
+    YAML is also persisted there as a pickle keyed by the file's content, so
+    later processes skip the YAML parser for unchanged files. Cache files are
+    written atomically and read back with an unpickler that only accepts the
+    datetime types SafeLoader produces; an unreadable cache file is ignored
+    and the YAML parsed again. The directory should still be writable only by
+    trusted users.
+    """
+    if fmt == "json":
+        raw = Path(path).read_bytes()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    raw = Path(path).read_bytes()
+    cache_dir = os.getenv("FRAISEQL_PARSE_CACHE_DIR")
+    if not cache_dir:
+        return yaml.load(raw, Loader=_YAML_LOADER)
+
+    # Persisted parse: one pickle per source file, named by a hash of its content
+    source_key = hashlib.blake2b(str(Path(path).resolve()).encode(), digest_size=8).hexdigest()
+    content_key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = Path(cache_dir) / f"{source_key}.{content_key}.pkl"
+    try:
+        return _ParseCacheUnpickler(io.BytesIO(cache_path.read_bytes())).load()
+    except FileNotFoundError:
+        pass
+    except Exception:  # a damaged pickle can raise almost anything
+        logger.debug("Ignoring unreadable parse cache %s", cache_path)
+
+    config = yaml.load(raw, Loader=_YAML_LOADER)
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_path.parent.glob(f"{source_key}.*.pkl"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        # Write under a temporary name and rename, so concurrent readers never
+        # see a partially written file
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f".{source_key}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(pickle.dumps(config, protocol=5))
+        tmp_path.replace(cache_path)
+    except OSError:
+        # The cache is only an optimization; the parsed config is still good
+        logger.debug("Could not persist parse cache %s", cache_path, exc_info=True)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+    return config
+
+
+def _load_config_file(path: Path, fmt: str) -> Any:
+    """Return a private copy of the parsed config, reusing earlier parses."""
+    st = path.stat()
+    # Deep copy: explicit rows end up in SeedCommon._data, which callers may mutate
+    return copy.deepcopy(_parse_config_file(str(path), fmt, st.st_mtime_ns, st.st_size))
+
 
 class SeedCommonValidationError(Exception):
     """Raised when seed common validation fails."""
@@ -53,6 +158,8 @@ class SeedCommon:
         >>> 1001  # Test data starts after seed common
     """
 
+    __slots__ = ("_data", "_instance_offsets", "_offsets_view")
+
     # Instance range constants
     SEED_COMMON_MAX = 1_000
     TEST_DATA_START = 1_001
@@ -75,7 +182,9 @@ class SeedCommon:
             SeedCommonValidationError: If instance count exceeds SEED_COMMON_MAX
         """
         self._instance_offsets = instance_offsets
-        self._data = data or {}
+        self._offsets_view = MappingProxyType(instance_offsets)
+        # Tuples: get_data() hands rows out without a defensive copy
+        self._data = {table: tuple(rows) for table, rows in (data or {}).items()}
 
         # Validate instance counts don't exceed max
         for table, count in instance_offsets.items():
@@ -171,11 +280,7 @@ class SeedCommon:
         Example:
             >>> common = SeedCommon.from_yaml("db/seed_common.yaml")
         """
-        import yaml
-
-        path = Path(path)
-        with path.open() as f:
-            config = yaml.safe_load(f)
+        config = _load_config_file(Path(path), "yaml")
 
         # Handle Format 1: baseline counts
         if "baseline" in config:
@@ -210,11 +315,7 @@ class SeedCommon:
         Example:
             >>> common = SeedCommon.from_json("db/seed_common.json")
         """
-        import json
-
-        path = Path(path)
-        with path.open() as f:
-            config = json.load(f)
+        config = _load_config_file(Path(path), "json")
 
         # Handle Format 1: baseline counts
         if "baseline" in config:
@@ -250,30 +351,38 @@ class SeedCommon:
         Example:
             >>> common = SeedCommon.from_sql("db/1_seed_common/")
         """
-        from fraiseql_data.sql_parser import parse_seed_sql
-
-        directory = Path(directory)
         offsets = {}
 
-        for sql_file in sorted(directory.glob("*.sql")):
+        # scandir yields names without building a Path or stat per entry
+        with os.scandir(directory) as entries:
+            sql_files = sorted(
+                (e.path for e in entries if e.name.endswith(".sql") and e.is_file()),
+                key=os.path.basename,
+            )
+
+        for sql_file in sql_files:
             tables = parse_seed_sql(sql_file)
             for table, count in tables.items():
-                offsets[table] = max(offsets.get(table, 0), count)
+                if count > offsets.get(table, 0):
+                    offsets[table] = count
 
         return cls(instance_offsets=offsets, data=None)
 
-    def get_instance_offsets(self) -> dict[str, int]:
+    def get_instance_offsets(self) -> Mapping[str, int]:
         """
         Get instance offset per table (max instance in seed common).
 
+        The result is a read-only view, not a copy; use dict(...) on it
+        if you need a mutable mapping.
+
         Returns:
-            Dict mapping table name to max instance count
+            Read-only mapping of table name to max instance count
 
         Example:
             >>> common.get_instance_offsets()
             {'tb_organization': 5, 'tb_machine': 10}
         """
-        return self._instance_offsets.copy()
+        return self._offsets_view
 
     def get_instance_start(self, table: str) -> int:
         """
@@ -318,21 +427,63 @@ class SeedCommon:
         offset = self._instance_offsets.get(table, 0)
         return 1 <= instance <= offset
 
-    def get_data(self, table: str) -> list[dict[str, Any]]:
+    def get_instance_starts(self, tables: Iterable[str]) -> dict[str, int]:
+        """
+        Get starting instance numbers for several tables at once.
+
+        Args:
+            tables: Table names
+
+        Returns:
+            Dict mapping each table to its get_instance_start() value
+
+        Example:
+            >>> common.get_instance_starts(["tb_organization", "tb_machine"])
+            {'tb_organization': 1001, 'tb_machine': 1001}
+        """
+        offsets = self._instance_offsets
+        start = self.TEST_DATA_START
+        return {table: max(start, offsets.get(table, 0) + 1) for table in tables}
+
+    def is_reserved_bulk(self, table: str, instances: Iterable[int]) -> list[bool]:
+        """
+        Check many instance numbers of one table against seed common.
+
+        Equivalent to calling is_reserved() per instance, with the table's
+        offset looked up once.
+
+        Args:
+            table: Table name
+            instances: Instance numbers to check
+
+        Returns:
+            One flag per instance, True where it is reserved
+
+        Example:
+            >>> common.is_reserved_bulk("tb_organization", [3, 1001])
+            [True, False]
+        """
+        offset = self._instance_offsets.get(table, 0)
+        return [1 <= instance <= offset for instance in instances]
+
+    def get_data(self, table: str) -> tuple[dict[str, Any], ...]:
         """
         Get explicit seed data for table (if defined).
 
+        The stored rows are returned without copying; treat the row dicts
+        as read-only.
+
         Args:
             table: Table name
 
         Returns:
-            List of row dicts, or empty list if no explicit data
+            Tuple of row dicts, or empty tuple if no explicit data
 
         Example:
             >>> common.get_data("tb_organization")
-            [{'identifier': 'org-1', 'name': 'Org 1'}, ...]
+            ({'identifier': 'org-1', 'name': 'Org 1'}, ...)
         """
-        return self._data.get(table, [])
+        return self._data.get(table, ())
 
     def has_explicit_data(self, table: str) -> bool:
         """
@@ -360,6 +511,9 @@ class SeedCommon:
         - FK values within valid range
         - Topological ordering possible (no circular dependencies)
 
+        Baseline-only seed common (Format 1) has no explicit rows to check,
+        so it validates trivially without touching the introspector.
+
         Args:
             introspector: SchemaIntrospector for FK information
 
@@ -371,6 +525,9 @@ class SeedCommon:
             >>> if errors:
             ...     raise SeedCommonValidationError("\\n".join(errors))
         """
+        if not self._data:
+            return []
+
         errors = []
 
         # Get dependency graph
@@ -398,34 +555,57 @@ class SeedCommon:
                     f"exceeds seed common maximum {self.SEED_COMMON_MAX}"
                 )
 
-            # Validate FK references
-            for i, row in enumerate(rows):
-                instance = i + 1
-
-                for fk in table_info.foreign_keys:
-                    if fk.column not in row:
-                        continue
-
-                    fk_value = row[fk.column]
-                    ref_table = fk.referenced_table
-
-                    # Check referenced table exists in seed common
-                    if ref_table not in self._data:
-                        errors.append(
-                            f"Table '{table}' row {instance}: "
-                            f"FK '{fk.column}' references '{ref_table}' "
-                            f"which is not defined in seed common"
-                        )
-                        continue
-
-                    # Check referenced instance exists
-                    ref_count = len(self._data[ref_table])
-                    if fk_value < 1 or fk_value > ref_count:
-                        errors.append(
-                            f"Table '{table}' row {instance}: "
-                            f"FK '{fk.column}' = {fk_value} references "
-                            f"'{ref_table}' instance {fk_value}, but only "
-                            f"{ref_count} instances exist (valid: 1-{ref_count})"
-                        )
+            # Validate FK references; referenced row counts are the same for every row
+            fk_checks = [
+                (
+                    fk.column,
+                    fk.referenced_table,
+                    len(self._data[fk.referenced_table])
+                    if fk.referenced_table in self._data
+                    else None,
+                )
+                for fk in table_info.foreign_keys
+            ]
+            if not fk_checks:
+                continue
+
+            # Column-wise scan: C-level min/max clear a fully valid FK column,
+            # only columns with a problem are walked row by row
+            invalid: list[tuple[int, int]] = []  # (instance, index into fk_checks)
+            for pos, (column, _ref_table, ref_count) in enumerate(fk_checks):
+                values = [row.get(column) for row in rows]
+                present = [v for v in values if v is not None]
+                if not present or (
+                    ref_count is not None and min(present) >= 1 and max(present) <= ref_count
+                ):
+                    continue
+                invalid.extend(
+                    (instance, pos)
+                    for instance, fk_value in enumerate(values, start=1)
+                    if fk_value is not None
+                    and (ref_count is None or not 1 <= fk_value <= ref_count)
+                )
+
+            # Report in row order, as a row-by-row scan would
+            for instance, pos in sorted(invalid):
+                column, ref_table, ref_count = fk_checks[pos]
+                fk_value = rows[instance - 1][column]
+
+                # Check referenced table exists in seed common
+                if ref_count is None:
+                    errors.append(
+                        f"Table '{table}' row {instance}: "
+                        f"FK '{column}' references '{ref_table}' "
+                        f"which is not defined in seed common"
+                    )
+                    continue
+
+                # Check referenced instance exists
+                errors.append(
+                    f"Table '{table}' row {instance}: "
+                    f"FK '{column}' = {fk_value} references "
+                    f"'{ref_table}' instance {fk_value}, but only "
+                    f"{ref_count} instances exist (valid: 1-{ref_count})"
+                )
 
         return errors
@@ -5,13 +5,22 @@ Trinity pattern UUID instances and build instance count mappings.
 """
 
 import logging
+import mmap
 import re
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Patterns are bytes: files are scanned through mmap without decoding.
 
-def parse_seed_sql(sql_file: Path) -> dict[str, int]:
+# Trinity UUID pattern: 2a6f3c21-0000-4000-8000-{instance:012d}
+_UUID_RE = re.compile(rb"'2a6f3c21-0000-4000-8000-(\d{12})'")
+
+# Matches: INSERT INTO [schema.]table
+_INSERT_RE = re.compile(rb"INSERT\s+INTO\s+(?:(\w+)\.)?(\w+)", re.IGNORECASE)
+
+
+def parse_seed_sql(sql_file: str | Path) -> dict[str, int]:
     """
     Parse SQL file to extract table instance counts.
 
@@ -35,41 +44,31 @@ def parse_seed_sql(sql_file: Path) -> dict[str, int]:
         >>> #   ('2a6f3c21-0000-4000-8000-000000000005', ...);
         >>> # Returns: {'tb_organization': 5}  # Max instance is 5
     """
-    content = sql_file.read_text()
-
-    # Trinity UUID pattern: 2a6f3c21-0000-4000-8000-{instance:012d}
-    uuid_pattern = r"'2a6f3c21-0000-4000-8000-(\d{12})'"
-
-    # Extract INSERT statements
-    # Pattern matches: INSERT INTO [schema.]table
-    insert_pattern = r"INSERT\s+INTO\s+(?:(\w+)\.)?(\w+)"
-
-    tables = {}
-
-    # Find all INSERT statements
-    for match in re.finditer(insert_pattern, content, re.IGNORECASE):
-        # match.group(1) is optional schema (we don't need it)
-        table = match.group(2)
-
-        # Find UUIDs in this INSERT block
-        # Extract block until next INSERT or end of file
-        insert_start = match.start()
-        next_insert = re.search(r"INSERT\s+INTO", content[insert_start + 50 :], re.IGNORECASE)
-
-        if next_insert:
-            insert_block = content[insert_start : insert_start + 50 + next_insert.start()]
-        else:
-            insert_block = content[insert_start:]
-
-        # Extract all instance numbers from UUIDs
-        instances = []
-        for uuid_match in re.finditer(uuid_pattern, insert_block):
-            instance = int(uuid_match.group(1))
-            instances.append(instance)
-
-        if instances:
-            max_instance = max(instances)
-            tables[table] = max(tables.get(table, 0), max_instance)
-            logger.debug(f"Found {len(instances)} instances in '{table}' (max: {max_instance})")
+    path = Path(sql_file)
+    tables: dict[str, int] = {}
+
+    # mmap cannot map an empty file
+    if path.stat().st_size == 0:
+        return tables
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        # One pass over the INSERT statements; each block runs from its INSERT
+        # to the next one (or end of file) and is scanned in place
+        matches = list(_INSERT_RE.finditer(content))
+        ends = [m.start() for m in matches[1:]] + [len(content)]
+
+        for match, block_end in zip(matches, ends, strict=True):
+            # match.group(1) is optional schema (we don't need it)
+            table = match.group(2).decode()
+
+            # Instance numbers are zero-padded to 12 digits, so the greatest
+            # digit string is the greatest instance; findall and max stay in C
+            instances = _UUID_RE.findall(content, match.start(), block_end)
+
+            if instances:
+                max_instance = int(max(instances))
+                if max_instance > tables.get(table, 0):
+                    tables[table] = max_instance
+                logger.debug(f"Found {len(instances)} instances in '{table}' (max: {max_instance})")
 
     return tables
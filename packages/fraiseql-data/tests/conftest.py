@@ -1,55 +1,83 @@
 """Pytest configuration and shared fixtures."""
 
+import logging
 import os
+import re
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
 
 import psycopg
 import pytest
 from fraiseql_data import SeedBuilder
-from psycopg import Connection
+from fraiseql_data.introspection import SchemaIntrospector
+from psycopg import Connection, Pipeline, sql
 
+# Under pytest-xdist (-n auto) each worker ("gw0", "gw1", ...) gets its own schemas
+_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+_SCHEMA_SUFFIX = f"_{_XDIST_WORKER}" if _XDIST_WORKER else ""
+TEST_SCHEMA = f"test_seed{_SCHEMA_SUFFIX}"
+# TEST_FAST=1 makes exec_ddl create tables UNLOGGED (no WAL writes). Test-only:
+# unlogged tables are truncated after a crash, which seeded test data does not
+# mind. The sample tables stay permanent, since tests create their own tables
+# referencing them and a permanent table may not reference an unlogged one.
+CREATE_TABLE = "CREATE UNLOGGED TABLE" if os.getenv("TEST_FAST") else "CREATE TABLE"
+# Test connections do not wait for the WAL flush on commit
+_CONN_OPTIONS = "-c synchronous_commit=off"
+# One round-trip per-test reset: drop tables other tests added, empty the sample tables
+_RESET_TEST_SCHEMA = f"""
+DO $$
+DECLARE
+    stale text;
+BEGIN
+    SELECT string_agg(format('%I.%I', schemaname, tablename), ', ') INTO stale
+    FROM pg_tables
+    WHERE schemaname = '{TEST_SCHEMA}' AND tablename NOT IN ('tb_manufacturer', 'tb_model');
+    IF stale IS NOT NULL THEN
+        EXECUTE 'DROP TABLE IF EXISTS ' || stale || ' CASCADE';
+    END IF;
+    TRUNCATE {TEST_SCHEMA}.tb_manufacturer, {TEST_SCHEMA}.tb_model RESTART IDENTITY CASCADE;
+END
+$$
+"""
 
-@pytest.fixture
-def db_conn() -> Connection:
-    """
-    Provide a test database connection.
 
-    Uses DATABASE_URL or TEST_DATABASE_URL environment variable if available,
-    otherwise connects to local database.
-    """
-    # Try environment variables first (for CI/CD), then fallback to localhost
-    db_url = os.getenv(
+def _database_url() -> str:
+    """Resolve the test database URL (TEST_DATABASE_URL, DATABASE_URL, localhost)."""
+    return os.getenv(
         "TEST_DATABASE_URL",
         os.getenv("DATABASE_URL", "postgresql://localhost/fraiseql_test"),
     )
 
-    conn = psycopg.connect(db_url, autocommit=False)
 
-    yield conn
+def _pipeline(conn: Connection) -> AbstractContextManager:
+    """Send the enclosed statements in one round-trip where libpq allows it."""
+    return conn.pipeline() if Pipeline.is_supported() else nullcontext()
 
-    # Rollback any changes
-    conn.rollback()
-    conn.close()
 
+def _load_shapes(path: Path) -> dict[str, str]:
+    """Split a fixtures .sql file into its ``-- shape: <name>`` sections."""
+    parts = re.split(r"^-- shape: (\w+)\n", path.read_text(), flags=re.MULTILINE)
+    return dict(zip(parts[1::2], parts[2::2], strict=True))
 
-@pytest.fixture
-def test_schema(db_conn: Connection) -> str:
-    """
-    Create a test schema with sample tables.
 
-    Returns the schema name.
-    """
-    schema_name = "test_seed"
+# Table shapes, read once per session; {{schema}} is filled in per test
+_FIXTURES = Path(__file__).parent / "fixtures"
+_AUTO_DEPS_SHAPES = _load_shapes(_FIXTURES / "auto_deps_schemas.sql")
+_CHECK_CONSTRAINT_SHAPES = _load_shapes(_FIXTURES / "check_constraint_schemas.sql")
+
 
-    with db_conn.cursor() as cur:
+def _create_test_schema(conn: Connection) -> None:
+    """(Re)create the test schema with its sample tables (autocommit connection)."""
+    with _pipeline(conn), conn.cursor() as cur:
         # Drop if exists
-        cur.execute(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE")
+        cur.execute(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE")
 
         # Create schema
-        cur.execute(f"CREATE SCHEMA {schema_name}")
+        cur.execute(f"CREATE SCHEMA {TEST_SCHEMA}")
 
         # Create simple test table (Trinity pattern)
         cur.execute(f"""
-            CREATE TABLE {schema_name}.tb_manufacturer (
+            CREATE TABLE {TEST_SCHEMA}.tb_manufacturer (
                 pk_manufacturer INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
                 id UUID NOT NULL DEFAULT gen_random_uuid() UNIQUE,
                 identifier TEXT NOT NULL UNIQUE,
@@ -62,27 +90,233 @@ def test_schema(db_conn: Connection) -> str:
         # Create table with FK (Trinity pattern)
         cur.execute(
             f"""
-            CREATE TABLE {schema_name}.tb_model (
+            CREATE TABLE {TEST_SCHEMA}.tb_model (
                 pk_model INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
                 id UUID NOT NULL DEFAULT gen_random_uuid() UNIQUE,
                 identifier TEXT NOT NULL UNIQUE,
                 name TEXT NOT NULL,
                 description TEXT,
                 fk_manufacturer INTEGER NOT NULL
-                    REFERENCES {schema_name}.tb_manufacturer(pk_manufacturer),
+                    REFERENCES {TEST_SCHEMA}.tb_manufacturer(pk_manufacturer),
                 created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
             )
         """
         )
 
-        db_conn.commit()
 
-    yield schema_name
+@pytest.fixture
+def db_conn() -> Connection:
+    """
+    Provide a test database connection.
+
+    Uses DATABASE_URL or TEST_DATABASE_URL environment variable if available,
+    otherwise connects to local database.
+    """
+    # Try environment variables first (for CI/CD), then fallback to localhost
+    conn = psycopg.connect(_database_url(), autocommit=False, options=_CONN_OPTIONS)
+
+    yield conn
+
+    # Rollback any changes
+    conn.rollback()
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def schema_suffix() -> str:
+    """Suffix for schema names created by tests, unique per xdist worker."""
+    return _SCHEMA_SUFFIX
+
+
+@pytest.fixture(scope="session")
+def ddl_conn() -> Connection:
+    """
+    Provide a session-wide autocommit connection for test DDL.
+
+    Each statement commits on its own, so schema setup skips the BEGIN and
+    COMMIT round-trips of a transactional connection. A lock timeout turns
+    a wait on a lock held by an open ``db_conn`` transaction into an error.
+    """
+    with psycopg.connect(
+        _database_url(), autocommit=True, options=f"{_CONN_OPTIONS} -c lock_timeout=10s"
+    ) as conn:
+        yield conn
+
+
+@pytest.fixture(scope="session")
+def _test_schema_session(ddl_conn: Connection) -> str:
+    """Create the test schema once per session and drop it at the end."""
+    _create_test_schema(ddl_conn)
+
+    yield TEST_SCHEMA
+
+    ddl_conn.execute(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE")
+
+
+@pytest.fixture
+def test_schema(request, ddl_conn: Connection, _test_schema_session: str) -> str:
+    """
+    Provide the test schema with sample tables, empty and unmodified.
+
+    The schema is created once per session. Builder backends commit, so a
+    per-test SAVEPOINT cannot isolate tests; instead each test starts by
+    dropping tables left behind by the previous one and truncating the
+    sample tables (identities restarted), in a single server-side DO block.
+    If a sample table went missing the schema is rebuilt.
+
+    The reset only covers tables. A test that needs a schema without other
+    objects (views, types, sequences, altered sample tables) left by earlier
+    tests opts in to a full rebuild with ``@pytest.mark.fresh_schema``.
+
+    Returns the schema name.
+    """
+    if request.node.get_closest_marker("fresh_schema") is not None:
+        _create_test_schema(ddl_conn)
+        return _test_schema_session
+
+    try:
+        ddl_conn.execute(_RESET_TEST_SCHEMA)
+    except (psycopg.errors.UndefinedTable, psycopg.errors.InvalidSchemaName):
+        _create_test_schema(ddl_conn)
+
+    return _test_schema_session
+
+
+@pytest.fixture
+def exec_ddl(ddl_conn: Connection):
+    """
+    Run DDL statements against the test database, committed on return.
+
+    The statements are joined into one multi-statement string on the
+    autocommit ``ddl_conn`` (an implicit transaction), so a whole test
+    schema is created in a single round-trip. ``CREATE TABLE`` becomes
+    ``CREATE UNLOGGED TABLE`` under TEST_FAST (see ``CREATE_TABLE``).
+    """
+
+    def run(*statements: str) -> None:
+        ddl_conn.execute(";\n".join(statements).replace("CREATE TABLE", CREATE_TABLE))
+
+    return run
+
+
+@pytest.fixture
+def row_counts(db_conn: Connection, test_schema: str):
+    """
+    Count the rows of several test schema tables in one round-trip.
+
+    Returns a function taking table names and returning ``{table: count}``,
+    read with a single ``SELECT (SELECT count(*) ...), ...`` on ``db_conn``.
+    """
+
+    def count(*tables: str) -> dict[str, int]:
+        query = sql.SQL("SELECT {}").format(
+            sql.SQL(", ").join(
+                sql.SQL("(SELECT count(*) FROM {})").format(sql.Identifier(test_schema, table))
+                for table in tables
+            )
+        )
+        with db_conn.cursor() as cur:
+            cur.execute(query)
+            return dict(zip(tables, cur.fetchone(), strict=True))
+
+    return count
+
+
+@pytest.fixture
+def schema_introspector(db_conn: Connection, test_schema: str) -> SchemaIntrospector:
+    """
+    Provide one SchemaIntrospector for the test schema, to share across builders.
+
+    Pass it as ``SeedBuilder(..., introspector=schema_introspector)`` so the
+    builders of a test load the catalog once. It is function-scoped because
+    the schema is reset per test; metadata is loaded lazily, so DDL run
+    before the first builder call is picked up.
+    """
+    return SchemaIntrospector(db_conn, test_schema)
+
+
+@pytest.fixture
+def auto_deps_shape(test_schema: str, exec_ddl):
+    """
+    Create an auto-deps table shape from ``fixtures/auto_deps_schemas.sql``.
+
+    Returns a function taking the shape name; it runs the shape's DDL in
+    one round-trip and returns the schema name.
+    """
+
+    def load(name: str) -> str:
+        exec_ddl(_AUTO_DEPS_SHAPES[name].replace("{{schema}}", test_schema))
+        return test_schema
+
+    return load
 
-    # Cleanup
-    with db_conn.cursor() as cur:
-        cur.execute(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE")
-        db_conn.commit()
+
+@pytest.fixture
+def check_constraint_shape(test_schema: str, exec_ddl):
+    """
+    Create a CHECK constraint table shape from ``fixtures/check_constraint_schemas.sql``.
+
+    Works like ``auto_deps_shape``: returns a function taking the shape name
+    that creates it in one round-trip and returns the schema name.
+    """
+
+    def load(name: str) -> str:
+        exec_ddl(_CHECK_CONSTRAINT_SHAPES[name].replace("{{schema}}", test_schema))
+        return test_schema
+
+    return load
+
+
+@pytest.fixture
+def machine_allocation_tables(auto_deps_shape) -> str:
+    """Add tb_allocation → tb_machine to the test schema."""
+    return auto_deps_shape("machine_allocation")
+
+
+@pytest.fixture
+def org_machine_allocation_tables(auto_deps_shape) -> str:
+    """Add tb_allocation → tb_machine → tb_organization to the test schema."""
+    return auto_deps_shape("org_machine_allocation")
+
+
+@pytest.fixture
+def org_allocation_tables(auto_deps_shape) -> str:
+    """Add tb_allocation → tb_organization to the test schema."""
+    return auto_deps_shape("org_allocation")
+
+
+@pytest.fixture
+def org_allocation_order_tables(auto_deps_shape) -> str:
+    """Add tb_allocation and tb_order, both → tb_organization to the test schema."""
+    return auto_deps_shape("org_allocation_order")
+
+
+class _RecordingHandler(logging.Handler):
+    """Logging handler that keeps every record it receives."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.DEBUG)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture(scope="module")
+def log_capture() -> _RecordingHandler:
+    """
+    Capture fraiseql_data log records for a whole test module.
+
+    A lighter alternative to ``caplog``: the handler is attached once per
+    module instead of per test. Records accumulate across tests, so call
+    ``log_capture.records.clear()`` before the code under test; match on
+    ``record.getMessage()``.
+    """
+    handler = _RecordingHandler()
+    logger = logging.getLogger("fraiseql_data")
+    logger.addHandler(handler)
+    yield handler
+    logger.removeHandler(handler)
 
 
 @pytest.fixture
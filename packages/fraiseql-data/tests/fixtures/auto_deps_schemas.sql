@@ -0,0 +1,172 @@
+-- Table shapes for the auto-deps tests (Trinity pattern), loaded by the
+-- auto_deps_shape fixture in conftest.py. Each "-- shape: <name>" section is
+-- sent to the server as one multi-statement execute, with {{schema}} replaced
+-- by the test schema.
+--
+-- Identity sequences use CACHE 1000: each session takes values in blocks, so
+-- bulk COPYs do not update the sequence every few rows. Values still increase
+-- within a session, which is all DirectBackend's read-back of COPYed rows needs.
+
+-- shape: machine_allocation
+-- tb_allocation → tb_machine
+CREATE TABLE {{schema}}.tb_machine (
+    pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_machine INTEGER NOT NULL REFERENCES {{schema}}.tb_machine(pk_machine)
+);
+
+-- shape: org_machine_allocation
+-- tb_allocation → tb_machine → tb_organization
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_machine (
+    pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_machine INTEGER NOT NULL REFERENCES {{schema}}.tb_machine(pk_machine)
+);
+
+-- shape: org_allocation
+-- tb_allocation → tb_organization
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+
+-- shape: org_allocation_order
+-- tb_allocation and tb_order, both → tb_organization
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+CREATE TABLE {{schema}}.tb_order (
+    pk_order INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+
+-- shape: org_location_machine_allocation
+-- tb_allocation → tb_machine → tb_location → tb_organization
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_location (
+    pk_location INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+CREATE TABLE {{schema}}.tb_machine (
+    pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    fk_location INTEGER NOT NULL REFERENCES {{schema}}.tb_location(pk_location)
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_machine INTEGER NOT NULL REFERENCES {{schema}}.tb_machine(pk_machine)
+);
+
+-- shape: multi_path
+-- tb_allocation → tb_machine → tb_organization, tb_allocation → tb_contract → tb_organization
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_machine (
+    pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+CREATE TABLE {{schema}}.tb_contract (
+    pk_contract INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_machine INTEGER NOT NULL REFERENCES {{schema}}.tb_machine(pk_machine),
+    fk_contract INTEGER NOT NULL REFERENCES {{schema}}.tb_contract(pk_contract)
+);
+
+-- shape: self_referencing_category
+-- tb_allocation → tb_category (self-referencing) → tb_organization
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE {{schema}}.tb_category (
+    pk_category INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    parent_category INTEGER REFERENCES {{schema}}.tb_category(pk_category),
+    fk_organization INTEGER NOT NULL REFERENCES {{schema}}.tb_organization(pk_organization)
+);
+CREATE TABLE {{schema}}.tb_allocation (
+    pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    fk_category INTEGER NOT NULL REFERENCES {{schema}}.tb_category(pk_category)
+);
+
+-- shape: organization
+-- tb_organization alone (no foreign keys)
+CREATE TABLE {{schema}}.tb_organization (
+    pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY (CACHE 1000),
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
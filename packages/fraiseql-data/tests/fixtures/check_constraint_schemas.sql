@@ -0,0 +1,79 @@
+-- Table shapes for the CHECK constraint tests (Trinity pattern), loaded by the
+-- check_constraint_shape fixture in conftest.py. Each "-- shape: <name>" section
+-- is sent to the server as one statement, with {{schema}} replaced by the test
+-- schema. Tests reuse table names with different constraints, so each test
+-- creates only its own shape; the per-test schema reset drops it again.
+
+-- shape: item_status_enum
+-- IN list (enum values)
+CREATE TABLE {{schema}}.tb_item (
+    pk_item INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL CHECK (status IN ('active', 'inactive', 'discontinued'))
+);
+
+-- shape: named_item_status_enum
+-- IN list (enum values) next to a free-text column
+CREATE TABLE {{schema}}.tb_item (
+    pk_item INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('active', 'inactive', 'discontinued'))
+);
+
+-- shape: product_positive_price
+-- Single lower bound
+CREATE TABLE {{schema}}.tb_product (
+    pk_product INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    price NUMERIC NOT NULL CHECK (price > 0)
+);
+
+-- shape: product_price_stock_range
+-- Two-sided and one-sided ranges on nullable columns
+CREATE TABLE {{schema}}.tb_product (
+    pk_product INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    price NUMERIC CHECK (price > 0 AND price < 10000),
+    stock INTEGER CHECK (stock >= 0)
+);
+
+-- shape: product_price_status
+-- Two-sided range plus IN list, both NOT NULL
+CREATE TABLE {{schema}}.tb_product (
+    pk_product INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    price NUMERIC NOT NULL CHECK (price > 0 AND price < 10000),
+    status TEXT NOT NULL CHECK (status IN ('active', 'inactive'))
+);
+
+-- shape: range_operators
+-- >, <= and BETWEEN
+CREATE TABLE {{schema}}.tb_range_test (
+    pk_test INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    score NUMERIC CHECK (score > 50),
+    level INTEGER CHECK (level <= 10),
+    rating NUMERIC CHECK (rating BETWEEN 1.0 AND 5.0)
+);
+
+-- shape: order_total_expression
+-- Cross-column expression the generator cannot parse
+CREATE TABLE {{schema}}.tb_order (
+    pk_order INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    id UUID NOT NULL UNIQUE,
+    identifier TEXT NOT NULL UNIQUE,
+    quantity INTEGER NOT NULL,
+    price NUMERIC NOT NULL,
+    total NUMERIC NOT NULL CHECK (total = price * quantity)
+);
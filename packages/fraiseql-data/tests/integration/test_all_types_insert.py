@@ -16,9 +16,9 @@ from psycopg import Connection
 
 
 @pytest.fixture
-def all_types_schema(db_conn: Connection) -> str:
+def all_types_schema(db_conn: Connection, schema_suffix: str) -> str:
     """Create a schema with a table covering every supported column type."""
-    schema = "test_all_types"
+    schema = f"test_all_types{schema_suffix}"
 
     with db_conn.cursor() as cur:
         cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
@@ -87,9 +87,9 @@ def all_types_schema(db_conn: Connection) -> str:
 
 
 @pytest.fixture
-def diverse_fk_schema(db_conn: Connection) -> str:
+def diverse_fk_schema(db_conn: Connection, schema_suffix: str) -> str:
     """Schema with FK chain and diverse column types on the child table."""
-    schema = "test_diverse_fk"
+    schema = f"test_diverse_fk{schema_suffix}"
 
     with db_conn.cursor() as cur:
         cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
@@ -272,9 +272,9 @@ class TestEdgeCases:
     """Edge cases: nullable columns, defaults, identity skip."""
 
     @pytest.fixture
-    def nullable_schema(self, db_conn: Connection) -> str:
+    def nullable_schema(self, db_conn: Connection, schema_suffix: str) -> str:
         """Schema with nullable UUID and JSONB columns."""
-        schema = "test_nullable"
+        schema = f"test_nullable{schema_suffix}"
 
         with db_conn.cursor() as cur:
             cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
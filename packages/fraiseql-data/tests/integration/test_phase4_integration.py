@@ -48,7 +48,7 @@ def test_csv_export_import(db_conn, test_schema):
         assert imported.tb_manufacturer[0].name == original.tb_manufacturer[0].name
 
 
-def test_batch_operations_workflow(db_conn, test_schema):
+def test_batch_operations_workflow(db_conn, test_schema, row_counts):
     """Test batch API with conditional operations."""
     builder = SeedBuilder(db_conn, schema=test_schema)
 
@@ -61,12 +61,7 @@ def test_batch_operations_workflow(db_conn, test_schema):
         batch.when(include_models).add("tb_model", count=50)
 
     # Verify only manufacturers were added
-    with db_conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_manufacturer")
-        assert cur.fetchone()[0] == 20
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_model")
-        assert cur.fetchone()[0] == 0
+    assert row_counts("tb_manufacturer", "tb_model") == {"tb_manufacturer": 20, "tb_model": 0}
 
 
 def test_check_constraint_auto_satisfaction(db_conn, test_schema):
@@ -104,7 +99,7 @@ def test_insert_imported_data(db_conn, test_schema):
     # Generate and export
     builder = SeedBuilder(db_conn, schema=test_schema)
     original = builder.add("tb_manufacturer", count=30).execute()
-    json_str = original.to_json()
+    exported = original.to_dict()
 
     # Clear table
     with db_conn.cursor() as cur:
@@ -112,7 +107,7 @@ def test_insert_imported_data(db_conn, test_schema):
         db_conn.commit()
 
     # Import and re-insert
-    imported = Seeds.from_json(json_str=json_str)
+    imported = Seeds.from_dict(exported)
     builder2 = SeedBuilder(db_conn, schema=test_schema)
     result = builder2.insert_seeds(imported)
 
@@ -1,280 +1,92 @@
 """Test basic auto-dependency resolution functionality."""
-# ruff: noqa: E501
 
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from fraiseql_data import SeedBuilder
+from fraiseql_data.auto_deps import AutoDependencyResolver
+from fraiseql_data.backends.direct import DirectBackend
+from fraiseql_data.exceptions import CircularDependencyError, MissingDependencyError
+from fraiseql_data.introspection import MockIntrospector
+from fraiseql_data.models import ColumnInfo, ForeignKeyInfo, TableInfo
+from fraiseql_data.seed_common import SeedCommon
+
+
+@dataclass(frozen=True)
+class AutoDepsCase:
+    """Create a table shape, seed ``tb_allocation`` with auto_deps, expect these counts."""
+
+    name: str
+    shape: str
+    count: int
+    auto_deps: bool | dict[str, int]
+    expected: dict[str, int]
+
+
+AUTO_DEPS_CASES = [
+    # allocation → machine
+    AutoDepsCase(
+        "minimal_single_level",
+        "machine_allocation",
+        10,
+        True,
+        {"tb_machine": 1, "tb_allocation": 10},
+    ),
+    # allocation → machine → location → organization
+    AutoDepsCase(
+        "minimal_multi_level",
+        "org_location_machine_allocation",
+        10,
+        True,
+        {"tb_organization": 1, "tb_location": 1, "tb_machine": 1, "tb_allocation": 10},
+    ),
+    # allocation → machine → organization and allocation → contract → organization:
+    # the organization is generated once for both paths
+    AutoDepsCase(
+        "multi_path_deduplication",
+        "multi_path",
+        10,
+        True,
+        {"tb_organization": 1, "tb_machine": 1, "tb_contract": 1, "tb_allocation": 10},
+    ),
+    AutoDepsCase(
+        "explicit_counts",
+        "org_machine_allocation",
+        100,
+        {"tb_organization": 3, "tb_machine": 10},
+        {"tb_organization": 3, "tb_machine": 10, "tb_allocation": 100},
+    ),
+]
+
+
+@pytest.mark.parametrize("case", AUTO_DEPS_CASES, ids=lambda case: case.name)
+def test_auto_deps_generates_dependencies(db_conn, test_schema, auto_deps_shape, case):
+    """Test auto-deps generates each dependency with the expected count and valid FKs."""
+    auto_deps_shape(case.shape)
 
-
-def test_auto_deps_minimal_single_level(db_conn, test_schema):
-    """Test auto-deps with single-level FK (allocation → machine)."""
-    # Create simple dependency: tb_allocation → tb_machine
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
-
-    # Use auto_deps - should auto-generate tb_machine
-    builder = SeedBuilder(db_conn, schema=test_schema)
-    seeds = builder.add("tb_allocation", count=10, auto_deps=True).execute()
-
-    # Verify: 1 machine, 10 allocations
-    assert len(seeds.tb_machine) == 1
-    assert len(seeds.tb_allocation) == 10
-
-    # Verify all allocations reference the machine
-    machine_pk = seeds.tb_machine[0].pk_machine
-    for allocation in seeds.tb_allocation:
-        assert allocation.fk_machine == machine_pk
-
-
-def test_auto_deps_minimal_multi_level(db_conn, test_schema):
-    """Test auto-deps with multi-level FK chain (allocation → machine → location → org)."""
-    # Create 4-level dependency chain
-    with db_conn.cursor() as cur:
-        # Level 1: tb_organization (no deps)
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        # Level 2: tb_location → organization
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_location (
-                pk_location INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-
-        # Level 3: tb_machine → location
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_location INTEGER NOT NULL REFERENCES {test_schema}.tb_location(pk_location)
-            )
-        """
-        )
-
-        # Level 4: tb_allocation → machine
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
-
-    # Use auto_deps - should auto-generate entire chain
     builder = SeedBuilder(db_conn, schema=test_schema)
-    seeds = builder.add("tb_allocation", count=10, auto_deps=True).execute()
-
-    # Verify: 1 of each dependency, 10 allocations
-    assert len(seeds.tb_organization) == 1
-    assert len(seeds.tb_location) == 1
-    assert len(seeds.tb_machine) == 1
-    assert len(seeds.tb_allocation) == 10
-
-    # Verify FK chain
-    org_pk = seeds.tb_organization[0].pk_organization
-    loc_pk = seeds.tb_location[0].pk_location
-    machine_pk = seeds.tb_machine[0].pk_machine
-
-    assert seeds.tb_location[0].fk_organization == org_pk
-    assert seeds.tb_machine[0].fk_location == loc_pk
-    for allocation in seeds.tb_allocation:
-        assert allocation.fk_machine == machine_pk
-
-
-def test_auto_deps_multi_path_deduplication(db_conn, test_schema):
-    """Test auto-deps deduplicates when multiple paths lead to same table."""
-    # Create schema with two paths to tb_organization:
-    # tb_allocation → tb_machine → tb_organization
-    # tb_allocation → tb_contract → tb_organization
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
+    seeds = builder.add("tb_allocation", count=case.count, auto_deps=case.auto_deps).execute()
 
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_contract (
-                pk_contract INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
+    assert {table: len(getattr(seeds, table)) for table in case.expected} == case.expected
 
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine),
-                fk_contract INTEGER NOT NULL REFERENCES {test_schema}.tb_contract(pk_contract)
-            )
-        """
-        )
-        db_conn.commit()
-
-    # Use auto_deps - should deduplicate tb_organization
-    builder = SeedBuilder(db_conn, schema=test_schema)
-    seeds = builder.add("tb_allocation", count=10, auto_deps=True).execute()
-
-    # Verify: 1 organization (deduplicated), 1 machine, 1 contract, 10 allocations
-    assert len(seeds.tb_organization) == 1
-    assert len(seeds.tb_machine) == 1
-    assert len(seeds.tb_contract) == 1
-    assert len(seeds.tb_allocation) == 10
-
-    # Verify both machine and contract reference same organization
-    org_pk = seeds.tb_organization[0].pk_organization
-    assert seeds.tb_machine[0].fk_organization == org_pk
-    assert seeds.tb_contract[0].fk_organization == org_pk
-
-
-def test_auto_deps_with_explicit_counts(db_conn, test_schema):
-    """Test auto-deps with explicit counts for specific dependencies."""
-    # Create dependency chain
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
-
-    # Use auto_deps with explicit counts
-    builder = SeedBuilder(db_conn, schema=test_schema)
-    seeds = builder.add(
-        "tb_allocation",
-        count=100,
-        auto_deps={
-            "tb_organization": 3,  # 3 organizations
-            "tb_machine": 10,  # 10 machines
-        },
-    ).execute()
-
-    # Verify counts
-    assert len(seeds.tb_organization) == 3
-    assert len(seeds.tb_machine) == 10
-    assert len(seeds.tb_allocation) == 100
+    # Every fk_<name> column points at a generated tb_<name> row
+    pks = {
+        table: {row._data[f"pk_{table[3:]}"] for row in getattr(seeds, table)}
+        for table in case.expected
+    }
+    for table in case.expected:
+        for row in getattr(seeds, table):
+            for column, value in row._data.items():
+                if column.startswith("fk_"):
+                    assert value in pks[f"tb_{column[3:]}"]
 
 
+@pytest.mark.usefixtures("org_allocation_tables")
 def test_auto_deps_with_overrides(db_conn, test_schema):
     """Test auto-deps with overrides for auto-generated dependencies."""
-    # Create simple dependency
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-        db_conn.commit()
-
     # Use auto_deps with overrides
     builder = SeedBuilder(db_conn, schema=test_schema)
     seeds = builder.add(
@@ -296,37 +108,13 @@ def test_auto_deps_with_overrides(db_conn, test_schema):
     assert seeds.tb_organization[1].name == "Test Org 2"
 
 
-def test_auto_deps_already_in_plan_manual_wins(db_conn, test_schema, caplog):
+@pytest.mark.usefixtures("org_allocation_tables")
+def test_auto_deps_already_in_plan_manual_wins(db_conn, test_schema, log_capture):
     """Test that manual .add() takes precedence over auto_deps config."""
-    # Create dependency
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-        db_conn.commit()
-
     # Manual add with count=5, then auto_deps with count=2 (different count to trigger warning)
     builder = SeedBuilder(db_conn, schema=test_schema)
 
-    caplog.clear()
+    log_capture.records.clear()
 
     seeds = (
         builder.add("tb_organization", count=5)  # Manual: 5 orgs
@@ -343,55 +131,15 @@ def test_auto_deps_already_in_plan_manual_wins(db_conn, test_schema, caplog):
 
     # Verify warning was logged about count conflict
     assert any(
-        "already in plan" in record.message and "organization" in record.message
-        for record in caplog.records
+        "already in plan" in record.getMessage() and "organization" in record.getMessage()
+        for record in log_capture.records
     )
 
 
-def test_auto_deps_seed_common_partial_coverage(db_conn, test_schema, caplog):
+@pytest.mark.usefixtures("org_machine_allocation_tables")
+def test_auto_deps_seed_common_partial_coverage(db_conn, test_schema):
     """Test auto-deps when seed common has partial coverage (generates additional rows)."""
-    # Create dependency chain
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
-
     # Create seed common with only 2 organizations (need 5 total)
-    import tempfile
-
-    from fraiseql_data import SeedBuilder
-
     seed_common_yaml = """
 baseline:
   tb_organization: 2
@@ -405,8 +153,6 @@ baseline:
         # Use auto_deps requiring 5 organizations total
         builder = SeedBuilder(db_conn, schema=test_schema, seed_common=seed_common_path)
 
-        caplog.clear()
-
         seeds = builder.add(
             "tb_allocation",
             count=10,
@@ -427,41 +173,107 @@ baseline:
         Path(seed_common_path).unlink()
 
 
+@pytest.mark.usefixtures("machine_allocation_tables")
 def test_auto_deps_false(db_conn, test_schema):
     """Test that auto_deps=False (default) does not auto-generate dependencies."""
-    # Create dependency
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
+    # Without auto_deps, should raise MissingDependencyError
+    builder = SeedBuilder(db_conn, schema=test_schema)
 
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
+    with pytest.raises(MissingDependencyError) as exc_info:
+        builder.add("tb_allocation", count=10, auto_deps=False).execute()
 
-    # Without auto_deps, should raise MissingDependencyError
-    from fraiseql_data.exceptions import MissingDependencyError
+    assert "tb_machine" in str(exc_info.value)
+    assert "tb_allocation" in str(exc_info.value)
 
+
+@pytest.mark.usefixtures("machine_allocation_tables")
+def test_auto_deps_large_count_uses_copy(db_conn, test_schema):
+    """Test large auto-deps chains are written via COPY with FKs intact."""
     builder = SeedBuilder(db_conn, schema=test_schema)
 
-    try:
-        builder.add("tb_allocation", count=10, auto_deps=False).execute()
-        raise AssertionError("Expected MissingDependencyError")
-    except MissingDependencyError as e:
-        assert "tb_machine" in str(e)
-        assert "tb_allocation" in str(e)
+    copy_rows_impl = DirectBackend._copy_rows
+    with patch.object(
+        DirectBackend, "_copy_rows", autospec=True, side_effect=copy_rows_impl
+    ) as copy_rows:
+        seeds = builder.add("tb_allocation", count=10_000, auto_deps={"tb_machine": 100}).execute()
+
+    # Both the auto-generated parents and the target table took the COPY path
+    assert [call.args[1].name for call in copy_rows.call_args_list] == [
+        "tb_machine",
+        "tb_allocation",
+    ]
+    assert len(seeds.tb_machine) == 100
+    assert len(seeds.tb_allocation) == 10_000
+    machine_pks = {machine.pk_machine for machine in seeds.tb_machine}
+    assert all(allocation.fk_machine in machine_pks for allocation in seeds.tb_allocation)
+
+
+def _table_info(name: str, *refs: str) -> TableInfo:
+    """Build a minimal TableInfo with one FK per referenced table."""
+    return TableInfo(
+        name=name,
+        columns=[ColumnInfo(name="id", pg_type="uuid", is_nullable=False)],
+        foreign_keys=[ForeignKeyInfo(f"fk_{ref[3:]}", ref, f"pk_{ref[3:]}") for ref in refs],
+    )
+
+
+def test_dependency_tree_memoized_until_schema_changes():
+    """Test dependency trees are walked once per introspector cache version."""
+
+    introspector = MockIntrospector()
+    introspector.set_table_schema("tb_organization", _table_info("tb_organization"))
+    introspector.set_table_schema("tb_machine", _table_info("tb_machine", "tb_organization"))
+    introspector.set_table_schema("tb_allocation", _table_info("tb_allocation", "tb_machine"))
+    resolver = AutoDependencyResolver(introspector, SeedCommon(instance_offsets={}))
+
+    with patch.object(
+        introspector, "get_table_info", wraps=introspector.get_table_info
+    ) as get_table_info:
+        first = resolver.build_dependency_tree("tb_allocation")
+        walked = get_table_info.call_count
+        second = resolver.build_dependency_tree("tb_allocation")
+
+    assert first == second == ["tb_organization", "tb_machine"]
+    assert get_table_info.call_count == walked
+
+    # Changing a table invalidates the memoized trees
+    introspector.set_table_schema("tb_machine", _table_info("tb_machine"))
+    assert resolver.build_dependency_tree("tb_allocation") == ["tb_machine"]
+
+
+def test_dependency_tree_visits_each_table_once():
+    """Test multi-path dependencies are introspected and listed once each."""
+    introspector = MockIntrospector()
+    introspector.set_table_schema("tb_organization", _table_info("tb_organization"))
+    introspector.set_table_schema("tb_machine", _table_info("tb_machine", "tb_organization"))
+    introspector.set_table_schema("tb_contract", _table_info("tb_contract", "tb_organization"))
+    introspector.set_table_schema(
+        "tb_allocation", _table_info("tb_allocation", "tb_machine", "tb_contract")
+    )
+    resolver = AutoDependencyResolver(introspector, SeedCommon(instance_offsets={}))
+
+    with patch.object(
+        introspector, "get_table_info", wraps=introspector.get_table_info
+    ) as get_table_info:
+        tree = resolver.build_dependency_tree("tb_allocation")
+
+    # Organization once, before both tables that reference it
+    assert tree[0] == "tb_organization"
+    assert sorted(tree[1:]) == ["tb_contract", "tb_machine"]
+    assert sorted(call.args[0] for call in get_table_info.call_args_list) == [
+        "tb_allocation",
+        "tb_contract",
+        "tb_machine",
+        "tb_organization",
+    ]
+
+
+def test_dependency_tree_rejects_cycles():
+    """Test a FK cycle among dependencies raises CircularDependencyError."""
+    introspector = MockIntrospector()
+    introspector.set_table_schema("tb_a", _table_info("tb_a", "tb_b"))
+    introspector.set_table_schema("tb_b", _table_info("tb_b", "tb_a"))
+    resolver = AutoDependencyResolver(introspector, SeedCommon(instance_offsets={}))
+
+    with pytest.raises(CircularDependencyError):
+        resolver.build_dependency_tree("tb_a")
@@ -1,64 +1,21 @@
 """Test edge cases for auto-dependency resolution."""
-# ruff: noqa: E501
 
+import pytest
 from fraiseql_data import SeedBuilder
 
 
-def test_auto_deps_circular_dependency(db_conn, test_schema):
+@pytest.mark.skip(reason="covered by test_dependency_tree_rejects_cycles (resolver unit test)")
+def test_auto_deps_circular_dependency():
     """Test that auto-deps detects circular dependencies and raises error."""
-    # Create circular dependency: A → B → C → A
-    with db_conn.cursor():
-        # We can't actually create circular FKs in PostgreSQL,
-        # so we'll create a self-referencing table which is similar
-        # For now, skip this test - circular deps are caught by existing dependency graph
-        pass
+    # Circular deps are caught by the auto-deps resolver and the existing
+    # dependency graph validation; no fixtures, so skipping costs no DB setup
 
-    # This test validates that circular dependency detection works
-    # Circular deps are already caught by the existing dependency graph validation
-    # So auto-deps will inherit this behavior
 
-
-def test_auto_deps_self_referencing(db_conn, test_schema):
+def test_auto_deps_self_referencing(db_conn, test_schema, auto_deps_shape):
     """Test auto-deps handles self-referencing tables (generates 1 root row)."""
     # Create chain with self-referencing table:
     # tb_allocation → tb_category (self-ref) → tb_organization
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        # Self-referencing table
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_category (
-                pk_category INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                parent_category INTEGER REFERENCES {test_schema}.tb_category(pk_category),
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_category INTEGER NOT NULL REFERENCES {test_schema}.tb_category(pk_category)
-            )
-        """
-        )
-        db_conn.commit()
+    auto_deps_shape("self_referencing_category")
 
     # Use auto_deps - should generate 1 root category
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -73,35 +30,17 @@ def test_auto_deps_self_referencing(db_conn, test_schema):
     assert seeds.tb_category[0].parent_category is None
 
 
-def test_auto_deps_missing_table(db_conn, test_schema):
+@pytest.mark.skip(reason="pending: needs a mocked introspector that reports a missing table")
+def test_auto_deps_missing_table():
     """Test clear error when dependency table doesn't exist."""
-    # Create table with FK to non-existent table
-    # This is tricky because PostgreSQL won't let us create FK to non-existent table
-    # So we'll simulate by trying to auto-dep a table that doesn't exist
-
-    # For this test, we'll just verify the error message is clear
-    # when introspection fails to find a referenced table
-    # This would be caught during FK introspection
-
-    # Skip for now - would require mocking introspector
-    pass
+    # PostgreSQL won't let us create an FK to a non-existent table, so this
+    # would be caught during FK introspection; no fixtures until implemented
 
 
-def test_auto_deps_no_dependencies(db_conn, test_schema):
+def test_auto_deps_no_dependencies(db_conn, test_schema, auto_deps_shape):
     """Test auto-deps is no-op when table has no foreign keys."""
     # Create table with no FKs
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-        db_conn.commit()
+    auto_deps_shape("organization")
 
     # Use auto_deps on table with no dependencies
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -113,37 +52,13 @@ def test_auto_deps_no_dependencies(db_conn, test_schema):
     assert len(seeds._tables) == 1
 
 
-def test_auto_deps_count_exceeds_target(db_conn, test_schema, caplog):
+@pytest.mark.usefixtures("machine_allocation_tables")
+def test_auto_deps_count_exceeds_target(db_conn, test_schema, log_capture):
     """Test warning when auto-dep count > target count."""
-    # Create simple dependency
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
-
     # Use auto_deps with unusual count (100 machines for 10 allocations)
     builder = SeedBuilder(db_conn, schema=test_schema)
 
-    caplog.clear()
+    log_capture.records.clear()
 
     seeds = builder.add(
         "tb_allocation",
@@ -157,50 +72,14 @@ def test_auto_deps_count_exceeds_target(db_conn, test_schema, caplog):
 
     # Verify warning was logged
     assert any(
-        "exceeds" in record.message.lower() and "machine" in record.message.lower()
-        for record in caplog.records
+        "exceeds" in record.getMessage().lower() and "machine" in record.getMessage().lower()
+        for record in log_capture.records
     )
 
 
+@pytest.mark.usefixtures("org_machine_allocation_tables")
 def test_auto_deps_nested(db_conn, test_schema):
     """Test nested auto-deps (table with auto_deps depends on table with auto_deps)."""
-    # Create dependency chain
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
-        )
-        db_conn.commit()
-
     # Both tables use auto_deps
     builder = SeedBuilder(db_conn, schema=test_schema)
     seeds = (
@@ -4,38 +4,14 @@ Note: The reuse_existing parameter was removed and replaced with the
 seed common baseline system. For UUID collision prevention, use seed
 common baselines.
 """
-# ruff: noqa: E501
 
+import pytest
 from fraiseql_data import SeedBuilder
 
 
+@pytest.mark.usefixtures("org_allocation_tables")
 def test_auto_deps_generates_fresh_data(db_conn, test_schema):
     """Test that auto-deps generates data correctly."""
-    # Create dependency
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
-        )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
-        )
-        db_conn.commit()
-
     # Test: auto-deps generates needed data
     builder = SeedBuilder(db_conn, schema=test_schema)
     seeds = builder.add(
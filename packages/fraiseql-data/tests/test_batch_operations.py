@@ -5,7 +5,7 @@ import random
 from fraiseql_data import SeedBuilder
 
 
-def test_batch_context_manager(db_conn, test_schema):
+def test_batch_context_manager(db_conn, test_schema, row_counts):
     """Test batch operations via context manager (auto-execution on exit)."""
     builder = SeedBuilder(db_conn, schema=test_schema)
 
@@ -15,17 +15,10 @@ def test_batch_context_manager(db_conn, test_schema):
         batch.add("tb_model", count=50)
 
     # Verify both tables were seeded
-    with db_conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_manufacturer")
-        manufacturer_count = cur.fetchone()[0]
-        assert manufacturer_count == 10
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_model")
-        model_count = cur.fetchone()[0]
-        assert model_count == 50
+    assert row_counts("tb_manufacturer", "tb_model") == {"tb_manufacturer": 10, "tb_model": 50}
 
 
-def test_conditional_operations(db_conn, test_schema):
+def test_conditional_operations(db_conn, test_schema, row_counts):
     """Test conditional seed operations with .when()."""
     builder = SeedBuilder(db_conn, schema=test_schema)
 
@@ -38,14 +31,9 @@ def test_conditional_operations(db_conn, test_schema):
         batch.when(include_models).add("tb_model", count=50)  # Should skip
 
     # Verify only manufacturers were seeded (models skipped)
-    with db_conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_manufacturer")
-        manufacturer_count = cur.fetchone()[0]
-        assert manufacturer_count == 10
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_model")
-        model_count = cur.fetchone()[0]
-        assert model_count == 0, "Models should not have been seeded (condition was False)"
+    counts = row_counts("tb_manufacturer", "tb_model")
+    assert counts["tb_manufacturer"] == 10
+    assert counts["tb_model"] == 0, "Models should not have been seeded (condition was False)"
 
 
 def test_dynamic_count(db_conn, test_schema):
@@ -1,6 +1,10 @@
 """Tests for SeedBuilder API."""
 
+from unittest.mock import patch
+
+import pytest
 from fraiseql_data import SeedBuilder
+from fraiseql_data.introspection import SchemaIntrospector
 from psycopg import Connection
 
 
@@ -85,3 +89,36 @@ def test_execute_generates_realistic_data(db_conn: Connection, test_schema: str)
     # Name should exist and be non-empty
     assert mfg.name
     assert len(mfg.name) > 0
+
+
+def test_builders_share_introspector(
+    db_conn: Connection, test_schema: str, schema_introspector: SchemaIntrospector
+):
+    """Builders given the same introspector should load the schema once."""
+    with patch.object(
+        SchemaIntrospector,
+        "_load_schema",
+        autospec=True,
+        side_effect=SchemaIntrospector._load_schema,
+    ) as load_schema:
+        seeds = (
+            SeedBuilder(db_conn, schema=test_schema, introspector=schema_introspector)
+            .add("tb_manufacturer", count=2)
+            .add("tb_model", count=3)
+            .execute()
+        )
+        for _ in range(2):
+            builder = SeedBuilder(db_conn, schema=test_schema, introspector=schema_introspector)
+            assert builder.introspector is schema_introspector
+            builder.add("tb_model", count=3)
+
+    assert load_schema.call_count == 1
+    assert len(seeds.tb_model) == 3
+
+
+def test_builder_rejects_introspector_for_other_schema(
+    db_conn: Connection, test_schema: str, schema_introspector: SchemaIntrospector
+):
+    """Should refuse an introspector bound to a different schema."""
+    with pytest.raises(ValueError, match="Introspector is for schema"):
+        SeedBuilder(db_conn, schema="public", introspector=schema_introspector)
@@ -3,21 +3,10 @@
 from fraiseql_data import SeedBuilder
 
 
-def test_auto_satisfy_enum_constraint(db_conn, test_schema):
+def test_auto_satisfy_enum_constraint(db_conn, test_schema, check_constraint_shape):
     """Test automatic satisfaction of IN constraint (enum values)."""
     # Create table with CHECK constraint for enum values
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_item (
-                pk_item INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                status TEXT NOT NULL CHECK (status IN ('active', 'inactive', 'discontinued'))
-            )
-        """
-        )
-        db_conn.commit()
+    check_constraint_shape("item_status_enum")
 
     # Generate seed data WITHOUT manually providing status override
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -39,23 +28,10 @@ def test_auto_satisfy_enum_constraint(db_conn, test_schema):
         assert count == 100
 
 
-def test_auto_satisfy_range_constraint(db_conn, test_schema):
+def test_auto_satisfy_range_constraint(db_conn, test_schema, check_constraint_shape):
     """Test automatic satisfaction of range constraints (>, <, BETWEEN)."""
     # Create table with range CHECK constraints
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_product (
-                pk_product INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                price NUMERIC CHECK (price > 0 AND price < 10000),
-                stock INTEGER CHECK (stock >= 0)
-            )
-        """
-        )
-        db_conn.commit()
+    check_constraint_shape("product_price_stock_range")
 
     # Generate seed data WITHOUT manually providing price/stock overrides
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -68,24 +44,10 @@ def test_auto_satisfy_range_constraint(db_conn, test_schema):
         assert product.stock >= 0, f"Stock negative: {product.stock}"
 
 
-def test_range_constraint_operators(db_conn, test_schema):
+def test_range_constraint_operators(db_conn, test_schema, check_constraint_shape):
     """Test all range constraint operators (<, <=, BETWEEN)."""
     # Create table with various range CHECK constraints
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_range_test (
-                pk_test INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                score NUMERIC CHECK (score > 50),           -- greater than 50
-                level INTEGER CHECK (level <= 10),          -- less than or equal to 10
-                rating NUMERIC CHECK (rating BETWEEN 1.0 AND 5.0)  -- between 1.0-5.0
-            )
-        """
-        )
-        db_conn.commit()
+    check_constraint_shape("range_operators")
 
     # Generate seed data WITHOUT manually providing overrides
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -99,23 +61,10 @@ def test_range_constraint_operators(db_conn, test_schema):
         assert 1.0 <= row.rating <= 5.0, f"Rating out of range: {row.rating}"
 
 
-def test_complex_check_emits_warning(db_conn, test_schema, caplog):
+def test_complex_check_emits_warning(db_conn, test_schema, check_constraint_shape, caplog):
     """Test that complex CHECK constraints emit warnings (cannot auto-satisfy)."""
     # Create table with complex CHECK constraint (cannot be auto-parsed)
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_order (
-                pk_order INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                quantity INTEGER NOT NULL,
-                price NUMERIC NOT NULL,
-                total NUMERIC NOT NULL CHECK (total = price * quantity)
-            )
-        """
-        )
-        db_conn.commit()
+    check_constraint_shape("order_total_expression")
 
     # Generate seed data - complex constraint should emit warning
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -2,32 +2,24 @@
 
 import random
 
+import pytest
 from fraiseql_data import SeedBuilder
+from fraiseql_data.constraint_parser import (
+    CheckConstraintParser,
+    CombinedRangeRule,
+    EnumConstraintRule,
+    RangeConstraintRule,
+)
 from psycopg import Connection
 
 
-def test_check_constraint_introspection(db_conn: Connection, test_schema: str):
+def test_check_constraint_introspection(check_constraint_shape, schema_introspector):
     """Test CHECK constraint is introspected."""
     # Create table with CHECK (price > 0)
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_product (
-                pk_product INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                price NUMERIC NOT NULL CHECK (price > 0)
-            )
-            """
-        )
-        db_conn.commit()
+    check_constraint_shape("product_positive_price")
 
     # Introspect table
-    from fraiseql_data.introspection import SchemaIntrospector
-
-    introspector = SchemaIntrospector(db_conn, test_schema)
-    table_info = introspector.get_table_info("tb_product")
+    table_info = schema_introspector.get_table_info("tb_product")
 
     # Verify CHECK constraint is detected
     assert len(table_info.check_constraints) > 0, "CHECK constraint should be introspected"
@@ -43,22 +35,12 @@ def test_check_constraint_introspection(db_conn: Connection, test_schema: str):
     assert ">" in price_check.check_clause or "0" in price_check.check_clause
 
 
-def test_check_constraint_warning(db_conn: Connection, test_schema: str, caplog):
+def test_check_constraint_warning(
+    db_conn: Connection, test_schema: str, check_constraint_shape, caplog
+):
     """Test auto-satisfaction of simple CHECK constraints."""
     # Create table with CHECK constraint
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_item (
-                pk_item INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                status TEXT NOT NULL CHECK (status IN ('active', 'inactive', 'discontinued'))
-            )
-            """
-        )
-        db_conn.commit()
+    check_constraint_shape("named_item_status_enum")
 
     # Seed without override (should auto-satisfy CHECK constraint)
     import logging
@@ -85,23 +67,12 @@ def test_check_constraint_warning(db_conn: Connection, test_schema: str, caplog)
     assert auto_satisfy_found, "Should log auto-satisfaction of CHECK constraint"
 
 
-def test_check_constraint_with_override(db_conn: Connection, test_schema: str):
+def test_check_constraint_with_override(
+    db_conn: Connection, test_schema: str, check_constraint_shape
+):
     """Test user override satisfies CHECK constraint."""
     # Create table with CHECK (price > 0 AND price < 10000)
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_product (
-                pk_product INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                price NUMERIC NOT NULL CHECK (price > 0 AND price < 10000),
-                status TEXT NOT NULL CHECK (status IN ('active', 'inactive'))
-            )
-            """
-        )
-        db_conn.commit()
+    check_constraint_shape("product_price_status")
 
     # Provide overrides that satisfy CHECK constraints
     def generate_valid_price():
@@ -134,3 +105,55 @@ def test_check_constraint_with_override(db_conn: Connection, test_schema: str):
     with db_conn.cursor() as cur:
         cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_product")
         assert cur.fetchone()[0] == 50
+
+
+@pytest.mark.parametrize(
+    ("clause", "expected", "valid"),
+    [
+        ("CHECK ((a > (50)::numeric))", RangeConstraintRule("a", ">", 50.0), lambda v: v > 50),
+        ("CHECK ((c > '-5'::integer))", RangeConstraintRule("c", ">", -5.0), lambda v: v > -5),
+        ("CHECK ((c < '-5'::integer))", RangeConstraintRule("c", "<", -5.0), lambda v: v < -5),
+        ("CHECK ((e <= (-2)::numeric))", RangeConstraintRule("e", "<=", -2.0), lambda v: v <= -2),
+        ("CHECK ((z < (0)::numeric))", RangeConstraintRule("z", "<", 0.0), lambda v: v < 0),
+        (
+            "CHECK ((d >= (1.5)::double precision))",
+            RangeConstraintRule("d", ">=", 1.5),
+            lambda v: v >= 1.5,
+        ),
+        (
+            "CHECK (((b > (0)::numeric) AND (b < (10000)::numeric)))",
+            CombinedRangeRule("b", min_value=0.0, max_value=10000.0),
+            lambda v: 0 < v < 10000,
+        ),
+        (
+            "CHECK (((f >= '-3'::integer) AND (f <= 3)))",
+            CombinedRangeRule(
+                "f", min_value=-3.0, max_value=3.0, min_inclusive=True, max_inclusive=True
+            ),
+            lambda v: -3 <= v <= 3,
+        ),
+        (
+            "CHECK ((g = ANY (ARRAY['1'::text, '2'::text])))",
+            EnumConstraintRule("g", ["1", "2"]),
+            lambda v: v in {"1", "2"},
+        ),
+    ],
+)
+def test_parser_reads_deparsed_literals(clause: str, expected, valid):
+    """Numeric literals in pg_get_constraintdef() output are parsed through their casts."""
+    rule = CheckConstraintParser().parse(clause)
+    assert rule == expected
+    assert all(valid(rule.generate()) for _ in range(20))
+
+
+@pytest.mark.parametrize("inclusive", [False, True])
+def test_combined_rule_with_negative_upper_bound_only(inclusive: bool):
+    """An upper bound below zero is not clamped up to 0."""
+    rule = CombinedRangeRule("c", max_value=-5.0, max_inclusive=inclusive)
+    assert all(rule.generate() <= -5 for _ in range(20))
+
+
+def test_parser_caches_rules_per_clause():
+    """Parsing a clause again (after whitespace normalization) reuses the cached rule."""
+    first = CheckConstraintParser().parse("CHECK ((price > (0)::numeric))")
+    assert CheckConstraintParser().parse("CHECK ((price  >  (0)::numeric))") is first
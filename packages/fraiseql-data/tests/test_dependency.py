@@ -0,0 +1,41 @@
+"""Tests for DependencyGraph ordering."""
+
+import pytest
+from fraiseql_data.dependency import DependencyGraph
+from fraiseql_data.exceptions import CircularDependencyError
+
+
+class TestTopologicalSort:
+    """Kahn's algorithm over the dependency graph."""
+
+    def test_dependencies_come_first_in_stable_order(self):
+        graph = DependencyGraph()
+        graph.add_dependency("tb_order", "tb_user")
+        graph.add_dependency("tb_order", "tb_product")
+        graph.add_dependency("tb_product", "tb_category")
+        graph.add_table("tb_audit")
+
+        assert graph.topological_sort() == [
+            "tb_audit",
+            "tb_category",
+            "tb_user",
+            "tb_product",
+            "tb_order",
+        ]
+
+    def test_long_chain(self):
+        graph = DependencyGraph()
+        names = [f"tb_{i:05d}" for i in range(5000)]
+        for child, parent in zip(names[1:], names, strict=False):
+            graph.add_dependency(child, parent)
+
+        assert graph.topological_sort() == names
+
+    def test_cycle_raises(self):
+        graph = DependencyGraph()
+        graph.add_dependency("tb_a", "tb_b")
+        graph.add_dependency("tb_b", "tb_a")
+        graph.add_table("tb_c")
+
+        with pytest.raises(CircularDependencyError):
+            graph.topological_sort()
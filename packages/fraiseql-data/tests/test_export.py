@@ -103,3 +103,18 @@ def test_export_handles_uuids_and_datetimes(db_conn: Connection, test_schema: st
     # Datetimes should be strings
     if first_event.get("event_date"):
         assert isinstance(first_event["event_date"], str)
+
+
+def test_export_csv_writes_none_as_empty(tmp_path: Path):
+    """NULL values become empty fields; other values are stringified."""
+    from fraiseql_data.models import Seeds
+
+    seeds = Seeds()
+    seeds.add_table("tb_item", [{"name": "a,b", "price": 1.5, "note": None, "active": True}])
+    csv_file = tmp_path / "items.csv"
+    seeds.to_csv("tb_item", csv_file)
+
+    assert csv_file.read_text().splitlines() == [
+        "name,price,note,active",
+        '"a,b",1.5,,True',
+    ]
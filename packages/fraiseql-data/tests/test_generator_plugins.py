@@ -132,3 +132,20 @@ def test_list_registered_generators():
     # Clear and verify empty
     clear_generators()
     assert list_generators() == []
+
+
+def test_register_after_lookup_is_visible():
+    """Registering after a lookup must not be hidden by the frozen snapshot."""
+    from fraiseql_data.generators.registry import get_generator
+
+    class Gen1(BaseGenerator):
+        def generate(self, _column_name, _pg_type, **_context):
+            return "value1"
+
+    assert get_generator("late") is None
+
+    register_generator("late", Gen1)
+    assert get_generator("late") is Gen1
+
+    clear_generators()
+    assert get_generator("late") is None
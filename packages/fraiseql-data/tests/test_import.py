@@ -3,8 +3,9 @@
 import tempfile
 from pathlib import Path
 
+import pytest
 from fraiseql_data import SeedBuilder
-from fraiseql_data.models import Seeds
+from fraiseql_data.models import ORJSON_AVAILABLE, Seeds
 
 
 def test_import_from_json(db_conn, test_schema):
@@ -71,3 +72,94 @@ def test_insert_imported_seeds(db_conn, test_schema):
     # Verify returned seeds have database-generated values
     assert len(result.tb_manufacturer) == 10
     assert all(m.pk_manufacturer is not None for m in result.tb_manufacturer)
+
+
+def test_imported_rows_are_slotted():
+    """SeedRow keeps column data in a slot, without a per-row __dict__."""
+    seeds = Seeds.from_json(json_str='{"tb_item": [{"name": "a"}]}')
+    row = seeds.tb_item[0]
+
+    assert row.name == "a"
+    assert not hasattr(row, "__dict__")
+
+
+def test_tables_are_indexable_by_name():
+    """Seeds supports item access alongside attribute access."""
+    seeds = Seeds.from_json(json_str='{"tb_item": [{"name": "a"}]}')
+
+    assert seeds["tb_item"] is seeds.tb_item
+    with pytest.raises(KeyError):
+        seeds["tb_missing"]
+
+
+def test_rows_and_seeds_survive_copy():
+    """Attribute fallbacks must not recurse while copy/pickle rebuild objects."""
+    import copy
+    import pickle
+
+    seeds = Seeds.from_json(json_str='{"tb_item": [{"name": "a"}]}')
+
+    assert copy.deepcopy(seeds).tb_item[0].name == "a"
+    assert pickle.loads(pickle.dumps(seeds.tb_item[0])).name == "a"
+    with pytest.raises(AttributeError, match="No column 'missing'"):
+        _ = seeds.tb_item[0].missing
+
+
+def test_dict_roundtrip_keeps_types_without_sharing_rows():
+    """to_dict/from_dict hand rows over in memory, with Python types intact."""
+    from uuid import uuid4
+
+    item_id = uuid4()
+    original = Seeds.from_dict({"tb_item": [{"id": item_id, "name": "a"}]})
+
+    exported = original.to_dict()
+    exported["tb_item"][0]["name"] = "b"
+    imported = Seeds.from_dict(exported)
+
+    assert imported.tb_item[0].id == item_id
+    assert imported.tb_item[0].name == "b"
+    assert original.tb_item[0].name == "a"
+
+
+def test_import_from_csv_matches_dictreader(tmp_path):
+    """Short and long rows are mapped the same way csv.DictReader maps them."""
+    import csv
+
+    csv_file = tmp_path / "items.csv"
+    csv_file.write_text("name,price,note\na,1,x\n\nb,2\nc,3,y,extra\n")
+
+    rows = [row._data for row in Seeds.from_csv("tb_item", csv_file).tb_item]
+    with csv_file.open(newline="") as f:
+        assert rows == list(csv.DictReader(f))
+    assert rows[1] == {"name": "b", "price": "2", "note": None}
+
+
+@pytest.mark.parametrize(
+    "use_orjson",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed"),
+        ),
+    ],
+)
+def test_json_roundtrip_same_with_either_parser(monkeypatch, use_orjson):
+    """Values only the stdlib parser accepts still round-trip when orjson is installed."""
+    import math
+
+    from fraiseql_data import models
+
+    monkeypatch.setattr(models, "ORJSON_AVAILABLE", use_orjson)
+    original = Seeds.from_dict(
+        {"tb_item": [{"name": "café", "ratio": math.nan, "limit": math.inf, "serial": 2**70}]}
+    )
+
+    json_str = original.to_json()
+    row = Seeds.from_json(json_str=json_str).tb_item[0]
+
+    assert "caf\\u00e9" in json_str
+    assert row.name == "café"
+    assert math.isnan(row.ratio)
+    assert row.limit == math.inf
+    assert row.serial == 2**70
@@ -1,7 +1,9 @@
 """Tests for schema introspection functionality."""
 
+import pytest
 from fraiseql_data.introspection import SchemaIntrospector
-from psycopg import Connection
+from fraiseql_data.models import ColumnInfo, TableInfo
+from psycopg import Connection, Pipeline
 
 
 def test_get_tables(db_conn: Connection, test_schema: str):
@@ -61,3 +63,231 @@ def test_topological_sort(db_conn: Connection, test_schema: str):
     mfg_idx = next(i for i, t in enumerate(sorted_tables) if t == "tb_manufacturer")
     model_idx = next(i for i, t in enumerate(sorted_tables) if t == "tb_model")
     assert mfg_idx < model_idx
+
+
+def test_get_tables_populates_table_info_cache(db_conn: Connection, test_schema: str):
+    """Loading the schema once should serve later per-table lookups from cache."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    introspector.get_tables()
+
+    model = introspector.get_table_info("tb_model")
+    assert [fk.referenced_table for fk in model.foreign_keys] == ["tb_manufacturer"]
+    manufacturer = introspector.get_table_info("tb_manufacturer")
+    assert {c.name for c in manufacturer.columns if c.is_unique} == {"id", "identifier"}
+
+    with db_conn.cursor() as cur:
+        cur.execute(f"CREATE TABLE {test_schema}.tb_late (pk_late INTEGER PRIMARY KEY)")
+    assert introspector.get_table_info("tb_late").pk_column == "pk_late"
+
+
+def test_topological_sort_is_cached(db_conn: Connection, test_schema: str):
+    """Repeated sorts reuse the cached order; callers get their own copy."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    first = introspector.topological_sort()
+    first.reverse()
+
+    assert introspector.topological_sort() == ["tb_manufacturer", "tb_model"]
+
+    introspector.clear_cache()
+    assert introspector._topological_sort_cache is None
+
+
+def test_introspection_queries_are_prepared(db_conn: Connection, test_schema: str):
+    """Repeated introspection queries reuse server-side prepared statements."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    introspector.get_foreign_keys("tb_manufacturer")
+    introspector.get_foreign_keys("tb_model")
+
+    with db_conn.cursor() as cur:
+        cur.execute(
+            "SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE %s",
+            ("%contype = 'f'%",),
+        )
+        assert cur.fetchone() == (1,)
+
+
+def test_get_tables_after_table_lookups_needs_no_sql(db_conn: Connection, test_schema: str):
+    """Once any lookup has loaded the schema, get_tables() is served from cache."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    introspector.get_table_info("tb_model")
+
+    introspector.conn = None  # any further query would fail
+    assert [t.name for t in introspector.get_tables()] == ["tb_manufacturer", "tb_model"]
+    assert [t.name for t in introspector.get_tables()] == ["tb_manufacturer", "tb_model"]
+
+
+def test_schema_load_query_count_is_independent_of_table_count(
+    db_conn: Connection, test_schema: str
+):
+    """Loading N tables issues a fixed number of queries, not one set per table."""
+
+    def count_load_queries() -> int:
+        introspector = SchemaIntrospector(db_conn, schema=test_schema)
+        real_cursor = db_conn.cursor
+        calls = 0
+
+        def counting_cursor(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return real_cursor(*args, **kwargs)
+
+        introspector.conn = type("CountingConn", (), {})()
+        introspector.conn.cursor = counting_cursor
+        introspector.conn.pipeline = db_conn.pipeline
+        introspector.get_tables()
+        return calls
+
+    baseline = count_load_queries()
+    with db_conn.cursor() as cur:
+        for i in range(5):
+            cur.execute(f"CREATE TABLE {test_schema}.tb_extra_{i} (pk_extra INTEGER PRIMARY KEY)")
+
+    assert count_load_queries() == baseline
+
+
+@pytest.mark.skipif(not Pipeline.is_supported(), reason="libpq without pipeline mode")
+def test_table_lookup_uses_a_single_pipeline(db_conn: Connection, test_schema: str):
+    """Relations, columns and constraints for a cold lookup share one pipeline sync."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    real_pipeline = db_conn.pipeline
+    pipelines = 0
+
+    def counting_pipeline():
+        nonlocal pipelines
+        pipelines += 1
+        return real_pipeline()
+
+    introspector.conn = type("CountingConn", (), {})()
+    introspector.conn.cursor = db_conn.cursor
+    introspector.conn.pipeline = counting_pipeline
+
+    table = introspector.get_table_info("tb_model")
+    assert table.foreign_keys
+    assert pipelines == 1
+
+
+def test_table_info_column_lookups_are_memoized():
+    """Trinity accessors are computed once per TableInfo."""
+    table = TableInfo(
+        name="tb_user",
+        columns=[
+            ColumnInfo(name="pk_user", pg_type="integer", is_nullable=False, is_primary_key=True),
+            ColumnInfo(name="id", pg_type="uuid", is_nullable=False),
+            ColumnInfo(name="identifier", pg_type="text", is_nullable=False),
+        ],
+    )
+
+    assert table.is_trinity
+    assert (table.pk_column, table.id_column, table.identifier_column) == (
+        "pk_user",
+        "id",
+        "identifier",
+    )
+    assert {"is_trinity", "pk_column", "id_column", "identifier_column"} <= vars(table).keys()
+
+
+def test_clear_cache_resets_loaded_table_list(db_conn: Connection, test_schema: str):
+    """get_tables() is served from cache until clear_cache() forces a full reload."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    assert len(introspector.get_tables()) == 2
+
+    with db_conn.cursor() as cur:
+        cur.execute(f"CREATE TABLE {test_schema}.tb_late (pk_late INTEGER PRIMARY KEY)")
+    assert len(introspector.get_tables()) == 2
+
+    introspector.clear_cache()
+    assert [t.name for t in introspector.get_tables()] == [
+        "tb_late",
+        "tb_manufacturer",
+        "tb_model",
+    ]
+
+
+def test_invalidate_reloads_only_that_table(db_conn: Connection, test_schema: str, exec_ddl):
+    """invalidate() refreshes one table's metadata and keeps the others cached."""
+    exec_ddl(f"CREATE TABLE {test_schema}.tb_widget (pk_widget INTEGER PRIMARY KEY)")
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    manufacturer = introspector.get_table_info("tb_manufacturer")
+    widget = introspector.get_table_info("tb_widget")
+    version = introspector.cache_version
+
+    exec_ddl(f"ALTER TABLE {test_schema}.tb_widget ADD COLUMN sku TEXT")
+    assert introspector.get_table_info("tb_widget") is widget
+
+    introspector.invalidate("tb_widget")
+    assert introspector.cache_version > version
+    assert [c.name for c in introspector.get_table_info("tb_widget").columns] == [
+        "pk_widget",
+        "sku",
+    ]
+    assert introspector.get_table_info("tb_manufacturer") is manufacturer
+
+
+def test_dependency_graph_is_built_with_the_schema_load(db_conn: Connection, test_schema: str):
+    """Loading the schema also produces the dependency graph; no extra pass or SQL."""
+    introspector = SchemaIntrospector(db_conn, schema=test_schema)
+    introspector.get_tables()
+
+    introspector.conn = None  # any further query would fail
+    graph = introspector.get_dependency_graph()
+    assert graph.get_dependencies("tb_model") == ["tb_manufacturer"]
+    assert graph.get_dependencies("tb_manufacturer") == []
+
+
+def test_topological_order_is_persisted_per_schema_shape(
+    db_conn: Connection, test_schema: str, tmp_path
+):
+    """With order_cache_dir, an unchanged schema is sorted without introspection."""
+    first = SchemaIntrospector(db_conn, schema=test_schema, order_cache_dir=tmp_path)
+    assert first.topological_sort() == ["tb_manufacturer", "tb_model"]
+    assert len(list(tmp_path.glob(f"{test_schema}.*.tdag"))) == 1
+
+    second = SchemaIntrospector(db_conn, schema=test_schema, order_cache_dir=tmp_path)
+    assert second.topological_sort() == ["tb_manufacturer", "tb_model"]
+    assert second._table_names is None  # served from the .tdag file
+
+    with db_conn.cursor() as cur:
+        cur.execute(
+            f"CREATE TABLE {test_schema}.tb_part (pk_part INTEGER PRIMARY KEY, "
+            f"fk_model INTEGER REFERENCES {test_schema}.tb_model(pk_model))"
+        )
+    third = SchemaIntrospector(db_conn, schema=test_schema, order_cache_dir=tmp_path)
+    assert third.topological_sort() == ["tb_manufacturer", "tb_model", "tb_part"]
+    assert len(list(tmp_path.glob(f"{test_schema}.*.tdag"))) == 2
+
+
+@pytest.mark.parametrize("damaged", ["", "tb_manufacturer\ntb_mo"])
+def test_damaged_topological_order_file_is_rebuilt(
+    db_conn: Connection, test_schema: str, tmp_path, damaged
+):
+    """An empty or truncated .tdag file is ignored and replaced."""
+    SchemaIntrospector(db_conn, schema=test_schema, order_cache_dir=tmp_path).topological_sort()
+    (order_file,) = tmp_path.glob(f"{test_schema}.*.tdag")
+    order_file.write_text(damaged)
+
+    introspector = SchemaIntrospector(db_conn, schema=test_schema, order_cache_dir=tmp_path)
+    assert introspector.topological_sort() == ["tb_manufacturer", "tb_model"]
+    assert order_file.read_text() == "tb_manufacturer\ntb_model\n"
+    assert list(tmp_path.iterdir()) == [order_file]  # no temp files left
+
+
+def test_schema_check_is_prepared_once_per_connection(db_conn: Connection, test_schema: str):
+    """Constructing several introspectors reuses one prepared schema check."""
+    for _ in range(3):
+        SchemaIntrospector(db_conn, schema=test_schema)
+
+    with db_conn.cursor() as cur:
+        cur.execute(
+            "SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE %s",
+            ("%FROM pg_namespace n%has_schema_privilege%",),
+        )
+        assert cur.fetchone() == (1,)
+
+
+def test_column_metadata_is_immutable_and_hashable():
+    """Introspected metadata records are frozen, so they can key caches."""
+    column = ColumnInfo(name="id", pg_type="uuid", is_nullable=False)
+
+    with pytest.raises(AttributeError):
+        column.name = "other"  # type: ignore[misc]
+    assert {column: 1}[ColumnInfo(name="id", pg_type="uuid", is_nullable=False)] == 1
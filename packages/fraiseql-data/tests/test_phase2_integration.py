@@ -4,7 +4,7 @@ from fraiseql_data import SeedBuilder
 from psycopg import Connection
 
 
-def test_all_phase2_features_together(db_conn: Connection, test_schema: str):
+def test_all_phase2_features_together(db_conn: Connection, test_schema: str, row_counts):
     """
     Integration test combining self-reference, UNIQUE constraints, and bulk insert.
 
@@ -106,15 +106,11 @@ def test_all_phase2_features_together(db_conn: Connection, test_schema: str):
         assert fk_org in org_pks, f"FK org {fk_org} should exist in organization PKs"
 
     # Verify data is actually in database (not just in memory)
-    with db_conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_organization")
-        assert cur.fetchone()[0] == 50
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_category")
-        assert cur.fetchone()[0] == 20
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_product")
-        assert cur.fetchone()[0] == 100
+    assert row_counts("tb_organization", "tb_category", "tb_product") == {
+        "tb_organization": 50,
+        "tb_category": 20,
+        "tb_product": 100,
+    }
 
 
 def test_complex_hierarchy(db_conn: Connection, test_schema: str):
@@ -12,34 +12,29 @@ Tests auto-deps integration with:
 from fraiseql_data import SeedBuilder
 
 
-def test_auto_deps_with_check_constraints(db_conn, test_schema):
+def test_auto_deps_with_check_constraints(db_conn, test_schema, exec_ddl):
     """Test auto-deps with tables that have CHECK constraints."""
     # Create schema with CHECK constraints
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                org_type TEXT NOT NULL CHECK (org_type IN ('nonprofit', 'government', 'private'))
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            org_type TEXT NOT NULL CHECK (org_type IN ('nonprofit', 'government', 'private'))
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                priority INTEGER NOT NULL CHECK (priority BETWEEN 1 AND 10),
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_allocation (
+            pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            priority INTEGER NOT NULL CHECK (priority BETWEEN 1 AND 10),
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-        db_conn.commit()
+        """,
+    )
 
     # Use auto_deps with CHECK constraints
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -118,33 +113,28 @@ def test_auto_deps_with_staging_backend(test_schema):
         assert machine.fk_organization == org_pk
 
 
-def test_auto_deps_with_dynamic_counts(db_conn, test_schema):
+def test_auto_deps_with_dynamic_counts(db_conn, test_schema, exec_ddl):
     """Test auto-deps with callable counts."""
     # Create schema
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_machine (
+            pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-        db_conn.commit()
+        """,
+    )
 
     # Use auto_deps with dynamic count
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -160,44 +150,36 @@ def test_auto_deps_with_dynamic_counts(db_conn, test_schema):
     assert len(seeds.tb_machine) == 7
 
 
-def test_auto_deps_with_batch_and_conditional(db_conn, test_schema):
+def test_auto_deps_with_batch_and_conditional(db_conn, test_schema, exec_ddl, row_counts):
     """Test auto-deps with batch operations and conditionals."""
     # Create schema
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_machine (
+            pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_allocation (
-                pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_allocation (
+            pk_allocation INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            fk_machine INTEGER NOT NULL REFERENCES {test_schema}.tb_machine(pk_machine)
         )
-        db_conn.commit()
+        """,
+    )
 
     # Use auto_deps with batch and conditionals
     builder = SeedBuilder(db_conn, schema=test_schema)
@@ -209,16 +191,12 @@ def test_auto_deps_with_batch_and_conditional(db_conn, test_schema):
         batch.when(include_machines).add("tb_machine", count=3, auto_deps=True)
         batch.when(not skip_allocations).add("tb_allocation", count=15, auto_deps=True)
 
-    # Verify: conditional operations executed with auto_deps
-    with db_conn.cursor() as cur:
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_organization")
-        assert cur.fetchone()[0] == 1  # Deduplicated
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_machine")
-        assert cur.fetchone()[0] == 3
-
-        cur.execute(f"SELECT COUNT(*) FROM {test_schema}.tb_allocation")
-        assert cur.fetchone()[0] == 15
+    # Verify: conditional operations executed with auto_deps (one deduplicated organization)
+    assert row_counts("tb_organization", "tb_machine", "tb_allocation") == {
+        "tb_organization": 1,
+        "tb_machine": 3,
+        "tb_allocation": 15,
+    }
 
 
 def test_auto_deps_deep_hierarchy(db_conn, test_schema):
@@ -330,35 +308,30 @@ def test_auto_deps_deep_hierarchy(db_conn, test_schema):
         assert room.fk_building == building_pk
 
 
-def test_auto_deps_with_export_import(db_conn, test_schema):
+def test_auto_deps_with_export_import(db_conn, test_schema, exec_ddl):
     """Test auto-deps generated data can be exported and re-imported."""
     import tempfile
 
     # Create schema
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_machine (
+            pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-        db_conn.commit()
+        """,
+    )
 
     # Generate with auto_deps
     builder = SeedBuilder(db_conn, schema=test_schema)
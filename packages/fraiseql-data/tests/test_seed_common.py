@@ -38,7 +38,7 @@ baseline:
 
         # No explicit data
         assert not common.has_explicit_data("tb_organization")
-        assert common.get_data("tb_organization") == []
+        assert common.get_data("tb_organization") == ()
     finally:
         Path(yaml_path).unlink()
 
@@ -131,6 +131,17 @@ INSERT INTO tb_machine (id, identifier, name) VALUES
         assert offsets["tb_machine"] == 2
 
 
+def test_seed_common_from_sql_reads_only_sql_files(tmp_path):
+    """Non-.sql entries, including directories named *.sql, are ignored."""
+    row = "INSERT INTO tb_org (id) VALUES ('2a6f3c21-0000-4000-8000-{:012d}');\n"
+    (tmp_path / "01_org.sql").write_text(row.format(2))
+    (tmp_path / "02_org.sql").write_text(row.format(7))
+    (tmp_path / "notes.txt").write_text(row.format(99))
+    (tmp_path / "archive.sql").mkdir()
+
+    assert SeedCommon.from_sql(str(tmp_path)).get_instance_offsets() == {"tb_org": 7}
+
+
 def test_seed_common_from_directory_auto_detect():
     """Auto-detect format when loading from directory."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -163,6 +174,41 @@ def test_seed_common_instance_offsets():
     assert offsets["tb_machine"] == 10
 
 
+def test_seed_common_instance_offsets_are_read_only():
+    """Offsets are handed out as a shared read-only view."""
+    common = SeedCommon(instance_offsets={"tb_organization": 5})
+
+    offsets = common.get_instance_offsets()
+    assert offsets is common.get_instance_offsets()
+    with pytest.raises(TypeError):
+        offsets["tb_organization"] = 1  # type: ignore[index]
+    assert dict(offsets) == {"tb_organization": 5}
+
+
+def test_seed_common_has_no_instance_dict():
+    """SeedCommon is slotted; stray attributes are rejected."""
+    common = SeedCommon(instance_offsets={"tb_organization": 5})
+
+    assert not hasattr(common, "__dict__")
+    with pytest.raises(AttributeError):
+        common.extra = 1  # type: ignore[attr-defined]
+
+
+def test_seed_common_batch_instance_checks():
+    """Batch lookups agree with the per-instance and per-table methods."""
+    common = SeedCommon(instance_offsets={"tb_organization": 5})
+
+    instances = [0, 1, 5, 6, 1001]
+    assert common.is_reserved_bulk("tb_organization", instances) == [
+        common.is_reserved("tb_organization", i) for i in instances
+    ]
+    assert common.is_reserved_bulk("tb_unknown", [1, 2]) == [False, False]
+    assert common.get_instance_starts(["tb_organization", "tb_unknown"]) == {
+        "tb_organization": 1001,
+        "tb_unknown": 1001,
+    }
+
+
 def test_seed_common_get_instance_start():
     """Get starting instance for test data."""
     common = SeedCommon(instance_offsets={"tb_organization": 5})
@@ -315,35 +361,30 @@ INSERT INTO tb_organization (id, identifier, name) VALUES
 # ============================================================================
 
 
-def test_seed_common_fk_validation_valid(db_conn, test_schema):
+def test_seed_common_fk_validation_valid(db_conn, test_schema, exec_ddl):
     """Valid FK references pass validation."""
     from fraiseql_data.introspection import SchemaIntrospector
 
     # Create schema
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_machine (
+            pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-        db_conn.commit()
+        """,
+    )
 
     # Create valid seed common
     data = {
@@ -364,35 +405,30 @@ def test_seed_common_fk_validation_valid(db_conn, test_schema):
     assert errors == []  # No errors
 
 
-def test_seed_common_fk_validation_missing_table(db_conn, test_schema):
+def test_seed_common_fk_validation_missing_table(db_conn, test_schema, exec_ddl):
     """Error when FK references table not in seed common."""
     from fraiseql_data.introspection import SchemaIntrospector
 
     # Create schema
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_machine (
+            pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-        db_conn.commit()
+        """,
+    )
 
     # Seed common missing tb_organization
     data = {
@@ -411,35 +447,30 @@ def test_seed_common_fk_validation_missing_table(db_conn, test_schema):
     assert "not defined in seed common" in errors[0]
 
 
-def test_seed_common_fk_validation_invalid_instance(db_conn, test_schema):
+def test_seed_common_fk_validation_invalid_instance(db_conn, test_schema, exec_ddl):
     """Error when FK value exceeds available instances."""
     from fraiseql_data.introspection import SchemaIntrospector
 
     # Create schema
-    with db_conn.cursor() as cur:
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_organization (
-                pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL
-            )
-        """
+    exec_ddl(
+        f"""
+        CREATE TABLE {test_schema}.tb_organization (
+            pk_organization INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL
         )
-
-        cur.execute(
-            f"""
-            CREATE TABLE {test_schema}.tb_machine (
-                pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-                id UUID NOT NULL UNIQUE,
-                identifier TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
-            )
-        """
+        """,
+        f"""
+        CREATE TABLE {test_schema}.tb_machine (
+            pk_machine INTEGER PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+            id UUID NOT NULL UNIQUE,
+            identifier TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            fk_organization INTEGER NOT NULL REFERENCES {test_schema}.tb_organization(pk_organization)
         )
-        db_conn.commit()
+        """,
+    )
 
     # FK references instance 10, but only 2 orgs exist
     data = {
@@ -480,6 +511,90 @@ def test_seed_common_no_validation_errors_empty():
     assert errors == []
 
 
+def test_seed_common_validation_reports_errors_in_row_order():
+    """Errors across several FK columns are listed row by row, then by FK."""
+    from fraiseql_data.models import ColumnInfo, ForeignKeyInfo, TableInfo
+
+    data = {
+        "tb_org": [{}, {}],
+        "tb_machine": [
+            {"fk_org": 1, "fk_site": 1},
+            {"fk_org": 3, "fk_site": None},
+            {"fk_org": 0, "fk_site": 2},
+        ],
+    }
+    common = SeedCommon(instance_offsets={"tb_org": 2, "tb_machine": 3}, data=data)
+
+    class MockIntrospector:
+        def get_dependency_graph(self):
+            class Graph:
+                def topological_sort(self):
+                    return ["tb_org", "tb_machine"]
+
+            return Graph()
+
+        def get_table_info(self, table):
+            fks = []
+            if table == "tb_machine":
+                fks = [
+                    ForeignKeyInfo("fk_org", "tb_org", "pk_org"),
+                    ForeignKeyInfo("fk_site", "tb_site", "pk_site"),
+                ]
+            return TableInfo(
+                name=table,
+                columns=[ColumnInfo(name="id", pg_type="uuid", is_nullable=False)],
+                foreign_keys=fks,
+            )
+
+    errors = common.validate(MockIntrospector())
+    assert [e.split(":")[0] + " " + e.split("'")[3] for e in errors] == [
+        "Table 'tb_machine' row 1 fk_site",
+        "Table 'tb_machine' row 2 fk_org",
+        "Table 'tb_machine' row 3 fk_org",
+        "Table 'tb_machine' row 3 fk_site",
+    ]
+
+
+def test_seed_common_baseline_validation_skips_introspection():
+    """Baseline-only seed common has no rows to validate, so no schema lookups."""
+    common = SeedCommon(instance_offsets={"tb_organization": 5})
+
+    assert common.validate(introspector=None) == []
+
+
+def test_seed_common_validation_skips_null_fk_values():
+    """A null FK in explicit data is not checked against the referenced range."""
+    from fraiseql_data.models import ColumnInfo, ForeignKeyInfo, TableInfo
+
+    data = {
+        "tb_organization": [{"identifier": "org-1"}],
+        "tb_machine": [{"fk_organization": None}, {"fk_organization": 2}],
+    }
+    common = SeedCommon(instance_offsets={"tb_organization": 1, "tb_machine": 2}, data=data)
+
+    class MockIntrospector:
+        def get_dependency_graph(self):
+            class Graph:
+                def topological_sort(self):
+                    return ["tb_organization", "tb_machine"]
+
+            return Graph()
+
+        def get_table_info(self, table):
+            fks = []
+            if table == "tb_machine":
+                fks = [ForeignKeyInfo("fk_organization", "tb_organization", "pk_organization")]
+            return TableInfo(
+                name=table,
+                columns=[ColumnInfo(name="id", pg_type="uuid", is_nullable=False)],
+                foreign_keys=fks,
+            )
+
+    errors = common.validate(MockIntrospector())
+    assert len(errors) == 1
+    assert "row 2" in errors[0]
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -665,3 +780,141 @@ baseline:
 
             expected_instance = 1001 + i
             assert instance == expected_instance
+
+
+def test_seed_common_file_parse_is_cached_per_file_version(tmp_path):
+    """Reloading an unchanged file reuses the parse; edits are picked up."""
+    from fraiseql_data.seed_common import _parse_config_file
+
+    yaml_path = tmp_path / "seed_common.yaml"
+    yaml_path.write_text("tb_org:\n  - identifier: org-1\n")
+
+    first = SeedCommon.from_yaml(yaml_path)
+    hits = _parse_config_file.cache_info().hits
+    second = SeedCommon.from_yaml(yaml_path)
+    assert _parse_config_file.cache_info().hits == hits + 1
+
+    # Each instance gets its own copy of the rows
+    first.get_data("tb_org")[0]["identifier"] = "changed"
+    assert second.get_data("tb_org")[0]["identifier"] == "org-1"
+
+    yaml_path.write_text("tb_org:\n  - identifier: org-1\n  - identifier: org-2\n")
+    assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 2}
+
+
+def test_parse_seed_sql_many_statements(tmp_path):
+    """Each INSERT block is scanned once; per-table maxima span all blocks."""
+    from fraiseql_data.sql_parser import parse_seed_sql
+
+    statements = [
+        f"INSERT INTO app.tb_{'org' if i % 2 else 'machine'} (id, identifier) VALUES\n"
+        f"  ('2a6f3c21-0000-4000-8000-{i:012d}', 'row-{i}');\n"
+        for i in range(1, 2001)
+    ]
+    sql_file = tmp_path / "01_many.sql"
+    sql_file.write_text("".join(statements))
+
+    assert parse_seed_sql(sql_file) == {"tb_org": 1999, "tb_machine": 2000}
+
+
+def test_parse_seed_sql_short_consecutive_inserts(tmp_path):
+    """An INSERT shorter than any fixed skip distance ends at the next INSERT."""
+    from fraiseql_data.sql_parser import parse_seed_sql
+
+    sql_file = tmp_path / "01_short.sql"
+    sql_file.write_text(
+        "INSERT INTO tb_a VALUES (1);\n"
+        "INSERT INTO tb_b VALUES ('2a6f3c21-0000-4000-8000-000000000004');\n"
+    )
+
+    assert parse_seed_sql(sql_file) == {"tb_b": 4}
+
+
+def test_parse_seed_sql_empty_file(tmp_path):
+    """Empty SQL files (which cannot be memory-mapped) yield no tables."""
+    from fraiseql_data.sql_parser import parse_seed_sql
+
+    sql_file = tmp_path / "00_empty.sql"
+    sql_file.write_text("")
+
+    assert parse_seed_sql(sql_file) == {}
+
+
+def test_seed_common_yaml_loader_stays_safe(tmp_path):
+    """The C loader is the safe variant: Python object tags are rejected."""
+    import yaml
+
+    yaml_path = tmp_path / "seed_common.yaml"
+    yaml_path.write_text("tb_org: !!python/object/apply:os.getcwd []\n")
+
+    with pytest.raises(yaml.YAMLError):
+        SeedCommon.from_yaml(yaml_path)
+
+
+def test_seed_common_yaml_parse_is_persisted_with_cache_dir(tmp_path, monkeypatch):
+    """With FRAISEQL_PARSE_CACHE_DIR, a fresh process reuses the pickled parse."""
+    import yaml
+    from fraiseql_data.seed_common import _parse_config_file
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("FRAISEQL_PARSE_CACHE_DIR", str(cache_dir))
+    yaml_path = tmp_path / "seed_common.yaml"
+    yaml_path.write_text("baseline:\n  tb_org: 3\n")
+
+    assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 3}
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    _parse_config_file.cache_clear()  # as if in a new process
+    with monkeypatch.context() as m:
+        m.setattr(yaml, "load", None)  # the YAML parser must not run
+        assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 3}
+
+    yaml_path.write_text("baseline:\n  tb_org: 4\n  tb_machine: 1\n")
+    assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 4, "tb_machine": 1}
+    assert len(list(cache_dir.glob("*.pkl"))) == 1  # stale version replaced
+
+
+def test_seed_common_yaml_parse_cache_falls_back_when_unreadable(tmp_path, monkeypatch):
+    """A truncated or foreign pickle in the cache dir is ignored and rewritten."""
+    import pickle
+
+    from fraiseql_data.seed_common import _parse_config_file
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("FRAISEQL_PARSE_CACHE_DIR", str(cache_dir))
+    yaml_path = tmp_path / "seed_common.yaml"
+    yaml_path.write_text("baseline:\n  tb_org: 3\n")
+    SeedCommon.from_yaml(yaml_path)
+    (cache_path,) = cache_dir.glob("*.pkl")
+
+    for damaged in (b"\x80\x05\x95", pickle.dumps(Path("/etc"))):
+        cache_path.write_bytes(damaged)
+        _parse_config_file.cache_clear()
+        assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 3}
+        assert list(cache_dir.iterdir()) == [cache_path]  # rewritten, no temp files left
+        assert pickle.loads(cache_path.read_bytes()) == {"baseline": {"tb_org": 3}}
+
+
+def test_seed_common_yaml_parse_cache_skipped_when_unwritable(tmp_path, monkeypatch):
+    """Failing to persist the parse still returns the config and leaves no temp files."""
+    from fraiseql_data.seed_common import _parse_config_file
+
+    yaml_path = tmp_path / "seed_common.yaml"
+    yaml_path.write_text("baseline:\n  tb_org: 3\n")
+
+    not_a_dir = tmp_path / "cache_file"
+    not_a_dir.write_text("")
+    monkeypatch.setenv("FRAISEQL_PARSE_CACHE_DIR", str(not_a_dir))
+    _parse_config_file.cache_clear()
+    assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 3}
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("FRAISEQL_PARSE_CACHE_DIR", str(cache_dir))
+
+    def fail_replace(self, target):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    _parse_config_file.cache_clear()
+    assert SeedCommon.from_yaml(yaml_path).get_instance_offsets() == {"tb_org": 3}
+    assert list(cache_dir.iterdir()) == []
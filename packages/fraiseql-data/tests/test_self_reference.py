@@ -122,3 +122,31 @@ def test_self_reference_hierarchy(db_conn: Connection, test_schema: str):
     with db_conn.cursor() as cur:
         cur.execute(f"DROP TABLE {test_schema}.tb_category CASCADE")
         db_conn.commit()
+
+
+def test_self_reference_every_later_row_gets_an_earlier_parent(
+    db_conn: Connection, test_schema: str
+):
+    """Rows are generated in one pass; parents are drawn from already-inserted rows."""
+    with db_conn.cursor() as cur:
+        cur.execute(
+            f"""
+            CREATE TABLE {test_schema}.tb_category (
+                pk_category INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                id UUID NOT NULL UNIQUE,
+                identifier TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                parent_category INTEGER REFERENCES {test_schema}.tb_category(pk_category)
+            )
+        """
+        )
+        db_conn.commit()
+
+    seeds = SeedBuilder(db_conn, schema=test_schema).add("tb_category", count=20).execute()
+    categories = seeds.tb_category
+
+    assert categories[0].parent_category is None
+    for earlier, cat in enumerate(categories[1:], start=1):
+        earlier_pks = {c.pk_category for c in categories[:earlier]}
+        assert cat.parent_category in earlier_pks
+    assert len({cat.identifier for cat in categories}) == 20
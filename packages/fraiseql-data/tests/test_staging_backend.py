@@ -1,7 +1,8 @@
 """Test staging backend for in-memory seed generation without database."""
 
 from fraiseql_data import SeedBuilder
-from fraiseql_data.models import ColumnInfo, TableInfo
+from fraiseql_data.introspection import MockIntrospector
+from fraiseql_data.models import ColumnInfo, ForeignKeyInfo, TableInfo
 
 
 def test_staging_backend_no_database():
@@ -65,6 +66,25 @@ def test_staging_backend_generates_pks():
     assert pks == list(range(1, 11)), f"Expected [1-10], got {pks}"
 
 
+def test_mock_introspector_caches_dependency_graph():
+    """Dependency graph is reused until another table schema is set."""
+    introspector = MockIntrospector()
+    introspector.set_table_schema("tb_parent", TableInfo(name="tb_parent", columns=[]))
+
+    graph = introspector.get_dependency_graph()
+    assert introspector.get_dependency_graph() is graph
+
+    child = TableInfo(
+        name="tb_child",
+        columns=[],
+        foreign_keys=[ForeignKeyInfo("fk_parent", "tb_parent", "pk_parent")],
+    )
+    introspector.set_table_schema("tb_child", child)
+
+    assert introspector.get_dependency_graph() is not graph
+    assert introspector.topological_sort() == ["tb_parent", "tb_child"]
+
+
 def test_staging_to_database_migration(db_conn, test_schema):
     """Test migrating staging data to actual database via export/import."""
     # Step 1: Generate in staging (no database)
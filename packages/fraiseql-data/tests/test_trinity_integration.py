@@ -307,6 +307,49 @@ class TestTrinityGeneratorContext:
         assert "identifier" in result
         assert "pk_tb_test" not in result
 
+    def test_trinity_generator_identifier_slug(self):
+        """Identifiers are lowercased with spaces and underscores as dashes."""
+        from fraiseql_data.generators import TrinityGenerator
+        from fraiseql_uuid import Pattern
+
+        gen = TrinityGenerator(Pattern(), "tb_test")
+
+        assert gen.generate(3, name="Acme Corp_EU")["identifier"] == "acme-corp-eu-3"
+        assert gen.generate(4, name="Élan Vital")["identifier"] == "élan-vital-4"
+
+    def test_trinity_generator_uses_slots(self):
+        """TrinityGenerator instances carry no per-instance __dict__."""
+        from fraiseql_data.generators import TrinityGenerator
+        from fraiseql_uuid import Pattern
+
+        gen = TrinityGenerator(Pattern(), "tb_test")
+
+        assert not hasattr(gen, "__dict__")
+
+    def test_trinity_generator_batch_matches_generate(self):
+        """generate_batch yields the same rows as per-instance generate calls."""
+        from fraiseql_data.generators import TrinityGenerator
+        from fraiseql_uuid import Pattern
+
+        gen = TrinityGenerator(Pattern(), "tb_test")
+        names = ["Acme", None, "Big Co"]
+
+        batch = gen.generate_batch(5, 3, names)
+
+        assert batch == [gen.generate(5 + i, name=name) for i, name in enumerate(names)]
+        assert batch[1]["identifier"] == "tb_test_0006"
+
+    def test_trinity_generator_tuple_matches_generate(self):
+        """generate_tuple returns the same id and identifier as generate."""
+        from fraiseql_data.generators import TrinityGenerator
+        from fraiseql_uuid import Pattern
+
+        gen = TrinityGenerator(Pattern(), "tb_test")
+
+        for name in ("Acme Corp", None):
+            row = gen.generate(7, name=name)
+            assert gen.generate_tuple(7, name) == (row["id"], row["identifier"])
+
 
 @pytest.mark.integration
 class TestTrinityDirectBackendIntegration:
@@ -2,16 +2,39 @@
 
 import json
 import logging
+import subprocess
+import sys
 import uuid
 from datetime import time, timedelta
 from ipaddress import IPv4Address, IPv4Network
+from unittest.mock import patch
 
 import pytest
 from fraiseql_data import SeedBuilder
+from fraiseql_data.generators import faker_generator
 from fraiseql_data.generators.faker_generator import FakerGenerator
 from fraiseql_data.models import ColumnInfo, TableInfo
 
 
+class TestLazyFaker:
+    """Faker is only loaded once a pooled value is actually needed."""
+
+    def test_import_does_not_load_faker(self):
+        code = "import sys, fraiseql_data; assert 'faker' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_pooled_column_loads_faker(self):
+        gen = FakerGenerator()
+        value = gen.generate("email", "text")
+        assert "@" in value
+
+    def test_faker_skips_weighted_sampling(self, monkeypatch):
+        monkeypatch.setattr(faker_generator, "_fake", None)
+        with patch("faker.Faker") as faker_cls:
+            faker_generator._get_fake()
+        faker_cls.assert_called_once_with(use_weighting=False)
+
+
 class TestUUIDGeneration:
     """UUID columns generate valid UUIDs."""
 
@@ -29,6 +52,16 @@ class TestUUIDGeneration:
         assert isinstance(str(value), str)
         uuid.UUID(str(value))  # Should not raise
 
+    def test_uuid_values_unique_across_pool_refills(self):
+        gen = FakerGenerator()
+        values = [gen.generate("some_col", "uuid") for _ in range(1200)]
+        assert len(set(values)) == len(values)
+        for value in values:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == value
+
 
 class TestJSONGeneration:
     """JSON/JSONB columns generate valid JSON."""
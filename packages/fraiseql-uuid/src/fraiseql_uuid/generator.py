@@ -42,4 +42,6 @@ class UUIDGenerator:
         Returns:
             List of generated UUIDs
         """
-        return [self.generate(start_instance + i, **kwargs) for i in range(count)]
+        params = {**self.defaults, **kwargs}
+        params.pop("instance", None)
+        return self.pattern.generate_batch(count, start_instance, **params)
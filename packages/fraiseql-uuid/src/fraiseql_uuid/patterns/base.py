@@ -36,6 +36,25 @@ class Pattern(ABC):
         """
         pass
 
+    def generate_batch(self, count: int, start_instance: int = 1, **kwargs: Any) -> list[str]:
+        """Generate UUIDs for consecutive instance numbers.
+
+        Subclasses may override this with a faster equivalent of calling
+        generate() once per instance.
+
+        Args:
+            count: Number of UUIDs to generate
+            start_instance: Starting instance number
+            **kwargs: Pattern-specific components shared by every UUID
+
+        Returns:
+            List of generated UUID strings
+        """
+        return [
+            self.generate(**kwargs, instance=instance)
+            for instance in range(start_instance, start_instance + count)
+        ]
+
     @abstractmethod
     def decode(self, uuid: str) -> UUIDComponents:
         """Decode UUID into components.
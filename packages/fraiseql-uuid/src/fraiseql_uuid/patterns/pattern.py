@@ -50,6 +50,38 @@ class Pattern(BasePattern):
             >>> pattern.generate(table_code="012345", instance=1)
             '01234521-0000-4000-8000-000000000001'
         """
+        # Segment 5: {inst:12}
+        instance = str(kwargs["instance"]).zfill(12)
+
+        return f"{self._prefix(**kwargs)}{instance}"
+
+    def generate_batch(self, count: int, start_instance: int = 1, **kwargs: Any) -> list[str]:
+        """Generate UUIDs for consecutive instance numbers.
+
+        The fixed segments are formatted once; only the instance segment
+        varies per UUID.
+
+        Args:
+            count: Number of UUIDs to generate
+            start_instance: Starting instance number
+            **kwargs: Same components as generate(), minus instance
+
+        Returns:
+            List of UUID v4 compliant strings
+
+        Example:
+            >>> pattern.generate_batch(2, table_code="012345")
+            ['01234521-0000-4000-8000-000000000001', '01234521-0000-4000-8000-000000000002']
+        """
+        prefix = self._prefix(**kwargs)
+        return [
+            f"{prefix}{str(instance).zfill(12)}"
+            for instance in range(start_instance, start_instance + count)
+        ]
+
+    @staticmethod
+    def _prefix(**kwargs: Any) -> str:
+        """Format every segment except the instance, including the trailing dash."""
         # Segment 1: {table:6}{type:2}
         table_code = str(kwargs["table_code"]).zfill(6)
         seed_dir = str(kwargs.get("seed_dir", 21)).zfill(2)
@@ -67,11 +99,7 @@ class Pattern(BasePattern):
         test_case = str(kwargs.get("test_case", 0)).zfill(2)
         part4 = f"8{scenario[3]}{test_case}"
 
-        # Segment 5: {inst:12}
-        instance = str(kwargs["instance"]).zfill(12)
-        part5 = instance
-
-        return f"{part1}-{part2}-{part3}-{part4}-{part5}"
+        return f"{part1}-{part2}-{part3}-{part4}-"
 
     def decode(self, uuid: str) -> UUIDComponents:
         """Decode UUID v4 compliant UUID with encoded metadata.
@@ -109,6 +109,24 @@ class TestPatternGenerate:
             pattern.generate(table_code="012345")
 
 
+class TestPatternGenerateBatch:
+    """Tests for Pattern.generate_batch()."""
+
+    def test_generate_batch_matches_generate(self) -> None:
+        """Test that batch output equals per-instance generate() calls."""
+        pattern = Pattern()
+        params = {"table_code": "a1b2c3", "seed_dir": 22, "scenario": 1234, "test_case": 15}
+
+        batch = pattern.generate_batch(3, start_instance=998, **params)
+
+        assert batch == [pattern.generate(**params, instance=i) for i in (998, 999, 1000)]
+        assert batch[0] == "a1b2c322-0000-4123-8415-000000000998"
+
+    def test_generate_batch_empty(self) -> None:
+        """Test that a zero count yields no UUIDs."""
+        assert Pattern().generate_batch(0, table_code="012345") == []
+
+
 class TestPatternDecode:
     """Tests for Pattern.decode()."""
 